@@ -0,0 +1,106 @@
+"""
+账号信息启动加载基准测试
+
+在临时配置目录中生成带账号信息的实例，比较启动时两种加载方式的耗时：
+    全部解密: 原来的load_config，每个实例解密全部6个字段
+    按需解密: load_config只读取密文，只解密首屏可见的账号
+
+用法:
+    python benchmarks/bench_account_decrypt.py --accounts 2000 --visible 12
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chrome_manager.database_manager import DatabaseManager, ACCOUNT_FIELDS
+from chrome_manager.account_store import AccountStore
+from chrome_manager.persistence import ChangeSet
+
+
+def build_database(config_dir, account_count):
+    """生成带账号信息的实例"""
+    changes = ChangeSet()
+    for i in range(1, account_count + 1):
+        name = f"Chrome实例{i}"
+        changes.upsert_instances.append({"name": name, "data_dir": f"/data/Profile{i}"})
+        changes.upsert_accounts[name] = {field: f"{field}-{i}-0x{i:040x}" for field in ACCOUNT_FIELDS}
+
+    db = DatabaseManager(config_dir)
+    if not db.apply_changes(changes):
+        raise RuntimeError("生成测试数据失败")
+    db.close()
+
+
+def load_eager(config_dir):
+    """原来的启动加载：读取配置后解密所有账号"""
+    db = DatabaseManager(config_dir, read_only=True)
+    config = db.load_config()
+    config["account_info"] = db.get_all_account_info()
+    db.close()
+    return len(config["account_info"])
+
+
+def load_lazy(config_dir, visible):
+    """按需解密：只读取密文，解密首屏可见的账号"""
+    db = DatabaseManager(config_dir, read_only=True)
+    config = db.load_config()
+    store = AccountStore(db)
+    store.load()
+    for shortcut in config["shortcuts"][:visible]:
+        store.get(shortcut["name"])
+    db.close()
+    return store.decrypt_count
+
+
+def run_timed(func, *args, repeat=3):
+    """运行多次取最短耗时"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="账号信息启动加载基准测试")
+    parser.add_argument("--accounts", type=int, default=2000, help="账号数量")
+    parser.add_argument("--visible", type=int, default=12, help="首屏可见的账号数")
+    parser.add_argument("--repeat", type=int, default=3, help="每种方式运行次数")
+    args = parser.parse_args()
+
+    config_dir = tempfile.mkdtemp(prefix="bench_accounts_")
+    try:
+        print(f"生成{args.accounts}个账号...")
+        build_database(config_dir, args.accounts)
+
+        # 数据库输出较多，测量时屏蔽打印
+        devnull = open(os.devnull, "w")
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            eager_time, eager_count = run_timed(load_eager, config_dir, repeat=args.repeat)
+            lazy_time, lazy_count = run_timed(load_lazy, config_dir, args.visible, repeat=args.repeat)
+        finally:
+            sys.stdout = stdout
+            devnull.close()
+
+        print(f"{'方式':<12}{'耗时(秒)':>12}{'解密账号数':>12}")
+        print(f"{'全部解密':<12}{eager_time:>12.3f}{eager_count:>12}")
+        print(f"{'按需解密':<12}{lazy_time:>12.3f}{lazy_count:>12}")
+        if lazy_time > 0:
+            print(f"加速比: {eager_time / lazy_time:.1f}x")
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
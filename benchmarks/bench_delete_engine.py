@@ -0,0 +1,149 @@
+"""
+目录删除引擎基准测试
+
+在临时目录中生成一个合成的Chrome配置目录树（默认3万个文件，分布在缓存、
+代码缓存、IndexedDB等子目录中），分别用旧的分批删除方法、shutil.rmtree
+和DirectoryDeleter删除并比较耗时。
+
+用法:
+    python benchmarks/bench_delete_engine.py --files 30000 --rounds 3
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chrome_manager.delete_engine import DirectoryDeleter
+
+# 合成配置目录的子目录及其文件占比，大致模拟真实Chrome配置的分布
+PROFILE_LAYOUT = [
+    (("Default", "Cache", "Cache_Data"), 0.45),
+    (("Default", "Code Cache", "js"), 0.25),
+    (("Default", "Code Cache", "wasm"), 0.05),
+    (("Default", "IndexedDB", "https_example.com_0.indexeddb.leveldb"), 0.08),
+    (("Default", "Service Worker", "CacheStorage"), 0.10),
+    (("Default", "Local Storage", "leveldb"), 0.02),
+    (("GrShaderCache",), 0.03),
+    (("ShaderCache",), 0.02),
+]
+
+# 缓存目录下每个子目录最多存放的文件数
+FILES_PER_SUBDIR = 500
+
+
+def build_profile_tree(root, file_count, file_size):
+    """生成合成配置目录树"""
+    payload = b"x" * file_size
+    created = 0
+    for parts, share in PROFILE_LAYOUT:
+        count = max(1, int(file_count * share))
+        base = os.path.join(root, *parts)
+        for i in range(count):
+            subdir = os.path.join(base, f"{i // FILES_PER_SUBDIR:02x}")
+            if i % FILES_PER_SUBDIR == 0:
+                os.makedirs(subdir, exist_ok=True)
+            with open(os.path.join(subdir, f"f_{i:06x}"), "wb") as f:
+                f.write(payload)
+            created += 1
+    return created
+
+
+def legacy_delete(directory):
+    """旧实现的复刻：两次os.walk，串行删除并逐项isfile/isdir，分批暂停"""
+    file_count = 0
+    for _, _, files in os.walk(directory):
+        file_count += len(files)
+        if file_count > 20:
+            break
+    if file_count <= 20:
+        shutil.rmtree(directory)
+        return
+
+    all_items = []
+    for root, dirs, files in os.walk(directory, topdown=False):
+        for name in files:
+            all_items.append(os.path.join(root, name))
+        for name in dirs:
+            all_items.append(os.path.join(root, name))
+    all_items.append(directory)
+
+    batch_size = 20
+    total_batches = (len(all_items) + batch_size - 1) // batch_size
+    progress_step = max(1, total_batches // 5)
+    for i in range(0, len(all_items), batch_size):
+        batch_num = i // batch_size + 1
+        for item in all_items[i:i + batch_size]:
+            try:
+                if os.path.isfile(item):
+                    os.unlink(item)
+                elif os.path.isdir(item):
+                    try:
+                        os.rmdir(item)
+                    except OSError:
+                        pass
+            except Exception:
+                pass
+        if batch_num % progress_step == 0:
+            time.sleep(0.05)
+
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+
+
+def engine_delete(directory, workers):
+    """使用DirectoryDeleter删除"""
+    result = DirectoryDeleter(max_workers=workers).delete(directory)
+    if not result.success:
+        raise RuntimeError(f"删除不完整: {result}")
+    return result
+
+
+def run_benchmark(file_count, file_size, rounds, workers):
+    """执行基准测试并打印结果"""
+    methods = [
+        ("旧实现(分批串行)", legacy_delete),
+        ("shutil.rmtree", shutil.rmtree),
+        ("DirectoryDeleter(1线程)", lambda d: engine_delete(d, 1)),
+        (f"DirectoryDeleter({workers}线程)", lambda d: engine_delete(d, workers)),
+    ]
+
+    work_dir = tempfile.mkdtemp(prefix="bench_delete_")
+    try:
+        results = {name: [] for name, _ in methods}
+        for round_index in range(rounds):
+            for name, method in methods:
+                profile_dir = os.path.join(work_dir, f"Profile{round_index}")
+                created = build_profile_tree(profile_dir, file_count, file_size)
+                start = time.perf_counter()
+                method(profile_dir)
+                results[name].append(time.perf_counter() - start)
+                if os.path.exists(profile_dir):
+                    raise RuntimeError(f"{name} 未能删除目录")
+
+        print(f"合成配置目录: {created}个文件, 每个{file_size}字节, {rounds}轮")
+        baseline = min(results[methods[0][0]])
+        for name, _ in methods:
+            best = min(results[name])
+            print(f"  {name:<24} 最快 {best * 1000:8.1f}ms  "
+                  f"({created / best:9.0f} 文件/秒, 相对旧实现 {baseline / best:5.1f}x)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="目录删除引擎基准测试")
+    parser.add_argument("--files", type=int, default=30000, help="合成目录中的文件数")
+    parser.add_argument("--file-size", type=int, default=512, help="每个文件的大小（字节）")
+    parser.add_argument("--rounds", type=int, default=3, help="测试轮数")
+    parser.add_argument("--workers", type=int, default=8, help="删除引擎的线程数")
+    args = parser.parse_args()
+    run_benchmark(args.files, args.file_size, args.rounds, args.workers)
+
+
+if __name__ == "__main__":
+    main()
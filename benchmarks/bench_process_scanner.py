@@ -0,0 +1,118 @@
+"""
+进程扫描后端基准测试
+
+在临时目录中生成一个合成的procfs进程表（大量普通进程加上若干Chrome实例），
+分别用psutil后端和procfs后端建立进程索引并比较耗时。仅支持Linux。
+
+用法:
+    python benchmarks/bench_process_scanner.py --processes 5000 --instances 50
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+
+from chrome_manager.process_index import (
+    ProcessIndex, PsutilProcessScanner, ProcfsProcessScanner
+)
+
+# 每个Chrome实例的子进程数（渲染、GPU、工具进程等）
+CHILDREN_PER_INSTANCE = 8
+
+
+def _write_process(proc_root, pid, name, cmdline, ppid=1, start_time=100):
+    """在合成procfs中写入一个进程"""
+    pid_dir = os.path.join(proc_root, str(pid))
+    os.makedirs(pid_dir)
+    # stat中')'之后至少需要40个字段，第20个为启动时间
+    fields = ["S", str(ppid)] + ["0"] * 48
+    fields[19] = str(start_time)
+    with open(os.path.join(pid_dir, "stat"), "w") as f:
+        f.write(f"{pid} ({name}) {' '.join(fields)}\n")
+    with open(os.path.join(pid_dir, "comm"), "w") as f:
+        f.write(name + "\n")
+    with open(os.path.join(pid_dir, "cmdline"), "wb") as f:
+        f.write(b"\0".join(arg.encode() for arg in cmdline) + b"\0")
+
+
+def build_fake_procfs(proc_root, process_count, instance_count):
+    """生成合成进程表，返回Chrome进程数量"""
+    with open(os.path.join(proc_root, "stat"), "w") as f:
+        f.write("cpu 0 0 0 0 0 0 0 0 0 0\nbtime 1700000000\n")
+    os.makedirs(os.path.join(proc_root, "self"))
+
+    pid = 100
+    chrome_count = 0
+    for i in range(instance_count):
+        data_dir = f"/home/user/chrome-data/Profile{i + 1}"
+        browser_pid = pid
+        _write_process(proc_root, pid, "chrome", ["/opt/google/chrome/chrome", f"--user-data-dir={data_dir}"])
+        pid += 1
+        for child in range(CHILDREN_PER_INSTANCE):
+            _write_process(
+                proc_root, pid, "chrome",
+                ["/opt/google/chrome/chrome", "--type=renderer", f"--user-data-dir={data_dir}",
+                 f"--renderer-client-id={child}", "--enable-features=" + "X" * 200],
+                ppid=browser_pid,
+            )
+            pid += 1
+        chrome_count += 1 + CHILDREN_PER_INSTANCE
+
+    while pid - 100 < process_count:
+        _write_process(proc_root, pid, f"worker{pid % 50}", [f"/usr/bin/worker{pid % 50}", "--serve"])
+        pid += 1
+    return chrome_count
+
+
+def measure(label, index, rounds):
+    """测量一次冷启动刷新和多次稳定状态刷新"""
+    start = time.perf_counter()
+    snapshot = index.refresh()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        index.refresh()
+    warm = (time.perf_counter() - start) / rounds
+
+    print(f"{label:<10} 冷启动: {cold * 1000:8.1f} ms   稳定刷新: {warm * 1000:8.1f} ms   实例数: {len(snapshot)}")
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较psutil与procfs进程扫描后端")
+    parser.add_argument("--processes", type=int, default=5000, help="合成进程表中的进程总数")
+    parser.add_argument("--instances", type=int, default=50, help="Chrome实例数量")
+    parser.add_argument("--rounds", type=int, default=5, help="稳定状态刷新的测量轮数")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("procfs后端仅支持Linux，跳过基准测试")
+        return
+
+    proc_root = tempfile.mkdtemp(prefix="fake_procfs_")
+    original_procfs = psutil.PROCFS_PATH
+    try:
+        chrome_count = build_fake_procfs(proc_root, args.processes, args.instances)
+        print(f"合成进程表: {args.processes}个进程, 其中{chrome_count}个Chrome进程, {args.instances}个实例\n")
+
+        # 让psutil读取同一份合成进程表
+        psutil.PROCFS_PATH = proc_root
+        _, psutil_warm = measure("psutil", ProcessIndex(scanner=PsutilProcessScanner()), args.rounds)
+        _, procfs_warm = measure("procfs", ProcessIndex(scanner=ProcfsProcessScanner(proc_root)), args.rounds)
+
+        print(f"\n稳定刷新加速比: {psutil_warm / procfs_warm:.1f}x")
+    finally:
+        psutil.PROCFS_PATH = original_procfs
+        shutil.rmtree(proc_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+控件样式基准测试
+
+按旧版BrowserCard的控件结构构建一批卡片（卡片框、选择框、删除按钮、状态标签、
+图标、名称、资源占用标签和启动按钮），比较两种样式方式的构建耗时：
+    逐控件样式：每个控件各自调用setStyleSheet，样式字符串取自改动前的代码
+    应用样式表：启动时设置一次build_stylesheet()生成的样式表，控件只设置
+                objectName和动态属性
+卡片全部显示并处理完事件后才停止计时，样式解析和polish都包含在内。
+另外测量切换运行状态的耗时：旧方式重新调用setStyleSheet，新方式修改动态属性。
+
+主页的卡片现在由委托直接绘制，这里的卡片结构只用于比较两种样式方式本身。
+
+用法:
+    python benchmarks/bench_widget_styles.py --cards 300 --rounds 3
+"""
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QFrame, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QLabel, QCheckBox, QPushButton
+)
+from PyQt6.QtCore import Qt
+
+from chrome_manager.constants import (
+    PRIMARY_COLOR, SUCCESS_COLOR, SURFACE_COLOR, TEXT_HINT_COLOR
+)
+from chrome_manager.ui.components import ModernButton
+from chrome_manager.ui.theme import build_stylesheet, set_style_property
+
+# 改动前卡片中各控件的样式
+LEGACY_CARD_STYLE = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 10px;
+    }
+"""
+LEGACY_CHECKBOX_STYLE = """
+    QCheckBox {
+        background-color: transparent;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #E0E0E0;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #4285F4;
+        border-radius: 3px;
+        background-color: #4285F4;
+    }
+"""
+LEGACY_DELETE_STYLE = """
+    QPushButton {
+        background-color: #F2F2F2;
+        color: #666666;
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        border-radius: 10px;
+        text-align: center;
+        padding: 0px;
+    }
+    QPushButton:hover {
+        background-color: #FF5252;
+        color: white;
+    }
+"""
+LEGACY_NAME_STYLE = """
+    color: #333333;
+    font-size: 13px;
+    font-weight: 500;
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    margin: 0;
+"""
+LEGACY_USAGE_STYLE = f"""
+    color: {TEXT_HINT_COLOR};
+    font-size: 11px;
+    background-color: transparent;
+    border: none;
+"""
+LEGACY_ACCENT_STYLE = f"""
+    QPushButton {{
+        background-color: {PRIMARY_COLOR};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+    }}
+    QPushButton:hover {{
+        background-color: #1C75E5;
+    }}
+    QPushButton:pressed {{
+        background-color: #1567D3;
+    }}
+    QPushButton:disabled {{
+        background-color: {SURFACE_COLOR};
+        color: {TEXT_HINT_COLOR};
+    }}
+"""
+
+
+def legacy_status_style(running):
+    color = SUCCESS_COLOR if running else TEXT_HINT_COLOR
+    return f"""
+        color: {color};
+        font-size: 11px;
+        background-color: transparent;
+        border: none;
+    """
+
+
+# 同样的卡片样式改写为应用样式表中的规则
+THEMED_CARD_RULES = f"""
+    QFrame#benchCard {{
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 10px;
+    }}
+    QFrame#benchCard QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+    }}
+    QFrame#benchCard QCheckBox::indicator:unchecked {{
+        border: 2px solid #E0E0E0;
+        border-radius: 3px;
+        background-color: white;
+    }}
+    QFrame#benchCard QCheckBox::indicator:checked {{
+        border: 2px solid #4285F4;
+        border-radius: 3px;
+        background-color: #4285F4;
+    }}
+    QPushButton#benchDelete {{
+        background-color: #F2F2F2;
+        color: #666666;
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        border-radius: 10px;
+        padding: 0px;
+    }}
+    QPushButton#benchDelete:hover {{
+        background-color: #FF5252;
+        color: white;
+    }}
+    QFrame#benchCard QLabel {{
+        background-color: transparent;
+        border: none;
+    }}
+    QLabel#benchName {{
+        color: #333333;
+        font-size: 13px;
+        font-weight: 500;
+    }}
+    QLabel#benchStatus, QLabel#benchUsage {{
+        color: {TEXT_HINT_COLOR};
+        font-size: 11px;
+    }}
+    QLabel#benchStatus[running="true"] {{
+        color: {SUCCESS_COLOR};
+    }}
+"""
+
+
+def build_card(index, themed):
+    """按旧版BrowserCard的结构构建一张卡片，返回卡片和状态标签"""
+    card = QFrame()
+    card.setFixedSize(180, 180)
+    layout = QVBoxLayout(card)
+    layout.setContentsMargins(10, 10, 10, 10)
+    layout.setSpacing(5)
+
+    top_layout = QHBoxLayout()
+    top_layout.setContentsMargins(0, 0, 0, 0)
+    checkbox = QCheckBox()
+    checkbox.setVisible(False)
+    delete_btn = QPushButton("×")
+    delete_btn.setFixedSize(20, 20)
+    status_label = QLabel("○ 未运行")
+    status_label.setFixedHeight(20)
+    icon_label = QLabel()
+    icon_label.setFixedSize(48, 48)
+    name_label = QLabel(f"实例{index}")
+    name_label.setFixedHeight(20)
+    name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    usage_label = QLabel("CPU 0.0% · 内存 0MB")
+    usage_label.setFixedHeight(16)
+    usage_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    if themed:
+        card.setObjectName("benchCard")
+        delete_btn.setObjectName("benchDelete")
+        status_label.setObjectName("benchStatus")
+        name_label.setObjectName("benchName")
+        usage_label.setObjectName("benchUsage")
+        launch_btn = ModernButton("启动", accent=True)
+    else:
+        card.setStyleSheet(LEGACY_CARD_STYLE)
+        checkbox.setStyleSheet(LEGACY_CHECKBOX_STYLE)
+        delete_btn.setStyleSheet(LEGACY_DELETE_STYLE)
+        status_label.setStyleSheet(legacy_status_style(False))
+        name_label.setStyleSheet(LEGACY_NAME_STYLE)
+        usage_label.setStyleSheet(LEGACY_USAGE_STYLE)
+        launch_btn = QPushButton("启动")
+        launch_btn.setStyleSheet(LEGACY_ACCENT_STYLE)
+    launch_btn.setFixedHeight(32)
+
+    top_layout.addWidget(checkbox)
+    top_layout.addWidget(status_label)
+    top_layout.addStretch()
+    top_layout.addWidget(delete_btn)
+    layout.addLayout(top_layout)
+    layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignCenter)
+    layout.addWidget(name_label)
+    layout.addWidget(usage_label)
+    layout.addStretch()
+    layout.addWidget(launch_btn)
+    return card, status_label
+
+
+def run(app, cards, themed):
+    """
+    构建并显示一批卡片，再把所有卡片切换一次运行状态
+
+    Returns:
+        tuple: (构建耗时, 切换状态耗时)，单位秒
+    """
+    app.setStyleSheet(build_stylesheet() + THEMED_CARD_RULES if themed else "")
+    app.processEvents()
+
+    start = time.perf_counter()
+    container = QWidget()
+    grid = QGridLayout(container)
+    status_labels = []
+    for i in range(cards):
+        card, status_label = build_card(i, themed)
+        grid.addWidget(card, i // 5, i % 5)
+        status_labels.append(status_label)
+    container.show()
+    app.processEvents()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for label in status_labels:
+        label.setText("● 运行中")
+        if themed:
+            set_style_property(label, "running", True)
+        else:
+            label.setStyleSheet(legacy_status_style(True))
+    app.processEvents()
+    toggle_time = time.perf_counter() - start
+
+    container.close()
+    container.deleteLater()
+    app.processEvents()
+    return build_time, toggle_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="控件样式基准测试")
+    parser.add_argument("--cards", type=int, default=300, help="卡片数量")
+    parser.add_argument("--rounds", type=int, default=3, help="重复次数，取最快的一次")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = {}
+    for themed in (False, True):
+        rounds = [run(app, args.cards, themed) for _ in range(args.rounds)]
+        results[themed] = (min(r[0] for r in rounds), min(r[1] for r in rounds))
+
+    legacy, themed = results[False], results[True]
+    print(f"{args.cards}张卡片，每种方式{args.rounds}轮取最快")
+    print(f"{'方式':<12}{'构建(秒)':>12}{'切换状态(秒)':>14}")
+    print(f"{'逐控件样式':<12}{legacy[0]:>12.3f}{legacy[1]:>14.3f}")
+    print(f"{'应用样式表':<12}{themed[0]:>12.3f}{themed[1]:>14.3f}")
+    if themed[0] > 0:
+        print(f"构建加速比: {legacy[0] / themed[0]:.1f}x")
+    if themed[1] > 0:
+        print(f"切换状态加速比: {legacy[1] / themed[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+"""
+实例和账号信息的批量导入导出模块
+
+支持CSV和JSONL两种文件格式，逐行读取和写出，加解密在线程池中并行执行，
+按批次在短事务中写入数据库，内存占用与文件大小无关。
+
+命令行用法:
+    python -m chrome_manager.account_io import accounts.csv
+    python -m chrome_manager.account_io export accounts.jsonl --config-dir D:\\ChromeShortcuts
+"""
+
+import os
+import csv
+import sys
+import json
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .database_manager import DatabaseManager, ACCOUNT_FIELDS
+from .account_store import normalize_account
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+# CSV列：实例名称、数据目录、各账号字段，其余字段以JSON对象保存在extra列
+CSV_COLUMNS = ("name", "data_dir") + ACCOUNT_FIELDS + ("extra",)
+
+DEFAULT_CHUNK_SIZE = 500  # 每个事务写入的记录数
+MAX_REPORTED_SKIPS = 100  # 结果中保留的跳过原因条数，避免大文件出错时占用过多内存
+
+
+def detect_format(path):
+    """根据扩展名判断文件格式，.jsonl/.ndjson/.json为JSONL，其余为CSV"""
+    ext = os.path.splitext(path)[1].lower()
+    return FORMAT_JSONL if ext in (".jsonl", ".ndjson", ".json") else FORMAT_CSV
+
+
+def default_config_dir():
+    """程序使用的配置目录"""
+    return os.path.join(os.getenv("APPDATA") or os.path.expanduser("~"), "ChromeShortcuts")
+
+
+def default_workers():
+    """加解密线程数"""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class TransferResult:
+    """一次导入或导出的结果"""
+
+    def __init__(self):
+        self.processed = 0  # 已读取的记录数
+        self.imported = 0  # 导入或导出的记录数
+        self.created = []  # 导入时新建的实例 [(实例名称, 数据目录)]
+        self.skipped = []  # 跳过的记录 [(行号或实例名称, 原因)]，最多保留MAX_REPORTED_SKIPS条
+        self.skipped_count = 0
+        self.cancelled = False
+        self.error = None  # 出错时的错误信息
+
+    def skip(self, where, reason):
+        """记录一条被跳过的记录"""
+        self.skipped_count += 1
+        if len(self.skipped) < MAX_REPORTED_SKIPS:
+            self.skipped.append((where, reason))
+
+    def summary(self):
+        """结果的简短描述"""
+        if self.error:
+            return f"出错: {self.error}"
+        text = f"处理 {self.processed} 条，成功 {self.imported} 条"
+        if self.created:
+            text += f"，新建实例 {len(self.created)} 个"
+        if self.skipped_count:
+            text += f"，跳过 {self.skipped_count} 条"
+        if self.cancelled:
+            text += "（已取消）"
+        return text
+
+
+def _iter_records(path, file_format, on_position):
+    """
+    逐行读取文件中的记录，不把整个文件读入内存
+
+    Args:
+        path: 文件路径
+        file_format: FORMAT_CSV或FORMAT_JSONL
+        on_position: 每读取一条记录后以已读取的字节数调用，用于计算进度
+
+    Yields:
+        tuple: (行号, 记录字典或None, 错误信息)
+    """
+    # utf-8-sig兼容Excel保存的带BOM的CSV
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if file_format == FORMAT_CSV:
+            reader = csv.DictReader(f)
+            for row in reader:
+                on_position(f.buffer.tell())
+                record = {key: value for key, value in row.items() if key and value}
+                extra = record.pop("extra", None)
+                if extra:
+                    try:
+                        extra = json.loads(extra)
+                    except ValueError:
+                        yield reader.line_num, None, "extra列不是有效的JSON"
+                        continue
+                    if isinstance(extra, dict):
+                        record = {**extra, **record}
+                yield reader.line_num, record, None
+        else:
+            for line_num, line in enumerate(f, 1):
+                on_position(f.buffer.tell())
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield line_num, None, "不是有效的JSON"
+                    continue
+                if not isinstance(record, dict):
+                    yield line_num, None, "不是JSON对象"
+                    continue
+                yield line_num, record, None
+
+
+def _split_record(record, data_root):
+    """
+    把文件中的一条记录拆分为实例名称、数据目录和账号信息
+
+    Returns:
+        tuple: (实例名称, 数据目录或None, 账号信息或None)；记录中没有任何账号字段时账号信息为None
+    """
+    name = str(record.get("name") or "").strip()
+    data_dir = str(record.get("data_dir") or "").strip() or None
+    if data_dir and data_root and not os.path.isabs(data_dir):
+        data_dir = os.path.join(data_root, data_dir)
+
+    account = {key: str(value) for key, value in record.items()
+               if key not in ("name", "data_dir") and value not in (None, "")}
+    return name, data_dir, (normalize_account(account) if account else None)
+
+
+class AccountImporter:
+    """
+    流式导入实例和账号信息
+
+    记录按chunk_size分批：一批在线程池中加密的同时，上一批在一个事务中写入数据库。
+    已存在的实例只更新账号信息，不存在的实例在记录带有数据目录时新建，并创建数据目录。
+    取消或出错时已提交的批次保留在数据库中。
+    """
+
+    def __init__(self, db_manager, run_write=None, max_workers=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, data_root=None,
+                 progress_callback=None, cancel_event=None):
+        """
+        初始化导入器
+
+        Args:
+            db_manager: 用于加密的DatabaseManager；run_write为None时也用它写入（须为可写连接）
+            run_write: 执行写操作的函数，参数为func(db_manager)，如DatabaseWriter.call
+            max_workers: 加密线程数
+            chunk_size: 每个事务写入的记录数
+            data_root: 相对数据目录的根目录
+            progress_callback: 以(已处理记录数, 已读取字节数, 文件总字节数)调用
+            cancel_event: threading.Event，被设置后在当前批次写完后停止
+        """
+        self.db_manager = db_manager
+        self.run_write = run_write or (lambda func: func(db_manager))
+        self.max_workers = max_workers or default_workers()
+        self.chunk_size = chunk_size
+        self.data_root = data_root
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+
+    def run(self, path, file_format=None):
+        """
+        导入文件
+
+        Returns:
+            TransferResult: 导入结果
+        """
+        result = TransferResult()
+        file_format = file_format or detect_format(path)
+        try:
+            total_bytes = os.path.getsize(path)
+        except OSError as e:
+            result.error = str(e)
+            return result
+
+        position = [0]
+
+        def on_position(pos):
+            position[0] = pos
+
+        chunk = []
+        pending = None  # (记录列表, 加密任务列表)，写入时才等待加密结果
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="account_encrypt") as pool:
+                for line_num, record, error in _iter_records(path, file_format, on_position):
+                    result.processed += 1
+                    if error:
+                        result.skip(line_num, error)
+                        continue
+                    name, data_dir, account = _split_record(record, self.data_root)
+                    if not name:
+                        result.skip(line_num, "缺少实例名称")
+                        continue
+                    chunk.append((name, data_dir, account))
+
+                    if len(chunk) >= self.chunk_size:
+                        encrypting = self._encrypt_chunk(pool, chunk)
+                        if pending:
+                            self._write_chunk(pending, result)
+                        pending, chunk = encrypting, []
+                        self._report(result, position[0], total_bytes)
+                        if self.cancel_event.is_set():
+                            result.cancelled = True
+                            break
+
+                if chunk and not result.cancelled:
+                    encrypting = self._encrypt_chunk(pool, chunk)
+                    if pending:
+                        self._write_chunk(pending, result)
+                    pending = encrypting
+                if pending:
+                    self._write_chunk(pending, result)
+        except Exception as e:
+            result.error = str(e)
+
+        self._report(result, position[0], total_bytes)
+        return result
+
+    def _encrypt_chunk(self, pool, chunk):
+        """把一批记录的加密任务提交到线程池"""
+        futures = [pool.submit(self.db_manager.encrypt_account_row, account) if account is not None else None
+                   for _, _, account in chunk]
+        return chunk, futures
+
+    def _write_chunk(self, pending, result):
+        """等待一批记录加密完成并在一个事务中写入"""
+        chunk, futures = pending
+        records = [
+            {"name": name, "data_dir": data_dir, "values": future.result() if future is not None else None}
+            for (name, data_dir, _), future in zip(chunk, futures)
+        ]
+        outcome = self.run_write(lambda db: db.import_account_chunk(records))
+        if outcome is None:
+            raise RuntimeError("写入数据库失败")
+
+        result.imported += outcome["imported"]
+        for name, reason in outcome["skipped"]:
+            result.skip(name, reason)
+        # 新建实例的数据目录需要存在，否则启动时的文件系统同步会把实例当作已删除
+        for name, data_dir in outcome["created"]:
+            try:
+                os.makedirs(data_dir, exist_ok=True)
+            except OSError as e:
+                print(f"创建数据目录失败: {data_dir}, {str(e)}")
+            result.created.append((name, data_dir))
+
+    def _report(self, result, position, total_bytes):
+        if self.progress_callback:
+            self.progress_callback(result.processed, position, total_bytes)
+
+
+class AccountExporter:
+    """
+    流式导出实例和账号信息
+
+    按批次从数据库读取密文，在线程池中解密后逐行写入临时文件，完成后替换目标文件，
+    取消或出错时不会留下写了一半的文件。
+    """
+
+    def __init__(self, db_manager, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 progress_callback=None, cancel_event=None):
+        """
+        初始化导出器
+
+        Args:
+            db_manager: 在调用run的线程中创建的DatabaseManager（可以是只读连接）
+            max_workers: 解密线程数
+            chunk_size: 每批读取和解密的记录数
+            progress_callback: 以(已导出记录数, 实例总数)调用
+            cancel_event: threading.Event，被设置后停止导出
+        """
+        self.db_manager = db_manager
+        self.max_workers = max_workers or default_workers()
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+
+    def run(self, path, file_format=None):
+        """
+        导出到文件
+
+        Returns:
+            TransferResult: 导出结果
+        """
+        result = TransferResult()
+        file_format = file_format or detect_format(path)
+        total = self.db_manager.count_instances()
+        temp_path = path + ".part"
+
+        try:
+            encoding = "utf-8-sig" if file_format == FORMAT_CSV else "utf-8"
+            with open(temp_path, "w", encoding=encoding, newline="") as f, \
+                    ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="account_decrypt") as pool:
+                writer = None
+                if file_format == FORMAT_CSV:
+                    writer = csv.writer(f)
+                    writer.writerow(CSV_COLUMNS)
+
+                chunk = []
+                for row in self.db_manager.iter_account_rows(self.chunk_size):
+                    chunk.append(row)
+                    if len(chunk) >= self.chunk_size:
+                        self._write_chunk(pool, chunk, f, writer, result)
+                        chunk = []
+                        self._report(result, total)
+                        if self.cancel_event.is_set():
+                            result.cancelled = True
+                            break
+                if chunk and not result.cancelled:
+                    self._write_chunk(pool, chunk, f, writer, result)
+
+            if result.cancelled:
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, path)
+        except Exception as e:
+            result.error = str(e)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+        self._report(result, total)
+        return result
+
+    def _decrypt(self, encrypted):
+        return normalize_account(self.db_manager.decrypt_account(encrypted) if encrypted else None)
+
+    def _write_chunk(self, pool, chunk, f, writer, result):
+        """并行解密一批记录并按原顺序写出"""
+        accounts = pool.map(self._decrypt, [encrypted for _, _, encrypted in chunk])
+        for (name, data_dir, _), account in zip(chunk, accounts):
+            result.processed += 1
+            if writer is not None:
+                extra = {key: value for key, value in account.items() if key not in ACCOUNT_FIELDS}
+                writer.writerow([name, data_dir] + [account[field] for field in ACCOUNT_FIELDS]
+                                + [json.dumps(extra, ensure_ascii=False) if extra else ""])
+            else:
+                record = {"name": name, "data_dir": data_dir}
+                record.update({key: value for key, value in account.items() if value})
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            result.imported += 1
+
+    def _report(self, result, total):
+        if self.progress_callback:
+            self.progress_callback(result.processed, total)
+
+
+class AccountTransferThread(QThread):
+    """在后台执行导入或导出的线程"""
+
+    # 已处理记录数, 进度百分比
+    progress_changed = pyqtSignal(int, int)
+    # TransferResult
+    transfer_finished = pyqtSignal(object)
+
+    def __init__(self, mode, path, config_manager, data_root=None, parent=None):
+        """
+        初始化导入导出线程
+
+        Args:
+            mode: "import"或"export"
+            path: 文件路径
+            config_manager: ConfigManager，导入通过其写线程写入，导出前等待其写线程写完已提交的保存
+            data_root: 导入时相对数据目录的根目录
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.mode = mode
+        self.path = path
+        self.config_manager = config_manager
+        self.data_root = data_root
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """请求取消，当前批次完成后停止"""
+        self.cancel_event.set()
+
+    def run(self):
+        writer = self.config_manager.db_writer
+        if self.mode == "import":
+            # 只读连接的密钥用于加密，写入交给写线程，与界面的保存串行执行
+            importer = AccountImporter(
+                self.config_manager.db_manager, run_write=writer.call, data_root=self.data_root,
+                progress_callback=self._on_import_progress, cancel_event=self.cancel_event
+            )
+            result = importer.run(self.path)
+        else:
+            result = TransferResult()
+            try:
+                # 等待之前提交的保存写入数据库后再读取
+                writer.call(lambda db: None)
+                db_manager = DatabaseManager(self.config_manager.config_dir, read_only=True)
+                try:
+                    exporter = AccountExporter(
+                        db_manager, progress_callback=self._on_export_progress, cancel_event=self.cancel_event
+                    )
+                    result = exporter.run(self.path)
+                finally:
+                    db_manager.close()
+            except Exception as e:
+                result.error = str(e)
+        self.transfer_finished.emit(result)
+
+    def _on_import_progress(self, processed, position, total_bytes):
+        self.progress_changed.emit(processed, int(position * 100 / total_bytes) if total_bytes else 100)
+
+    def _on_export_progress(self, processed, total):
+        self.progress_changed.emit(processed, int(processed * 100 / total) if total else 100)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="批量导入导出Chrome实例和账号信息")
+    parser.add_argument("action", choices=("import", "export"), help="导入或导出")
+    parser.add_argument("file", help="CSV或JSONL文件路径")
+    parser.add_argument("--format", choices=(FORMAT_CSV, FORMAT_JSONL), help="文件格式，默认根据扩展名判断")
+    parser.add_argument("--config-dir", default=default_config_dir(), help="配置目录")
+    parser.add_argument("--data-root", help="导入时相对数据目录的根目录，默认使用配置中的数据根目录")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="每个事务的记录数")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="加解密线程数")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.config_dir):
+        print(f"配置目录不存在: {args.config_dir}")
+        return 1
+
+    def print_progress(processed, done, total):
+        percent = int(done * 100 / total) if total else 100
+        print(f"\r已处理 {processed} 条 ({percent}%)", end="", file=sys.stderr, flush=True)
+
+    if args.action == "import":
+        db_manager = DatabaseManager(args.config_dir)
+        data_root = args.data_root or db_manager.load_config().get("data_root")
+        runner = AccountImporter(db_manager, max_workers=args.workers, chunk_size=args.chunk_size,
+                                 data_root=data_root,
+                                 progress_callback=lambda processed, pos, size: print_progress(processed, pos, size))
+    else:
+        db_manager = DatabaseManager(args.config_dir, read_only=True)
+        runner = AccountExporter(db_manager, max_workers=args.workers, chunk_size=args.chunk_size,
+                                 progress_callback=lambda processed, total: print_progress(processed, processed, total))
+
+    try:
+        result = runner.run(args.file, args.format)
+    except KeyboardInterrupt:
+        print("\n已中断，已提交的批次保留在数据库中")
+        return 1
+    finally:
+        db_manager.close()
+
+    print(file=sys.stderr)
+    print(result.summary())
+    for where, reason in result.skipped:
+        print(f"  跳过 {where}: {reason}")
+    return 1 if result.error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
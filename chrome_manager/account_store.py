@@ -0,0 +1,138 @@
+"""
+账号信息存储模块，启动时只读取密文，账号在被访问时才解密
+"""
+
+from collections import OrderedDict
+
+from .database_manager import ACCOUNT_FIELDS
+
+
+def normalize_account(account_data):
+    """把账号信息规范为包含全部标准字段的字典，便于比较；非空的额外字段原样保留"""
+    account_data = account_data or {}
+    account = {field: account_data.get(field, "") or "" for field in ACCOUNT_FIELDS}
+    for key, value in account_data.items():
+        if key not in account and value:
+            account[key] = value
+    return account
+
+
+class AccountStore:
+    """
+    按需解密的账号信息存储
+
+    启动时一次查询读出所有账号的密文，不做任何解密。账号在卡片或表格行
+    变为可见、调用get时才解密，明文放入有上限的LRU缓存。修改后的账号在写入
+    数据库之前保存在待写入表中；写入成功后对应的缓存失效，下次访问时从数据库
+    重新读取密文并解密。
+
+    只在UI线程中使用，读取通过只读数据库连接完成。
+    """
+
+    DEFAULT_CACHE_SIZE = 256  # 缓存的明文账号数
+
+    def __init__(self, db_manager=None, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        初始化账号存储
+
+        Args:
+            db_manager: 用于读取密文和解密的DatabaseManager（只读连接），为None时为空存储
+            cache_size: 明文缓存上限
+        """
+        self.db_manager = db_manager
+        self.cache_size = cache_size
+        self._encrypted = {}  # 实例名称 -> 密文行
+        self._stale = set()  # 密文已过期、需要重新读取的实例名称
+        self._cache = OrderedDict()  # 实例名称 -> 明文账号信息（LRU）
+        self._modified = {}  # 实例名称 -> 尚未写入数据库的明文账号信息
+        self.decrypt_count = 0  # 解密次数，便于观察懒加载效果
+
+    def load(self):
+        """从数据库读取所有账号的密文（不解密），清空缓存和待写入的修改"""
+        self._encrypted = self.db_manager.get_all_encrypted_accounts() if self.db_manager else {}
+        self._stale.clear()
+        self._cache.clear()
+        self._modified.clear()
+
+    def get(self, name):
+        """获取实例的账号信息（副本），没有账号信息时返回全部字段为空的字典"""
+        return dict(self._lookup(name))
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __contains__(self, name):
+        return name in self._modified or name in self._encrypted or name in self._stale
+
+    def __len__(self):
+        return len(set(self._encrypted) | set(self._modified) | self._stale)
+
+    def set(self, name, account_data):
+        """
+        修改实例的账号信息，写入数据库前保存在待写入表中
+
+        Returns:
+            bool: 内容是否有变化
+        """
+        account = normalize_account(account_data)
+        if account == self._lookup(name):
+            return False
+        self._modified[name] = account
+        self._cache.pop(name, None)
+        return True
+
+    def discard(self, name):
+        """实例被删除时移除其账号信息"""
+        self._encrypted.pop(name, None)
+        self._stale.discard(name)
+        self._cache.pop(name, None)
+        self._modified.pop(name, None)
+
+    def modified_items(self):
+        """返回尚未写入数据库的修改 [(实例名称, 账号信息副本)]"""
+        return [(name, dict(account)) for name, account in self._modified.items()]
+
+    def mark_persisted(self, name, account):
+        """
+        账号信息已写入数据库，缓存和密文失效
+
+        写入期间又被修改过的账号保留在待写入表中，等待下一次保存。
+        """
+        if self._modified.get(name) == account:
+            del self._modified[name]
+        self._cache.pop(name, None)
+        self._encrypted.pop(name, None)
+        self._stale.add(name)
+
+    def cached_count(self):
+        """当前缓存的明文账号数"""
+        return len(self._cache)
+
+    def _lookup(self, name):
+        """返回账号信息（内部对象，调用方不得修改）"""
+        account = self._modified.get(name)
+        if account is not None:
+            return account
+
+        account = self._cache.get(name)
+        if account is not None:
+            self._cache.move_to_end(name)
+            return account
+
+        if name in self._stale:
+            self._stale.discard(name)
+            row = self.db_manager.get_encrypted_account(name) if self.db_manager else None
+            if row is not None:
+                self._encrypted[name] = row
+
+        row = self._encrypted.get(name)
+        if row is None:
+            account = normalize_account(None)
+        else:
+            account = normalize_account(self.db_manager.decrypt_account(row))
+            self.decrypt_count += 1
+
+        self._cache[name] = account
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return account
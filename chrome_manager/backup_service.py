@@ -0,0 +1,305 @@
+"""
+数据库备份模块，在后台线程中用SQLite在线备份接口定期生成快照，并支持从快照恢复
+"""
+
+import os
+import time
+import shutil
+import sqlite3
+import threading
+from datetime import datetime
+from PyQt6.QtCore import QThread, pyqtSignal
+
+DB_FILE_NAME = "chrome_manager.db"
+KEY_FILE_NAME = "encryption.key"
+BACKUP_DIR_NAME = "backups"
+SNAPSHOT_PREFIX = "chrome_manager-"
+SNAPSHOT_TIME_FORMAT = "%Y%m%d-%H%M%S-%f"
+
+DEFAULT_KEEP = 7  # 保留的快照数
+DEFAULT_INTERVAL = 3600  # 两次自动备份的最短间隔（秒）
+START_DELAY = 120  # 启动后等待多久再检查是否需要备份（秒），避开启动时的大量读写
+PAGES_PER_STEP = 64  # 每一步复制的页数，步与步之间释放读锁
+STEP_PAUSE = 0.005  # 每一步之后的停顿（秒），让出磁盘给写线程
+
+
+def backup_dir(config_dir):
+    """快照目录"""
+    return os.path.join(config_dir, BACKUP_DIR_NAME)
+
+
+def snapshot_key_path(snapshot_path):
+    """与快照一起保存的密钥文件路径"""
+    return os.path.splitext(snapshot_path)[0] + ".key"
+
+
+def list_snapshots(config_dir):
+    """
+    列出所有快照，最新的在前
+
+    Returns:
+        list: [{"path": 快照路径, "time": 创建时间datetime, "size": 字节数}]
+    """
+    directory = backup_dir(config_dir)
+    snapshots = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return snapshots
+    for entry in entries:
+        name = entry.name
+        if not (name.startswith(SNAPSHOT_PREFIX) and name.endswith(".db")):
+            continue
+        try:
+            created = datetime.strptime(name[len(SNAPSHOT_PREFIX):-3], SNAPSHOT_TIME_FORMAT)
+            size = entry.stat().st_size
+        except (ValueError, OSError):
+            continue
+        snapshots.append({"path": entry.path, "time": created, "size": size})
+    snapshots.sort(key=lambda s: s["time"], reverse=True)
+    return snapshots
+
+
+def verify_snapshot(path):
+    """
+    用PRAGMA integrity_check检查快照
+
+    Returns:
+        tuple: (是否完好, 说明)
+    """
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return _integrity_check(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        return False, str(e)
+
+
+def _integrity_check(conn):
+    rows = conn.execute("PRAGMA integrity_check").fetchall()
+    if rows == [("ok",)]:
+        return True, "ok"
+    return False, "; ".join(str(row[0]) for row in rows[:5])
+
+
+def _instance_count(conn):
+    """数据库中的实例数，表不存在时为0"""
+    try:
+        return conn.execute("SELECT COUNT(*) FROM chrome_instances").fetchone()[0]
+    except sqlite3.Error:
+        return 0
+
+
+def _copy_database(source_conn, dest_path):
+    """
+    用在线备份接口分步把source_conn的数据库复制到dest_path并检查
+
+    Returns:
+        tuple: (是否完好, 说明)
+    """
+    dest = sqlite3.connect(dest_path)
+    try:
+        # 每一步只短暂持有源库的读锁，WAL模式下写线程可以照常提交
+        source_conn.backup(dest, pages=PAGES_PER_STEP, progress=lambda *args: time.sleep(STEP_PAUSE))
+        # 快照复制了源库的WAL标记，改回回滚日志模式，使快照是一个独立的文件
+        dest.execute("PRAGMA journal_mode = DELETE")
+        return _integrity_check(dest)
+    finally:
+        dest.close()
+
+
+def create_snapshot(config_dir, keep=DEFAULT_KEEP, source_conn=None, skip_empty=True):
+    """
+    生成一个快照，校验通过后轮换掉最旧的快照
+
+    可以在任意线程中调用；source_conn为None时打开一个只读连接作为备份源。
+
+    Args:
+        config_dir: 配置目录
+        keep: 保留的快照数，None表示不轮换
+        source_conn: 备份源连接，默认新开连接
+        skip_empty: 数据库中没有实例而最新快照中有实例时不生成快照，
+            避免异常清空的数据库把完好的快照轮换掉
+
+    Returns:
+        dict: {"ok": 是否成功, "path": 快照路径或None, "message": 说明}
+    """
+    directory = backup_dir(config_dir)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, SNAPSHOT_PREFIX + datetime.now().strftime(SNAPSHOT_TIME_FORMAT) + ".db")
+    temp_path = path + ".part"
+
+    own_conn = source_conn is None
+    try:
+        if own_conn:
+            source_conn = sqlite3.connect(os.path.join(config_dir, DB_FILE_NAME), timeout=10)
+            source_conn.execute("PRAGMA query_only = ON")
+        try:
+            if skip_empty and _instance_count(source_conn) == 0:
+                latest = next(iter(list_snapshots(config_dir)), None)
+                if latest is not None and _snapshot_instance_count(latest["path"]) > 0:
+                    return {"ok": False, "path": None,
+                            "message": "当前数据库中没有实例，保留已有快照，跳过本次备份"}
+            ok, message = _copy_database(source_conn, temp_path)
+        finally:
+            if own_conn:
+                source_conn.close()
+
+        if not ok:
+            os.remove(temp_path)
+            return {"ok": False, "path": None, "message": f"快照校验失败: {message}"}
+
+        os.replace(temp_path, path)
+        key_path = os.path.join(config_dir, KEY_FILE_NAME)
+        if os.path.exists(key_path):
+            shutil.copy2(key_path, snapshot_key_path(path))
+    except (sqlite3.Error, OSError) as e:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return {"ok": False, "path": None, "message": f"备份出错: {str(e)}"}
+
+    if keep is not None:
+        _rotate(config_dir, keep)
+    return {"ok": True, "path": path, "message": "备份完成"}
+
+
+def _snapshot_instance_count(path):
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return _instance_count(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return 0
+
+
+def _rotate(config_dir, keep):
+    """只保留最新的keep个快照"""
+    for snapshot in list_snapshots(config_dir)[keep:]:
+        for path in (snapshot["path"], snapshot_key_path(snapshot["path"])):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"删除旧快照失败: {path}, {str(e)}")
+
+
+def restore_snapshot(db_manager, snapshot_path):
+    """
+    把快照恢复到db_manager的写连接，须在写线程中执行
+
+    恢复前先为当前数据库生成一个快照（不轮换，避免删掉正要恢复的快照），恢复操作本身也可以撤销。
+    快照的密钥与当前密钥不同时一并恢复密钥；恢复后执行结构迁移，
+    旧版本的快照可以直接使用。
+
+    Returns:
+        dict: {"ok": 是否成功, "key_changed": 是否恢复了密钥, "message": 说明}
+    """
+    ok, message = verify_snapshot(snapshot_path)
+    if not ok:
+        return {"ok": False, "key_changed": False, "message": f"快照已损坏: {message}"}
+
+    config_dir = os.path.dirname(db_manager.db_path)
+    safety = create_snapshot(config_dir, keep=None, source_conn=db_manager.conn, skip_empty=False)
+    if not safety["ok"]:
+        return {"ok": False, "key_changed": False, "message": f"无法备份当前数据库，已取消恢复: {safety['message']}"}
+
+    key_changed = False
+    snapshot_key = snapshot_key_path(snapshot_path)
+    key_path = os.path.join(config_dir, KEY_FILE_NAME)
+    if os.path.exists(snapshot_key):
+        with open(snapshot_key, "rb") as f:
+            key_data = f.read()
+        with open(key_path, "rb") as f:
+            key_changed = f.read() != key_data
+
+    try:
+        if not db_manager.restore_from_file(snapshot_path, pages=PAGES_PER_STEP):
+            return {"ok": False, "key_changed": False, "message": "恢复出错"}
+        if key_changed:
+            with open(key_path, "wb") as f:
+                f.write(key_data)
+            db_manager.reload_encryption()
+    except (sqlite3.Error, OSError) as e:
+        return {"ok": False, "key_changed": False, "message": f"恢复出错: {str(e)}"}
+    return {"ok": True, "key_changed": key_changed, "message": "恢复完成"}
+
+
+class BackupService(QThread):
+    """
+    定期备份线程
+
+    启动后等待片刻，之后每当最新快照超过备份间隔就生成一个新快照。
+    备份使用独立的只读连接分步复制，不阻塞UI的只读连接和写线程。
+    """
+
+    # {"ok", "path", "message"}
+    backup_finished = pyqtSignal(dict)
+
+    def __init__(self, config_dir, keep=DEFAULT_KEEP, interval=DEFAULT_INTERVAL, parent=None):
+        """
+        初始化备份线程
+
+        Args:
+            config_dir: 配置目录
+            keep: 保留的快照数
+            interval: 两次自动备份的最短间隔（秒）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.config_dir = config_dir
+        self.keep = keep
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._backup_requested = False
+        self._lock = threading.Lock()  # 避免自动备份和手动备份同时写快照目录
+
+    def backup_now(self):
+        """请求立即备份，结果通过backup_finished通知"""
+        self._backup_requested = True
+        self._wake_event.set()
+
+    def stop(self):
+        """停止备份线程并等待其退出，正在进行的备份会先完成"""
+        self._stop_event.set()
+        self._wake_event.set()
+        self.wait()
+
+    def snapshot(self, skip_empty=True):
+        """在调用线程中生成一个快照"""
+        with self._lock:
+            return create_snapshot(self.config_dir, keep=self.keep, skip_empty=skip_empty)
+
+    def run(self):
+        """备份循环"""
+        try:
+            self.setPriority(QThread.Priority.LowestPriority)
+        except Exception as e:
+            print(f"设置备份线程优先级失败: {str(e)}")
+
+        self._wake_event.wait(START_DELAY)
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            requested = self._backup_requested
+            self._backup_requested = False
+
+            if requested or self._seconds_until_due() <= 0:
+                result = self.snapshot(skip_empty=not requested)
+                print(f"数据库备份: {result['message']}")
+                self.backup_finished.emit(result)
+
+            self._wake_event.wait(max(self._seconds_until_due(), 1))
+
+    def _seconds_until_due(self):
+        """距离下一次自动备份的秒数"""
+        latest = next(iter(list_snapshots(self.config_dir)), None)
+        if latest is None:
+            return 0
+        return self.interval - (datetime.now() - latest["time"]).total_seconds()
@@ -8,6 +8,11 @@ from PyQt6.QtGui import QFont
 
 from .constants import FONT_FAMILY, PRIMARY_COLOR, BACKGROUND_COLOR, TEXT_PRIMARY_COLOR
 from .database_manager import DatabaseManager
+from .db_writer import DatabaseWriter
+from .persistence import PersistenceTracker
+from .account_store import AccountStore
+from .instance_repository import InstanceRepository
+from .backup_service import BackupService, restore_snapshot
 
 class ConfigManager:
     """配置管理类，负责配置的加载和保存"""
@@ -28,8 +33,28 @@ class ConfigManager:
         # 确保配置目录存在
         self.ensure_config_dir()
         
-        # 初始化数据库管理器
-        self.db_manager = DatabaseManager(self.config_dir)
+        # 所有写入由单独的写线程通过一个WAL连接执行，需先于只读连接创建以完成建表
+        self.db_writer = DatabaseWriter(DatabaseManager(self.config_dir, check_same_thread=False))
+        self.db_writer.start()
+        
+        # UI线程使用的只读连接
+        self.db_manager = DatabaseManager(self.config_dir, read_only=True)
+        
+        # 在写线程中逐批把旧格式的账号记录迁移为单令牌格式
+        self._schedule_account_migration()
+        
+        # 账号信息存储，账号被访问时才解密
+        self.account_store = AccountStore(self.db_manager)
+        
+        # 所有实例保存在仓库中，页面通过仓库的信号增量更新
+        self.instances = InstanceRepository(main_window)
+        
+        # 变更跟踪器，记录数据库中已持久化的状态
+        self.tracker = PersistenceTracker(self.account_store, self.instances)
+        
+        # 定期在后台生成数据库快照
+        self.backup_service = BackupService(self.config_dir)
+        self.backup_service.start()
     
     def ensure_config_dir(self):
         """确保配置目录存在"""
@@ -50,7 +75,7 @@ class ConfigManager:
         加载配置
         
         Returns:
-            dict: 配置字典，包含chrome_path, data_root和shortcuts
+            dict: 配置字典，包含chrome_path, data_root和shortcuts（实例仓库）
         """
         print(f"尝试加载配置")
         
@@ -58,8 +83,8 @@ class ConfigManager:
             'chrome_path': r"C:\Program Files\Google\Chrome\Application\chrome.exe",
             'data_root': os.getcwd(),
             'user_modified_data_root': False,
-            'shortcuts': [],
-            'account_info': {}  # 确保账号信息默认为空字典
+            'shortcuts': self.instances,
+            'account_info': self.account_store
         }
         
         try:
@@ -70,6 +95,17 @@ class ConfigManager:
                 print(f"从数据库加载配置失败，使用默认配置: {str(db_err)}")
                 return default_config
             
+            # 以数据库中的原始内容作为变更跟踪的基准
+            self.tracker.reset(config)
+            
+            # 只读取账号密文，不解密
+            self.account_store.load()
+            config['account_info'] = self.account_store
+            
+            # 实例载入仓库，之后的增删都通过仓库完成
+            self.instances.load(config.get('shortcuts', []))
+            config['shortcuts'] = self.instances
+            
             # 确保配置包含所有必要的键
             for key, value in default_config.items():
                 if key not in config:
@@ -83,14 +119,6 @@ class ConfigManager:
                     print(f"配置中的数据根目录不存在: {config.get('data_root')}，使用默认值")
                 config['data_root'] = os.getcwd()
             
-            # 确保账号信息是字典
-            if not isinstance(config.get('account_info'), dict):
-                config['account_info'] = {}
-            
-            # 确保shortcuts是列表
-            if not isinstance(config.get('shortcuts'), list):
-                config['shortcuts'] = []
-                
             return config
             
         except Exception as e:
@@ -102,18 +130,14 @@ class ConfigManager:
     
     def save_config(self, config):
         """
-        保存配置
+        保存配置，只把自上次保存以来发生变化的记录交给写线程
+        
+        写线程尚未执行的上一次保存会被本次保存替换，连续多次保存只写入一次。
         
         Args:
             config: 配置字典，包含chrome_path, data_root和shortcuts
         """
         try:
-            print(f"\n============ 开始保存配置 ============")
-            print(f"保存配置 - Chrome路径: {config.get('chrome_path')}")
-            print(f"保存配置 - 数据根目录: {config.get('data_root')}")
-            print(f"保存配置 - 快捷方式列表数量: {len(config.get('shortcuts', []))}")
-            print(f"保存配置 - 快捷方式详情: {[s.get('name') for s in config.get('shortcuts', [])]}")
-            
             # 确保数据根目录不为空
             if not config.get('data_root'):
                 config['data_root'] = os.getcwd()
@@ -127,28 +151,17 @@ class ConfigManager:
                 except Exception as e:
                     print(f"创建数据根目录失败: {str(e)}")
             
-            # 保存Chrome实例信息
-            # 先清空现有实例
-            print(f"正在清空数据库中的Chrome实例数据")
-            self.db_manager.clear_chrome_instances()
-            
-            # 重新添加所有实例
-            print(f"开始保存{len(config.get('shortcuts', []))}个Chrome实例到数据库")
-            for shortcut in config.get('shortcuts', []):
-                print(f"  保存实例: {shortcut.get('name')}")
-                self.db_manager.save_chrome_instance(shortcut)
-            
-            # 保存账号信息
-            for name, account_data in config.get('account_info', {}).items():
-                if any(s["name"] == name for s in config.get('shortcuts', [])):
-                    self.db_manager.save_account_info(name, account_data)
+            # 只写入自上次保存以来发生变化的记录
+            changes = self.tracker.diff(config)
+            if changes.is_empty():
+                return
             
-            # 保存其他配置
-            self.db_manager.save_config(config)
-            
-            print("配置已成功保存")
-            print(f"============ 配置保存结束 ============\n")
-                
+            print(f"保存配置 - 写入变更: {changes.summary()}")
+            self.db_writer.submit(
+                lambda db: db.apply_changes(changes),
+                callback=lambda success: self._on_changes_saved(changes, success),
+                key="config"
+            )
         except Exception as e:
             error_msg = f"保存配置失败：{str(e)}"
             print(f"保存配置错误: {error_msg}")
@@ -158,6 +171,54 @@ class ConfigManager:
             import traceback
             traceback.print_exc()
     
+    def _on_changes_saved(self, changes, success):
+        """写线程完成变更写入后的回调（主线程）"""
+        if success:
+            # 写入成功的变更合并到跟踪基准，下次不再重复写入
+            self.tracker.mark_persisted(changes)
+            print("配置变更已保存到数据库")
+        else:
+            print("保存配置失败: 写入数据库失败")
+            if hasattr(self.main_window, 'statusBar'):
+                self.main_window.statusBar().showMessage("保存配置失败：写入数据库失败", 5000)
+    
+    def _schedule_account_migration(self):
+        """提交一批账号格式迁移，每批之间其他写入可以正常执行"""
+        self.db_writer.submit(
+            lambda db: db.migrate_account_format(),
+            callback=self._on_account_migration_batch,
+            key="account_migration"
+        )
+    
+    def _on_account_migration_batch(self, migrated):
+        """一批账号迁移完成，还有旧格式记录时继续下一批"""
+        if migrated:
+            print(f"已迁移{migrated}条账号记录为新存储格式")
+            self._schedule_account_migration()
+    
+    def restore_backup(self, snapshot_path, callback):
+        """
+        在写线程中从快照恢复数据库
+        
+        Args:
+            snapshot_path: 快照路径
+            callback: 完成后在主线程中以结果字典调用，调用方需重新加载配置
+        """
+        def on_restored(result):
+            result = result or {"ok": False, "key_changed": False, "message": "恢复出错"}
+            if result["key_changed"]:
+                # 写连接已在写线程中换用恢复的密钥，只读连接同样需要重新读取
+                self.db_manager.reload_encryption()
+            callback(result)
+        
+        self.db_writer.submit(lambda db: restore_snapshot(db, snapshot_path), on_restored)
+    
+    def close(self):
+        """写完队列中剩余的变更，关闭所有数据库连接"""
+        self.backup_service.stop()
+        self.db_writer.stop()
+        self.db_manager.close()
+    
     def show_error_message(self, message):
         """显示错误消息"""
         # 此方法已不再使用，改为使用状态栏显示消息
@@ -1,30 +1,262 @@
 import os
+import re
 import sqlite3
 import json
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import base64
+import hmac
+import hashlib
+
+# 账号信息字段，均加密存储
+ACCOUNT_FIELDS = ("wallet", "twitter", "discord", "telegram", "gmail", "note")
+
+# 账号信息存储格式版本（account_info.format_version）
+ACCOUNT_FORMAT_COLUMNS = 1  # 旧格式：每个字段单独加密，存储在各自的列中
+ACCOUNT_FORMAT_BLOB = 2  # 整条记录序列化为JSON后加密成一个令牌，存储在data列中，可包含任意额外字段
+
+# 建立盲索引的字段，可以不解密按精确值查找和检测重复；备注不建索引
+BLIND_INDEX_FIELDS = ("wallet", "twitter", "discord", "telegram", "gmail")
+# 盲索引的计算方式版本（account_info.index_version），修改规范化规则时递增，由迁移重新计算
+BLIND_INDEX_VERSION = 1
+
+# 实例分组和标签：类型 -> (名称表, 成员表, 成员表中的外键列)
+_MEMBERSHIP_TABLES = {
+    "group": ("instance_groups", "instance_group_members", "group_id"),
+    "tag": ("instance_tags", "instance_tag_members", "tag_id"),
+}
+
+_PROFILE_DIR_RE = re.compile(r"^Profile(\d+)$")
+_TRAILING_NUMBER_RE = re.compile(r"(\d+)\D*$")
+
+
+def parse_instance_number(name, data_dir=None):
+    """
+    计算实例编号
+    
+    优先使用数据目录名ProfileN中的N（同一数据根目录下唯一），
+    否则使用名称中最后一段数字，例如"Chrome实例12"为12。
+    
+    Returns:
+        int或None: 无法确定编号时返回None
+    """
+    if data_dir:
+        match = _PROFILE_DIR_RE.match(os.path.basename(os.path.normpath(data_dir)))
+        if match:
+            return int(match.group(1))
+    match = _TRAILING_NUMBER_RE.search(name or "")
+    if match:
+        return int(match.group(1))
+    return None
+
+
+# 按名称新增或更新实例，参数为{"name", "data_dir", "number"}；
+# 编号已被其他实例占用时存为NULL，保证唯一索引不会让整个事务失败
+_UPSERT_INSTANCE_SQL = """
+    INSERT INTO chrome_instances (name, data_dir, instance_number)
+    VALUES (:name, :data_dir, CASE
+        WHEN EXISTS (SELECT 1 FROM chrome_instances WHERE instance_number = :number AND name != :name)
+        THEN NULL ELSE :number END)
+    ON CONFLICT(name) DO UPDATE SET
+        data_dir = excluded.data_dir,
+        instance_number = excluded.instance_number
+"""
+
+
+# 只在名称不存在时创建实例，参数同_UPSERT_INSTANCE_SQL
+_INSERT_INSTANCE_SQL = _UPSERT_INSTANCE_SQL.split("ON CONFLICT")[0] + "ON CONFLICT(name) DO NOTHING"
+
+
+def _instance_row(name, data_dir):
+    """生成_UPSERT_INSTANCE_SQL的参数"""
+    return {"name": name, "data_dir": data_dir, "number": parse_instance_number(name, data_dir)}
+
+
+def instance_sort_key(instance):
+    """实例字典的排序键，与SQL中的默认排序一致：按编号从小到大，没有编号的排在最后"""
+    if "instance_number" in instance:
+        number = instance["instance_number"]
+    else:
+        number = parse_instance_number(instance["name"], instance.get("data_dir"))
+    return (number is None, number or 0, instance["name"])
+
+
+def _add_column(cursor, table, column, definition):
+    """列不存在时添加列（兼容在引入版本号之前已经加过列的数据库）"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    if column not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _schema_v1(cursor):
+    """初始表结构：配置、实例和按字段加密的账号信息"""
+    # 配置表 - 存储应用程序全局配置
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS config (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )''')
+    
+    # Chrome实例表
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS chrome_instances (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,
+        data_dir TEXT,
+        chrome_path TEXT
+    )''')
+    
+    # 账号信息表 - 敏感字段将被加密
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS account_info (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        instance_id INTEGER,
+        wallet TEXT,            -- 加密（旧格式）
+        twitter TEXT,           -- 加密（旧格式）
+        discord TEXT,           -- 加密（旧格式）
+        telegram TEXT,          -- 加密（旧格式）
+        gmail TEXT,             -- 加密（旧格式）
+        note TEXT,              -- 加密（旧格式）
+        FOREIGN KEY (instance_id) REFERENCES chrome_instances(id) ON DELETE CASCADE
+    )''')
+
+
+def _schema_v2(cursor):
+    """账号信息单令牌格式；原有记录保持旧格式，由migrate_account_format逐批迁移"""
+    _add_column(cursor, "account_info", "data", "TEXT")  # 加密的整条记录
+    _add_column(cursor, "account_info", "format_version", f"INTEGER NOT NULL DEFAULT {ACCOUNT_FORMAT_COLUMNS}")
+    # 按实例读取单个账号时使用
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_account_info_instance ON account_info(instance_id)")
+
+
+def _schema_v3(cursor):
+    """账号字段的盲索引；原有记录的index_version为0，由migrate_account_format补算"""
+    for field in BLIND_INDEX_FIELDS:
+        _add_column(cursor, "account_info", f"{field}_bidx", "TEXT")
+    _add_column(cursor, "account_info", "index_version", "INTEGER NOT NULL DEFAULT 0")
+    for field in BLIND_INDEX_FIELDS:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_account_info_{field}_bidx ON account_info({field}_bidx)"
+        )
+
+
+def _schema_v4(cursor):
+    """实例编号列，以及分组和标签"""
+    # 由名称和数据目录预先计算的编号，用于SQL中过滤和排序
+    _add_column(cursor, "chrome_instances", "instance_number", "INTEGER")
+    cursor.execute("SELECT id, name, data_dir FROM chrome_instances WHERE instance_number IS NULL")
+    numbers = [
+        (parse_instance_number(name, data_dir), instance_id)
+        for instance_id, name, data_dir in cursor.fetchall()
+    ]
+    cursor.executemany(
+        "UPDATE chrome_instances SET instance_number = ? WHERE id = ?",
+        [row for row in numbers if row[0] is not None]
+    )
+    
+    # 分组和标签（多对多），成员表以(分组, 实例)为主键，按分组过滤时直接走主键
+    for table, member_table, key_column in _MEMBERSHIP_TABLES.values():
+        cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )''')
+        cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {member_table} (
+            {key_column} INTEGER NOT NULL,
+            instance_id INTEGER NOT NULL,
+            PRIMARY KEY ({key_column}, instance_id),
+            FOREIGN KEY ({key_column}) REFERENCES {table}(id) ON DELETE CASCADE,
+            FOREIGN KEY (instance_id) REFERENCES chrome_instances(id) ON DELETE CASCADE
+        ) WITHOUT ROWID''')
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{member_table}_instance ON {member_table}(instance_id)"
+        )
+
+
+def _schema_v5(cursor):
+    """实例编号唯一索引；重复的编号只保留最早创建的实例，其余置为NULL"""
+    cursor.execute("DROP INDEX IF EXISTS idx_chrome_instances_number")
+    cursor.execute(
+        """
+        UPDATE chrome_instances SET instance_number = NULL
+        WHERE instance_number IS NOT NULL AND id NOT IN (
+            SELECT MIN(id) FROM chrome_instances
+            WHERE instance_number IS NOT NULL
+            GROUP BY instance_number
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE UNIQUE INDEX idx_chrome_instances_number ON chrome_instances(instance_number)"
+    )
+
+
+def _schema_v6(cursor):
+    """按数据目录查找实例的索引（导入时检查目录是否已被占用）"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_chrome_instances_data_dir ON chrome_instances(data_dir)")
+
+
+# 结构迁移列表，第N项把数据库从版本N-1迁移到版本N（PRAGMA user_version）；
+# 只能在末尾追加，已发布的迁移不能修改
+_SCHEMA_MIGRATIONS = (_schema_v1, _schema_v2, _schema_v3, _schema_v4, _schema_v5, _schema_v6)
+SCHEMA_VERSION = len(_SCHEMA_MIGRATIONS)
+
+# 实例的默认排序（表别名c）：按编号从小到大，没有编号的排在最后
+_INSTANCE_ORDER = "c.instance_number IS NULL, c.instance_number, c.name"
+
+# 读取账号密文时查询的列，密文行的格式与此一致
+_ACCOUNT_ROW_COLUMNS = "a.format_version, a.data, a.wallet, a.twitter, a.discord, a.telegram, a.gmail, a.note"
+
+# 以新格式覆盖一条账号记录的SET子句，参数顺序同encrypt_account_row，旧格式的列同时清空
+_ACCOUNT_UPDATE_SET = (
+    "data = ?, format_version = ?, "
+    + ", ".join(f"{field}_bidx = ?" for field in BLIND_INDEX_FIELDS)
+    + ", index_version = ?, "
+    + ", ".join(f"{field} = NULL" for field in ACCOUNT_FIELDS)
+)
 
 class DatabaseManager:
-    def __init__(self, app_data_path):
+    def __init__(self, app_data_path, read_only=False, check_same_thread=True):
+        """
+        Args:
+            app_data_path: 配置目录
+            read_only: 是否以只读方式连接（供UI线程读取，写入统一交给DatabaseWriter）
+            check_same_thread: 为False时连接可以交给其他线程独占使用
+        """
         # 确保目录存在
         os.makedirs(app_data_path, exist_ok=True)
         
         # 数据库路径
         self.db_path = os.path.join(app_data_path, "chrome_manager.db")
+        self.read_only = read_only
+        self.check_same_thread = check_same_thread
         
         # 初始化加密
         self._init_encryption(app_data_path)
         
         # 连接数据库
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = self._connect()
         
+        # 创建或迁移表结构（只读连接由写连接负责）
+        if not read_only:
+            self._migrate_schema()
+    
+    def _connect(self):
+        """打开数据库连接并设置PRAGMA"""
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=self.check_same_thread)
+        if self.read_only:
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            # WAL模式下读写互不阻塞；synchronous=NORMAL在WAL下不会损坏数据库，
+            # 只在断电时可能丢失最后几个事务，换来每次提交不再fsync
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
         # 启用外键约束
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        
-        # 创建表结构
-        self._create_tables()
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
     
     def _init_encryption(self, app_data_path):
         """初始化加密系统"""
@@ -50,48 +282,65 @@ class DatabaseManager:
         else:
             # 读取现有密钥
             with open(key_path, "rb") as f:
-                content = f.read().split(b"\n")
-                salt = content[0]
-                key = content[1]
+                # 盐值是随机字节，可能包含换行符；密钥是base64，不含换行符
+                salt, key = f.read().rsplit(b"\n", 1)
         
         # 初始化加密器
         self.encryptor = Fernet(key)
-    
-    def _create_tables(self):
-        """创建数据库表结构"""
-        cursor = self.conn.cursor()
         
-        # 配置表 - 存储应用程序全局配置
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS config (
-            key TEXT PRIMARY KEY,
-            value TEXT
-        )''')
+        # 盲索引使用从同一密钥派生的独立子密钥，索引值泄露不会影响加密密钥
+        self.index_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            info=b"chrome_manager account blind index",
+        ).derive(base64.urlsafe_b64decode(key))
+    
+    def reload_encryption(self):
+        """密钥文件被替换（如从备份恢复）后重新读取密钥"""
+        self._init_encryption(os.path.dirname(self.db_path))
+    
+    def restore_from_file(self, path, pages=-1):
+        """
+        用SQLite备份接口把另一个数据库文件整库复制到当前连接，完成后执行结构迁移
         
-        # Chrome实例表
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS chrome_instances (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE,
-            data_dir TEXT,
-            chrome_path TEXT
-        )''')
+        已打开的其他连接不需要重新打开，下一次读取即可看到恢复后的数据。
         
-        # 账号信息表 - 敏感字段将被加密
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS account_info (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            instance_id INTEGER,
-            wallet TEXT,            -- 加密
-            twitter TEXT,           -- 加密
-            discord TEXT,           -- 加密
-            telegram TEXT,          -- 加密
-            gmail TEXT,             -- 加密
-            note TEXT,              -- 加密
-            FOREIGN KEY (instance_id) REFERENCES chrome_instances(id) ON DELETE CASCADE
-        )''')
+        Returns:
+            bool: 是否成功
+        """
+        try:
+            self._ensure_connection()
+            source = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                source.backup(self.conn, pages=pages)
+            finally:
+                source.close()
+            if not self.read_only:
+                self._migrate_schema()
+            return True
+        except sqlite3.Error as e:
+            print(f"从文件恢复数据库出错: {str(e)}")
+            return False
+    
+    def _migrate_schema(self):
+        """按PRAGMA user_version依次执行尚未执行的结构迁移，每个迁移在一个事务中完成"""
+        cursor = self.conn.cursor()
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            print(f"数据库结构版本({version})高于程序支持的版本({SCHEMA_VERSION})，跳过迁移")
+            return
         
-        self.conn.commit()
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            try:
+                self.conn.execute("BEGIN")
+                _SCHEMA_MIGRATIONS[target - 1](cursor)
+                cursor.execute(f"PRAGMA user_version = {target}")
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            print(f"数据库结构已迁移到版本{target}")
     
     def _encrypt(self, value):
         """加密文本数据"""
@@ -108,6 +357,56 @@ class DatabaseManager:
         except Exception:
             return ""  # 解密失败时返回空字符串
     
+    def _encrypt_account(self, account_data):
+        """把整条账号记录序列化为紧凑JSON并加密成一个令牌，空字段不存储"""
+        record = {key: value for key, value in account_data.items() if value}
+        return self._encrypt(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    
+    def blind_index(self, field, value):
+        """
+        计算字段值的盲索引
+        
+        值先去掉首尾空白并转为小写（钱包地址、邮箱等不区分大小写），
+        再以字段名为前缀计算HMAC-SHA256，不同字段的相同值得到不同的索引。
+        
+        Returns:
+            str或None: 十六进制索引值，空值返回None
+        """
+        value = (value or "").strip().lower()
+        if not value:
+            return None
+        message = f"{field}:{value}".encode()
+        return hmac.new(self.index_key, message, hashlib.sha256).hexdigest()[:32]
+    
+    def encrypt_account_row(self, account_data):
+        """
+        生成新格式账号记录的列值：密文、格式版本、各盲索引和索引版本
+        
+        只使用密钥，不访问数据库连接，可以在工作线程池中并行调用。
+        """
+        return (
+            [self._encrypt_account(account_data), ACCOUNT_FORMAT_BLOB]
+            + [self.blind_index(field, account_data.get(field, "")) for field in BLIND_INDEX_FIELDS]
+            + [BLIND_INDEX_VERSION]
+        )
+    
+    def _write_account(self, cursor, instance_id, account_data):
+        """以新格式写入一个实例的账号信息（调用方负责事务）"""
+        self._write_account_row(cursor, instance_id, self.encrypt_account_row(account_data))
+    
+    def _write_account_row(self, cursor, instance_id, values):
+        """写入encrypt_account_row生成的列值（调用方负责事务）"""
+        cursor.execute(
+            f"UPDATE account_info SET {_ACCOUNT_UPDATE_SET} WHERE instance_id = ?",
+            values + [instance_id]
+        )
+        if cursor.rowcount == 0:
+            columns = ["instance_id", "data", "format_version"] + [f"{f}_bidx" for f in BLIND_INDEX_FIELDS] + ["index_version"]
+            cursor.execute(
+                f"INSERT INTO account_info ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [instance_id] + values
+            )
+    
     def save_config(self, config_dict):
         """保存全局配置"""
         cursor = self.conn.cursor()
@@ -145,13 +444,7 @@ class DatabaseManager:
                 print(f"加载Chrome实例列表时出错: {str(e)}")
                 config["shortcuts"] = []
             
-            # 加载账号信息
-            try:
-                config["account_info"] = self.get_all_account_info()
-            except Exception as e:
-                print(f"加载账号信息时出错: {str(e)}")
-                config["account_info"] = {}
-            
+            # 账号信息由AccountStore按需读取和解密，这里不再全部解密
             return config
         except Exception as e:
             print(f"加载配置时出错: {str(e)}")
@@ -183,38 +476,9 @@ class DatabaseManager:
             
             # 开始事务
             self.conn.execute("BEGIN TRANSACTION")
-            
-            # 检查是否已存在
-            cursor.execute(
-                "SELECT id FROM chrome_instances WHERE name = ?",
-                (name,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                instance_id = row[0]
-                print(f"更新现有实例, ID={instance_id}")
-                # 更新现有记录
-                cursor.execute(
-                    """
-                    UPDATE chrome_instances 
-                    SET data_dir = ? 
-                    WHERE id = ?
-                    """,
-                    (data_dir, instance_id)
-                )
-            else:
-                print(f"插入新实例")
-                # 插入新记录
-                cursor.execute(
-                    """
-                    INSERT INTO chrome_instances (name, data_dir)
-                    VALUES (?, ?)
-                    """,
-                    (name, data_dir)
-                )
-                instance_id = cursor.lastrowid
-                print(f"插入新实例成功, ID={instance_id}")
+            cursor.execute(_UPSERT_INSTANCE_SQL, _instance_row(name, data_dir))
+            cursor.execute("SELECT id FROM chrome_instances WHERE name = ?", (name,))
+            instance_id = cursor.fetchone()[0]
             
             # 提交事务
             self.conn.commit()
@@ -233,6 +497,34 @@ class DatabaseManager:
             print(f"保存Chrome实例出错: {str(e)}")
             return None
     
+    def save_chrome_instances(self, instances):
+        """
+        在一个事务中批量保存多个Chrome实例
+
+        Args:
+            instances: 实例字典列表，每项包含name和data_dir
+
+        Returns:
+            int或None: 保存的实例数，失败时返回None（整批回滚）
+        """
+        try:
+            self._ensure_connection()
+
+            rows = [_instance_row(instance.get("name"), instance.get("data_dir")) for instance in instances]
+
+            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.executemany(_UPSERT_INSTANCE_SQL, rows)
+            self.conn.commit()
+            print(f"批量保存Chrome实例: {len(rows)}个")
+            return len(rows)
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"批量保存Chrome实例出错: {str(e)}")
+            return None
+
     def get_all_chrome_instances(self):
         """获取所有Chrome实例"""
         try:
@@ -243,17 +535,19 @@ class DatabaseManager:
             
             cursor = self.conn.cursor()
             cursor.execute(
-                """
-                SELECT name, data_dir FROM chrome_instances
+                f"""
+                SELECT c.name, c.data_dir, c.instance_number FROM chrome_instances c
+                ORDER BY {_INSTANCE_ORDER}
                 """
             )
             
             instances = []
-            for name, data_dir in cursor.fetchall():
+            for name, data_dir, number in cursor.fetchall():
                 print(f"  找到实例: 名称={name}, 数据目录={data_dir}")
                 instances.append({
                     "name": name,
-                    "data_dir": data_dir
+                    "data_dir": data_dir,
+                    "instance_number": number
                 })
             
             print(f"成功获取{len(instances)}个Chrome实例")
@@ -305,6 +599,233 @@ class DatabaseManager:
             print(f"删除Chrome实例出错: {str(e)}")
             return False
     
+    def _instance_filter_sql(self, group=None, tag=None, number_range=None):
+        """
+        生成实例查询的过滤条件
+        
+        Returns:
+            tuple: (JOIN子句, WHERE子句, 参数列表)
+        """
+        joins = []
+        conditions = []
+        params = []
+        for kind, value in (("group", group), ("tag", tag)):
+            if value is None:
+                continue
+            table, member_table, key_column = _MEMBERSHIP_TABLES[kind]
+            joins.append(
+                f"JOIN {member_table} {kind}_m ON {kind}_m.instance_id = c.id "
+                f"JOIN {table} {kind}_t ON {kind}_t.id = {kind}_m.{key_column} AND {kind}_t.name = ?"
+            )
+            params.append(value)
+        if number_range is not None:
+            low, high = number_range
+            if low is not None:
+                conditions.append("c.instance_number >= ?")
+                params.append(low)
+            if high is not None:
+                conditions.append("c.instance_number <= ?")
+                params.append(high)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return " ".join(joins), where, params
+    
+    def query_instances(self, group=None, tag=None, number_range=None, limit=None, offset=0):
+        """
+        按分组、标签和编号范围查询实例，过滤、排序和分页都在SQL中完成
+        
+        Args:
+            group: 分组名称，None表示不限
+            tag: 标签名称，None表示不限
+            number_range: (最小编号, 最大编号)，包含两端，任一端为None表示不限
+            limit: 最多返回的实例数，None表示不限
+            offset: 跳过的实例数，配合limit只加载界面显示的一段
+            
+        Returns:
+            list: 实例字典列表，包含name、data_dir和instance_number，按编号排序
+        """
+        joins, where, params = self._instance_filter_sql(group, tag, number_range)
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT c.name, c.data_dir, c.instance_number
+                FROM chrome_instances c {joins}
+                {where}
+                ORDER BY {_INSTANCE_ORDER}
+                LIMIT ? OFFSET ?
+                """,
+                params + [-1 if limit is None else limit, offset]
+            )
+            return [
+                {"name": name, "data_dir": data_dir, "instance_number": number}
+                for name, data_dir, number in cursor.fetchall()
+            ]
+        except sqlite3.Error as e:
+            print(f"查询实例出错: {str(e)}")
+            return []
+    
+    def count_instances(self, group=None, tag=None, number_range=None):
+        """统计符合条件的实例数，参数同query_instances"""
+        joins, where, params = self._instance_filter_sql(group, tag, number_range)
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM chrome_instances c {joins} {where}", params)
+            return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"统计实例出错: {str(e)}")
+            return 0
+    
+    def add_to_group(self, group, instance_names):
+        """把实例加入分组，分组不存在时自动创建"""
+        return self._add_members("group", group, instance_names)
+    
+    def remove_from_group(self, group, instance_names):
+        """把实例移出分组"""
+        return self._remove_members("group", group, instance_names)
+    
+    def add_tag(self, tag, instance_names):
+        """给实例添加标签，标签不存在时自动创建"""
+        return self._add_members("tag", tag, instance_names)
+    
+    def remove_tag(self, tag, instance_names):
+        """移除实例的标签"""
+        return self._remove_members("tag", tag, instance_names)
+    
+    def delete_group(self, group):
+        """删除分组，成员关系级联删除，实例本身不受影响"""
+        return self._delete_label("group", group)
+    
+    def delete_tag(self, tag):
+        """删除标签，成员关系级联删除，实例本身不受影响"""
+        return self._delete_label("tag", tag)
+    
+    def list_groups(self):
+        """返回所有分组及其实例数 [(分组名称, 实例数)]"""
+        return self._list_labels("group")
+    
+    def list_tags(self):
+        """返回所有标签及其实例数 [(标签名称, 实例数)]"""
+        return self._list_labels("tag")
+    
+    def get_instance_labels(self, instance_name):
+        """
+        获取实例所属的分组和标签
+        
+        Returns:
+            dict: {"groups": [分组名称], "tags": [标签名称]}
+        """
+        labels = {"groups": [], "tags": []}
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            for kind, key in (("group", "groups"), ("tag", "tags")):
+                table, member_table, key_column = _MEMBERSHIP_TABLES[kind]
+                cursor.execute(
+                    f"""
+                    SELECT t.name
+                    FROM {member_table} m
+                    JOIN {table} t ON t.id = m.{key_column}
+                    JOIN chrome_instances c ON c.id = m.instance_id
+                    WHERE c.name = ?
+                    ORDER BY t.name
+                    """,
+                    (instance_name,)
+                )
+                labels[key] = [row[0] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"获取实例分组和标签出错: {str(e)}")
+        return labels
+    
+    def _add_members(self, kind, label, instance_names):
+        """把实例加入分组或标签（一个事务）"""
+        table, member_table, key_column = _MEMBERSHIP_TABLES[kind]
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            self.conn.execute("BEGIN TRANSACTION")
+            cursor.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (label,))
+            cursor.execute(f"SELECT id FROM {table} WHERE name = ?", (label,))
+            label_id = cursor.fetchone()[0]
+            cursor.executemany(
+                f"""
+                INSERT OR IGNORE INTO {member_table} ({key_column}, instance_id)
+                SELECT ?, id FROM chrome_instances WHERE name = ?
+                """,
+                [(label_id, name) for name in instance_names]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"添加实例到{table}出错: {str(e)}")
+            return False
+    
+    def _remove_members(self, kind, label, instance_names):
+        """把实例移出分组或标签（一个事务）"""
+        table, member_table, key_column = _MEMBERSHIP_TABLES[kind]
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            self.conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(
+                f"""
+                DELETE FROM {member_table}
+                WHERE {key_column} = (SELECT id FROM {table} WHERE name = ?)
+                  AND instance_id = (SELECT id FROM chrome_instances WHERE name = ?)
+                """,
+                [(label, name) for name in instance_names]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"从{table}移除实例出错: {str(e)}")
+            return False
+    
+    def _delete_label(self, kind, label):
+        """删除分组或标签"""
+        table = _MEMBERSHIP_TABLES[kind][0]
+        try:
+            self._ensure_connection()
+            self.conn.execute(f"DELETE FROM {table} WHERE name = ?", (label,))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"删除{table}记录出错: {str(e)}")
+            return False
+    
+    def _list_labels(self, kind):
+        """列出分组或标签及其实例数"""
+        table, member_table, key_column = _MEMBERSHIP_TABLES[kind]
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT t.name, COUNT(m.instance_id)
+                FROM {table} t
+                LEFT JOIN {member_table} m ON m.{key_column} = t.id
+                GROUP BY t.id
+                ORDER BY t.name
+                """
+            )
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"列出{table}出错: {str(e)}")
+            return []
+    
     def get_instance_id(self, name):
         """获取实例ID"""
         cursor = self.conn.cursor()
@@ -320,82 +841,35 @@ class DatabaseManager:
             return False
         
         cursor = self.conn.cursor()
-        
-        # 先删除现有的账号信息
-        cursor.execute("DELETE FROM account_info WHERE instance_id = ?", (instance_id,))
-        
-        # 插入新的账号信息（加密敏感字段）
-        cursor.execute(
-            """
-            INSERT INTO account_info 
-            (instance_id, wallet, twitter, discord, telegram, gmail, note)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                instance_id,
-                self._encrypt(account_data.get("wallet", "")),
-                self._encrypt(account_data.get("twitter", "")),
-                self._encrypt(account_data.get("discord", "")),
-                self._encrypt(account_data.get("telegram", "")),
-                self._encrypt(account_data.get("gmail", "")),
-                self._encrypt(account_data.get("note", ""))
-            )
-        )
-        
+        self._write_account(cursor, instance_id, account_data)
         self.conn.commit()
         return True
     
     def get_account_info(self, instance_name):
         """获取指定实例的账号信息"""
-        instance_id = self.get_instance_id(instance_name)
-        if not instance_id:
-            return {}
-        
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT wallet, twitter, discord, telegram, gmail, note
-            FROM account_info
-            WHERE instance_id = ?
-            """,
-            (instance_id,)
-        )
-        
-        result = cursor.fetchone()
-        if not result:
+        row = self.get_encrypted_account(instance_name)
+        if row is None:
             return {}
-        
-        return {
-            "wallet": self._decrypt(result[0]),
-            "twitter": self._decrypt(result[1]),
-            "discord": self._decrypt(result[2]),
-            "telegram": self._decrypt(result[3]),
-            "gmail": self._decrypt(result[4]),
-            "note": self._decrypt(result[5])
-        }
+        return self.decrypt_account(row)
     
     def get_all_account_info(self):
-        """获取所有实例的账号信息"""
+        """获取所有实例的账号信息（全部解密）"""
         try:
             cursor = self.conn.cursor()
             cursor.execute(
-                """
-                SELECT c.name, a.wallet, a.twitter, a.discord, a.telegram, a.gmail, a.note
+                f"""
+                SELECT c.name, {_ACCOUNT_ROW_COLUMNS}
                 FROM chrome_instances c
                 LEFT JOIN account_info a ON c.id = a.instance_id
                 """
             )
             
             all_accounts = {}
-            for name, wallet, twitter, discord, telegram, gmail, note in cursor.fetchall():
-                all_accounts[name] = {
-                    "wallet": self._decrypt(wallet) if wallet else "",
-                    "twitter": self._decrypt(twitter) if twitter else "",
-                    "discord": self._decrypt(discord) if discord else "",
-                    "telegram": self._decrypt(telegram) if telegram else "",
-                    "gmail": self._decrypt(gmail) if gmail else "",
-                    "note": self._decrypt(note) if note else ""
-                }
+            for row in cursor.fetchall():
+                account = {field: "" for field in ACCOUNT_FIELDS}
+                if row[1] is not None:
+                    account.update(self.decrypt_account(tuple(row[1:])))
+                all_accounts[row[0]] = account
             
             return all_accounts
         except Exception as e:
@@ -403,6 +877,316 @@ class DatabaseManager:
             print(f"获取账号信息时出错: {str(e)}")
             return {}
     
+    def get_all_encrypted_accounts(self):
+        """
+        获取所有账号信息的密文，不解密
+        
+        Returns:
+            dict: 实例名称 -> 密文行，密文行交给decrypt_account解密
+        """
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT c.name, {_ACCOUNT_ROW_COLUMNS}
+                FROM account_info a
+                JOIN chrome_instances c ON c.id = a.instance_id
+                """
+            )
+            return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"读取账号密文时出错: {str(e)}")
+            return {}
+    
+    def get_encrypted_account(self, instance_name):
+        """获取指定实例账号信息的密文行，没有时返回None"""
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {_ACCOUNT_ROW_COLUMNS}
+                FROM account_info a
+                JOIN chrome_instances c ON c.id = a.instance_id
+                WHERE c.name = ?
+                """,
+                (instance_name,)
+            )
+            row = cursor.fetchone()
+            return tuple(row) if row else None
+        except Exception as e:
+            print(f"读取账号密文时出错: {str(e)}")
+            return None
+    
+    def decrypt_account(self, row):
+        """
+        解密一个密文行，返回账号信息字典
+        
+        Args:
+            row: (format_version, data, wallet, twitter, discord, telegram, gmail, note)
+        """
+        format_version, data = row[0], row[1]
+        if format_version == ACCOUNT_FORMAT_BLOB:
+            plaintext = self._decrypt(data)
+            if not plaintext:
+                return {}
+            try:
+                record = json.loads(plaintext)
+            except ValueError:
+                return {}
+            return record if isinstance(record, dict) else {}
+        return {field: self._decrypt(value) for field, value in zip(ACCOUNT_FIELDS, row[2:])}
+    
+    def migrate_account_format(self, batch_size=200):
+        """
+        把一批旧格式或盲索引过期的账号记录重写为当前格式
+        
+        每批在一个短事务中完成，调用方反复调用直到返回0，
+        期间其他写入可以穿插执行，迁移过程中新旧格式的记录都能正常读取。
+        
+        Returns:
+            int: 本批迁移的记录数，出错时返回0
+        """
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT a.id, {_ACCOUNT_ROW_COLUMNS}
+                FROM account_info a
+                WHERE a.format_version < ? OR a.index_version < ?
+                LIMIT ?
+                """,
+                (ACCOUNT_FORMAT_BLOB, BLIND_INDEX_VERSION, batch_size)
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return 0
+            
+            updates = []
+            for row in rows:
+                account = self.decrypt_account(tuple(row[1:]))
+                updates.append(self.encrypt_account_row(account) + [row[0]])
+            
+            self.conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(
+                f"UPDATE account_info SET {_ACCOUNT_UPDATE_SET} WHERE id = ?",
+                updates
+            )
+            self.conn.commit()
+            return len(updates)
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"迁移账号信息格式出错: {str(e)}")
+            return 0
+    
+    def import_account_chunk(self, records):
+        """
+        在一个事务中导入一批已加密的账号记录
+        
+        实例不存在且记录带有数据目录时先创建实例；已存在的实例不修改数据目录。
+        导入的账号信息整条替换原有的账号信息；values为None的记录只创建实例，不修改账号信息。
+        
+        Args:
+            records: [{"name": 实例名称, "data_dir": 数据目录或None, "values": encrypt_account_row的结果}]
+            
+        Returns:
+            dict或None: {"imported": 导入数, "created": [(实例名称, 数据目录)], "skipped": [(实例名称, 原因)]}，
+                失败时返回None（整批回滚）
+        """
+        result = {"imported": 0, "created": [], "skipped": []}
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            self.conn.execute("BEGIN TRANSACTION")
+            for record in records:
+                name = record["name"]
+                cursor.execute("SELECT id FROM chrome_instances WHERE name = ?", (name,))
+                row = cursor.fetchone()
+                if row is None:
+                    data_dir = record.get("data_dir")
+                    if not data_dir:
+                        result["skipped"].append((name, "实例不存在且没有提供数据目录"))
+                        continue
+                    cursor.execute("SELECT name FROM chrome_instances WHERE data_dir = ?", (data_dir,))
+                    owner = cursor.fetchone()
+                    if owner is not None:
+                        result["skipped"].append((name, f"数据目录已被实例 {owner[0]} 使用"))
+                        continue
+                    cursor.execute(_INSERT_INSTANCE_SQL, _instance_row(name, data_dir))
+                    cursor.execute("SELECT id FROM chrome_instances WHERE name = ?", (name,))
+                    row = cursor.fetchone()
+                    result["created"].append((name, data_dir))
+                if record.get("values") is not None:
+                    self._write_account_row(cursor, row[0], record["values"])
+                result["imported"] += 1
+            self.conn.commit()
+            return result
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"导入账号信息出错: {str(e)}")
+            return None
+    
+    def iter_account_rows(self, batch_size=500):
+        """
+        按编号顺序逐批读取所有实例及其账号密文，不一次性加载整张表
+        
+        Yields:
+            tuple: (实例名称, 数据目录, 密文行或None)，密文行交给decrypt_account解密
+        """
+        self._ensure_connection()
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT c.name, c.data_dir, {_ACCOUNT_ROW_COLUMNS}
+            FROM chrome_instances c
+            LEFT JOIN account_info a ON a.instance_id = c.id
+            ORDER BY {_INSTANCE_ORDER}
+            """
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                encrypted = tuple(row[2:]) if row[2] is not None else None
+                yield row[0], row[1], encrypted
+    
+    def find_instances_by_account(self, field, value):
+        """
+        按账号字段的精确值查找实例，通过盲索引查询，不解密任何记录
+        
+        比较不区分大小写和首尾空白。尚未完成迁移的旧记录没有索引，不会被找到。
+        
+        Args:
+            field: BLIND_INDEX_FIELDS中的字段
+            value: 要查找的值
+            
+        Returns:
+            list: 实例名称列表
+        """
+        if field not in BLIND_INDEX_FIELDS:
+            raise ValueError(f"字段没有盲索引: {field}")
+        digest = self.blind_index(field, value)
+        if digest is None:
+            return []
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT c.name
+                FROM account_info a
+                JOIN chrome_instances c ON c.id = a.instance_id
+                WHERE a.{field}_bidx = ?
+                ORDER BY c.id
+                """,
+                (digest,)
+            )
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"查找账号出错: {str(e)}")
+            return []
+    
+    def find_duplicate_accounts(self, fields=BLIND_INDEX_FIELDS):
+        """
+        查找在多个实例中重复使用的账号，按盲索引分组统计，不解密任何记录
+        
+        Returns:
+            dict: 字段 -> [[使用同一个值的实例名称, ...], ...]，没有重复的字段不出现
+        """
+        report = {}
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            for field in fields:
+                if field not in BLIND_INDEX_FIELDS:
+                    raise ValueError(f"字段没有盲索引: {field}")
+                cursor.execute(
+                    f"""
+                    SELECT a.{field}_bidx, c.name
+                    FROM account_info a
+                    JOIN chrome_instances c ON c.id = a.instance_id
+                    WHERE a.{field}_bidx IN (
+                        SELECT {field}_bidx FROM account_info
+                        WHERE {field}_bidx IS NOT NULL
+                        GROUP BY {field}_bidx
+                        HAVING COUNT(*) > 1
+                    )
+                    ORDER BY a.{field}_bidx, c.id
+                    """
+                )
+                groups = {}
+                for digest, name in cursor.fetchall():
+                    groups.setdefault(digest, []).append(name)
+                if groups:
+                    report[field] = list(groups.values())
+            return report
+        except sqlite3.Error as e:
+            print(f"查找重复账号出错: {str(e)}")
+            return report
+    
+    def apply_changes(self, changes):
+        """
+        在一个事务中写入变更集
+        
+        Args:
+            changes: persistence.ChangeSet，只包含自上次写入以来变化的记录
+            
+        Returns:
+            bool: 是否写入成功，失败时整个事务回滚
+        """
+        try:
+            self._ensure_connection()
+            cursor = self.conn.cursor()
+            
+            self.conn.execute("BEGIN TRANSACTION")
+            
+            for key, value in changes.config_updates.items():
+                if isinstance(value, (dict, list)):
+                    value = json.dumps(value)
+                cursor.execute(
+                    "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                    (key, str(value))
+                )
+            
+            # 删除实例时账号信息通过外键级联删除
+            if changes.deleted_instances:
+                cursor.executemany(
+                    "DELETE FROM chrome_instances WHERE name = ?",
+                    [(name,) for name in changes.deleted_instances]
+                )
+            
+            if changes.upsert_instances:
+                cursor.executemany(
+                    _UPSERT_INSTANCE_SQL,
+                    [_instance_row(i["name"], i["data_dir"]) for i in changes.upsert_instances]
+                )
+            
+            for name, account_data in changes.upsert_accounts.items():
+                cursor.execute("SELECT id FROM chrome_instances WHERE name = ?", (name,))
+                row = cursor.fetchone()
+                if not row:
+                    continue
+                self._write_account(cursor, row[0], account_data)
+            
+            self.conn.commit()
+            return True
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            print(f"写入变更出错: {str(e)}")
+            return False
+    
     def close(self):
         """关闭数据库连接"""
         if self.conn:
@@ -421,6 +1205,5 @@ class DatabaseManager:
             except:
                 pass
             
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.execute("PRAGMA foreign_keys = ON")
+            self.conn = self._connect()
             print("数据库连接已重新建立") 
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+数据库写线程模块，所有写操作由一个长期运行的线程通过同一个连接串行执行
+"""
+
+import time
+import queue
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class WriteCommand:
+    """一条写命令"""
+
+    def __init__(self, func, callback=None, key=None):
+        self.func = func  # func(db_manager) -> 结果
+        self.callback = callback  # 在主线程中以结果调用
+        self.key = key  # 相同key的未执行命令会被合并，只执行最后一次提交的
+
+
+class DatabaseWriter(QThread):
+    """
+    数据库单写线程
+
+    线程持有一个WAL模式（synchronous=NORMAL）的写连接，从队列中依次取出写命令执行。
+    UI线程只使用只读连接读取，读写互不阻塞。带key的命令在执行前被重复提交时，
+    只保留最后一次提交的内容，短时间内的连续保存合并为一次写入。
+    """
+
+    # 回调, 结果；由写线程发出，在主线程中调用回调
+    _command_done = pyqtSignal(object, object)
+
+    COALESCE_WINDOW = 0.05  # 取到命令后等待同一批次其他命令的时间（秒）
+
+    def __init__(self, db_manager, parent=None):
+        """
+        初始化写线程
+
+        Args:
+            db_manager: 以check_same_thread=False打开的DatabaseManager，之后只由本线程使用
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending_by_key = {}  # key -> 尚未开始执行的命令
+        self._stopping = False
+        self._command_done.connect(self._deliver)
+
+    def submit(self, func, callback=None, key=None):
+        """
+        提交一条写命令
+
+        Args:
+            func: 在写线程中执行的函数，参数为DatabaseManager
+            callback: 执行完成后在主线程中调用的函数，参数为func的返回值（出错时为None）
+            key: 合并键，相同key尚未执行的命令会被本次提交替换
+
+        Returns:
+            bool: 是否已加入队列（写线程停止后返回False）
+        """
+        with self._lock:
+            if self._stopping:
+                print("数据库写线程已停止，忽略写命令")
+                return False
+            if key is not None:
+                pending = self._pending_by_key.get(key)
+                if pending is not None:
+                    pending.func = func
+                    pending.callback = callback
+                    return True
+            command = WriteCommand(func, callback, key)
+            if key is not None:
+                self._pending_by_key[key] = command
+        self._queue.put(command)
+        return True
+
+    def call(self, func, timeout=None):
+        """
+        提交一条写命令并等待其执行完成，只能在工作线程中调用（在主线程中调用会阻塞界面）
+
+        Args:
+            func: 在写线程中执行的函数，参数为DatabaseManager
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            func的返回值；func抛出的异常会在调用线程中重新抛出
+        """
+        done = threading.Event()
+        outcome = {}
+
+        def run(db_manager):
+            try:
+                outcome["result"] = func(db_manager)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        if not self.submit(run):
+            raise RuntimeError("数据库写线程已停止")
+        if not done.wait(timeout):
+            raise TimeoutError("等待数据库写命令超时")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    def stop(self):
+        """执行完队列中剩余的命令后停止线程，并关闭写连接"""
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+        self._queue.put(None)
+        self.wait()
+        self.db_manager.close()
+
+    def run(self):
+        """写线程主循环"""
+        while True:
+            command = self._queue.get()
+            if command is None:
+                break
+
+            # 等待片刻，把同一批次的命令一起取出，期间的重复提交会被合并
+            batch = [command]
+            time.sleep(self.COALESCE_WINDOW)
+            stop_after_batch = False
+            while True:
+                try:
+                    extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    stop_after_batch = True
+                    break
+                batch.append(extra)
+
+            for command in batch:
+                self._execute(command)
+
+            if stop_after_batch:
+                break
+
+    def _execute(self, command):
+        """执行一条命令"""
+        with self._lock:
+            # 开始执行后，新的同key提交需要另起一条命令
+            if command.key is not None and self._pending_by_key.get(command.key) is command:
+                del self._pending_by_key[command.key]
+            func, callback = command.func, command.callback
+
+        try:
+            result = func(self.db_manager)
+        except Exception as e:
+            print(f"执行数据库写命令出错: {str(e)}")
+            result = None
+
+        if callback is not None:
+            self._command_done.emit(callback, result)
+
+    def _deliver(self, callback, result):
+        """在主线程中调用命令回调"""
+        try:
+            callback(result)
+        except Exception as e:
+            print(f"数据库写命令回调出错: {str(e)}")
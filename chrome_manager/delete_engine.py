@@ -0,0 +1,295 @@
+"""
+目录删除引擎，单次遍历目录树并使用线程池并行删除文件
+"""
+
+import os
+import stat
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 每个删除任务包含的文件数
+DEFAULT_CHUNK_SIZE = 256
+
+# 最多保留的错误信息条数
+MAX_ERROR_MESSAGES = 20
+
+# Windows重解析点属性和目录联接(junction)的标记，其他平台上stat结果中没有这些字段
+_FILE_ATTRIBUTE_REPARSE_POINT = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+_IO_REPARSE_TAG_MOUNT_POINT = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+
+def _default_workers():
+    """删除以IO为主，线程数可以多于CPU核数，但过多会加剧磁盘争用"""
+    return min(16, (os.cpu_count() or 4) * 2)
+
+
+class DeleteResult:
+    """一次目录删除的统计结果"""
+
+    def __init__(self, path):
+        self.path = path
+        self.files_deleted = 0
+        self.dirs_deleted = 0
+        self.bytes_freed = 0
+        self.error_count = 0
+        self.errors = []  # 前MAX_ERROR_MESSAGES条错误信息
+        self.cancelled = False
+        self.elapsed = 0.0
+
+    @property
+    def success(self):
+        """目录是否已被完整删除"""
+        return not self.cancelled and not os.path.lexists(self.path)
+
+    def __repr__(self):
+        return (f"DeleteResult(files={self.files_deleted}, dirs={self.dirs_deleted}, "
+                f"bytes={self.bytes_freed}, errors={self.error_count}, "
+                f"cancelled={self.cancelled}, elapsed={self.elapsed:.3f})")
+
+
+def _is_junction_stat(st):
+    """
+    判断lstat结果是否为目录联接
+
+    Python 3.12之前联接不算符号链接，is_dir(follow_symlinks=False)对联接返回True，
+    需要像shutil.rmtree一样检查重解析点标记，避免进入联接删除目标目录中的文件。
+    """
+    return (bool(getattr(st, "st_file_attributes", 0) & _FILE_ATTRIBUTE_REPARSE_POINT)
+            and getattr(st, "st_reparse_tag", None) == _IO_REPARSE_TAG_MOUNT_POINT)
+
+
+def _make_writable_and_retry(func, path):
+    """清除只读属性后重试一次（Windows上只读文件无法直接删除）"""
+    os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+    func(path)
+
+
+class DirectoryDeleter:
+    """
+    目录删除器
+
+    只用os.scandir流式遍历一次目录树，直接使用DirEntry自带的类型信息，
+    不再对每一项额外调用isfile/isdir。文件按块提交给有界线程池并行删除，
+    同时在途的块数受信号量限制，内存占用与目录大小无关。
+    所有文件删除完成后，再由深到浅删除子目录。
+    """
+
+    def __init__(self, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 progress_callback=None, progress_interval=0.3, cancel_event=None):
+        """
+        初始化删除器
+
+        Args:
+            max_workers: 删除线程数，默认根据CPU核数决定
+            chunk_size: 每个删除任务包含的文件数
+            progress_callback: 进度回调 callback(已删除文件数, 已释放字节数)，
+                在调用delete的线程中执行
+            progress_interval: 进度回调的最短间隔（秒）
+            cancel_event: threading.Event，被设置后尽快停止删除
+        """
+        self.max_workers = max_workers or _default_workers()
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.cancel_event = cancel_event or threading.Event()
+        self._lock = threading.Lock()
+        self._last_progress_time = 0
+
+    def cancel(self):
+        """请求取消正在进行的删除"""
+        self.cancel_event.set()
+
+    def delete(self, path):
+        """
+        删除目录及其全部内容
+
+        Args:
+            path: 要删除的目录
+
+        Returns:
+            DeleteResult: 删除统计结果
+        """
+        result = DeleteResult(path)
+        start_time = time.time()
+
+        if not os.path.lexists(path):
+            return result
+        try:
+            is_junction = _is_junction_stat(os.lstat(path))
+        except OSError:
+            is_junction = False
+        if is_junction:
+            self._remove_junction(path, result)
+            result.elapsed = time.time() - start_time
+            return result
+        if os.path.islink(path) or not os.path.isdir(path):
+            self._unlink_path(path, result)
+            result.elapsed = time.time() - start_time
+            return result
+
+        # 限制同时在途的删除块数，防止遍历远快于删除时积压大量DirEntry
+        slots = threading.Semaphore(self.max_workers * 2)
+        directories = []  # 遍历顺序的目录列表，父目录总在子目录之前
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="dir-delete") as executor:
+            def submit(chunk):
+                slots.acquire()
+                future = executor.submit(self._delete_chunk, chunk, result)
+                future.add_done_callback(lambda _: slots.release())
+
+            chunk = []
+            stack = [path]
+            while stack and not self.cancel_event.is_set():
+                current = stack.pop()
+                directories.append(current)
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                is_dir = entry.is_dir(follow_symlinks=False)
+                                # 联接只删除链接本身，不进入目标目录
+                                is_junction = is_dir and _is_junction_stat(entry.stat(follow_symlinks=False))
+                            except OSError:
+                                is_dir = is_junction = False
+                            if is_junction:
+                                self._remove_junction(entry.path, result)
+                                continue
+                            if is_dir:
+                                stack.append(entry.path)
+                                continue
+                            chunk.append(entry)
+                            if len(chunk) >= self.chunk_size:
+                                submit(chunk)
+                                chunk = []
+                                self._report_progress(result)
+                except OSError as e:
+                    self._record_error(result, current, e)
+
+            if chunk and not self.cancel_event.is_set():
+                submit(chunk)
+
+            # 等待在途的删除块完成，期间继续汇报进度
+            for _ in range(self.max_workers * 2):
+                while not slots.acquire(timeout=self.progress_interval):
+                    self._report_progress(result)
+
+        if self.cancel_event.is_set():
+            result.cancelled = True
+        else:
+            # 由深到浅删除目录
+            for directory in reversed(directories):
+                try:
+                    os.rmdir(directory)
+                except PermissionError:
+                    try:
+                        _make_writable_and_retry(os.rmdir, directory)
+                    except OSError as e:
+                        self._record_error(result, directory, e)
+                        continue
+                except OSError as e:
+                    self._record_error(result, directory, e)
+                    continue
+                result.dirs_deleted += 1
+
+        result.elapsed = time.time() - start_time
+        self._report_progress(result, force=True)
+        return result
+
+    def _delete_chunk(self, chunk, result):
+        """在工作线程中删除一块文件"""
+        files_deleted = 0
+        bytes_freed = 0
+        for entry in chunk:
+            if self.cancel_event.is_set():
+                break
+            try:
+                # Windows上DirEntry.stat()使用遍历时缓存的信息，不需要额外系统调用
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                size = 0
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                continue
+            except PermissionError as e:
+                try:
+                    if entry.is_symlink() and os.path.isdir(entry.path):
+                        # Windows上指向目录的符号链接需要用rmdir删除
+                        os.rmdir(entry.path)
+                    else:
+                        _make_writable_and_retry(os.unlink, entry.path)
+                except OSError:
+                    self._record_error(result, entry.path, e)
+                    continue
+            except OSError as e:
+                self._record_error(result, entry.path, e)
+                continue
+            files_deleted += 1
+            bytes_freed += size
+
+        with self._lock:
+            result.files_deleted += files_deleted
+            result.bytes_freed += bytes_freed
+
+    def _remove_junction(self, path, result):
+        """删除目录联接本身，目标目录保持不变"""
+        try:
+            os.rmdir(path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self._record_error(result, path, e)
+            return
+        result.dirs_deleted += 1
+
+    def _unlink_path(self, path, result):
+        """删除单个文件或链接"""
+        try:
+            size = os.lstat(path).st_size
+            try:
+                os.unlink(path)
+            except PermissionError:
+                _make_writable_and_retry(os.unlink, path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self._record_error(result, path, e)
+            return
+        result.files_deleted += 1
+        result.bytes_freed += size
+
+    def _record_error(self, result, path, error):
+        """记录删除错误"""
+        with self._lock:
+            result.error_count += 1
+            if len(result.errors) < MAX_ERROR_MESSAGES:
+                result.errors.append(f"{path}: {error}")
+
+    def _report_progress(self, result, force=False):
+        """按最短间隔调用进度回调"""
+        if self.progress_callback is None:
+            return
+        now = time.time()
+        if not force and now - self._last_progress_time < self.progress_interval:
+            return
+        self._last_progress_time = now
+        try:
+            self.progress_callback(result.files_deleted, result.bytes_freed)
+        except Exception as e:
+            print(f"删除进度回调出错: {str(e)}")
+
+
+def delete_directory(path, **kwargs):
+    """
+    使用DirectoryDeleter删除目录的便捷函数
+
+    Args:
+        path: 要删除的目录
+        **kwargs: 传给DirectoryDeleter的参数
+
+    Returns:
+        DeleteResult: 删除统计结果
+    """
+    return DirectoryDeleter(**kwargs).delete(path)
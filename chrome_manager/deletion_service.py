@@ -0,0 +1,363 @@
+"""
+删除服务模块，所有实例删除共用一个有界工作线程池和优先级队列
+"""
+
+import os
+import time
+import queue
+import itertools
+import threading
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from .delete_engine import DirectoryDeleter
+from .profile_lock import ProfileUsageDetector
+from .trash import move_to_trash, list_tombstones, TrashInUseError
+
+# 任务优先级，数值越小越先执行
+PRIORITY_INTERACTIVE = 0  # 单个删除，用户在等待
+PRIORITY_BATCH = 1  # 批量删除
+PRIORITY_RECLAIM = 2  # 回收刚删除实例的墓碑目录
+PRIORITY_BACKGROUND = 3  # 回收上次未删完的墓碑目录
+
+# 任务类型
+JOB_INSTANCE = "instance"  # 删除快捷方式并把数据目录移入回收站
+JOB_RECLAIM = "reclaim"  # 删除墓碑目录
+
+
+class DeletionJob:
+    """一个删除任务"""
+
+    def __init__(self, kind, name="", data_dir="", shortcut_path=None, tombstone=None,
+                 data_root=None, process_max_age=None, counted=True):
+        self.kind = kind
+        self.name = name
+        self.data_dir = data_dir
+        self.shortcut_path = shortcut_path
+        self.tombstone = tombstone
+        self.data_root = data_root
+        self.process_max_age = process_max_age
+        self.counted = counted  # 是否计入当前批次的进度
+
+
+class _DeletionWorker(QThread):
+    """删除服务的工作线程，从共享队列中取任务执行"""
+
+    def __init__(self, service):
+        super().__init__(service)
+        self.service = service
+
+    def run(self):
+        try:
+            self.setPriority(QThread.Priority.LowPriority)
+        except Exception as e:
+            print(f"设置删除线程优先级失败: {str(e)}")
+
+        while True:
+            job = self.service._next_job()
+            if job is None:
+                break
+            self.service._run_job(job)
+
+
+class DeletionService(QObject):
+    """
+    实例删除服务
+
+    所有删除请求进入同一个优先级队列，由固定数量的工作线程处理，
+    吞吐量只受磁盘限制，而不是定时器间隔。删除分两步：先删除快捷方式并把
+    数据目录重命名为墓碑（瞬间完成），再以较低优先级回收墓碑目录。
+    同一批次内的所有实例汇总成一个进度信号（已完成数/总数/已释放字节数）。
+    """
+
+    # 实例名称, 是否成功, 错误信息；在数据目录移入回收站后立即发出
+    instance_deleted = pyqtSignal(str, bool, str)
+    # 已完成实例数, 本批次实例总数, 已释放字节数
+    progress_changed = pyqtSignal(int, int, object)
+    # 成功数, 失败数, 已释放字节数
+    batch_finished = pyqtSignal(int, int, object)
+
+    DEFAULT_WORKERS = 2  # 工作线程数，删除受磁盘限制，线程多了只会互相争抢
+    DELETER_WORKERS = 4  # 每个墓碑回收任务内部的删除线程数
+    PROGRESS_INTERVAL = 0.3  # 进度信号最短间隔（秒）
+
+    def __init__(self, parent=None, max_workers=DEFAULT_WORKERS, data_root=None):
+        """
+        初始化删除服务
+
+        Args:
+            parent: 父对象
+            max_workers: 工作线程数
+            data_root: 数据根目录，回收站位于其下
+        """
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.data_root = data_root
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()  # 相同优先级按提交顺序执行
+        self._workers = []
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._queued_tombstones = set()
+        self._stopping = False
+        self._reset_batch()
+
+    def _reset_batch(self):
+        """重置批次统计（调用方需持有锁或在初始化中）"""
+        self._total = 0
+        self._done = 0
+        self._failed = 0
+        self._bytes_freed = 0
+        self._inflight_bytes = {}  # id(任务) -> 正在回收的任务已释放的字节数
+        self._last_progress_time = 0
+
+    def set_data_root(self, data_root):
+        """设置数据根目录"""
+        self.data_root = data_root
+
+    def start(self):
+        """启动工作线程"""
+        if self._workers:
+            return
+        for _ in range(self.max_workers):
+            worker = _DeletionWorker(self)
+            worker.start()
+            self._workers.append(worker)
+        print(f"删除服务已启动，{self.max_workers}个工作线程")
+
+    def stop(self):
+        """停止服务，正在回收的墓碑会在下次启动时继续"""
+        self._stopping = True
+        self._cancel_event.set()
+        for _ in self._workers:
+            self._queue.put((-1, next(self._sequence), None))
+        for worker in self._workers:
+            worker.wait()
+        self._workers = []
+
+    def submit(self, name, data_dir, shortcut_path=None, priority=PRIORITY_INTERACTIVE,
+               process_max_age=None):
+        """
+        提交一个实例删除任务
+
+        Args:
+            name: 实例名称
+            data_dir: 数据目录
+            shortcut_path: 快捷方式文件路径
+            priority: 任务优先级
+            process_max_age: 检查实例是否运行时允许的进程快照最长有效时间
+        """
+        job = DeletionJob(
+            JOB_INSTANCE, name, data_dir, shortcut_path,
+            data_root=self.data_root, process_max_age=process_max_age
+        )
+        with self._lock:
+            self._total += 1
+        self._put(priority, job)
+
+    def submit_many(self, items, priority=PRIORITY_BATCH, process_max_age=None):
+        """
+        一次提交多个实例删除任务
+
+        Args:
+            items: [(实例名称, 数据目录, 快捷方式路径)]
+        """
+        for name, data_dir, shortcut_path in items:
+            self.submit(name, data_dir, shortcut_path, priority, process_max_age)
+        self._emit_progress(force=True)
+
+    def scan_trash(self, data_root):
+        """
+        把回收站中残留的墓碑目录加入后台回收队列
+
+        Returns:
+            int: 新加入的墓碑数
+        """
+        added = 0
+        for tombstone in list_tombstones(data_root):
+            with self._lock:
+                if tombstone in self._queued_tombstones:
+                    continue
+                self._queued_tombstones.add(tombstone)
+            self._put(PRIORITY_BACKGROUND, DeletionJob(JOB_RECLAIM, tombstone=tombstone, counted=False))
+            added += 1
+        if added:
+            print(f"回收站中有{added}个待回收目录，继续后台回收")
+        return added
+
+    def cancel_all(self):
+        """
+        取消所有尚未执行的删除任务，并中断正在进行的墓碑回收
+
+        尚未移入回收站的实例保持原样；已经移入回收站的墓碑留在回收站中，
+        下次扫描回收站时继续回收。
+        """
+        cancelled = []
+        while True:
+            try:
+                _, _, job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                cancelled.append(job)
+
+        with self._lock:
+            # 换一个新的取消事件，之后提交的任务不受影响
+            self._cancel_event.set()
+            self._cancel_event = threading.Event()
+            for job in cancelled:
+                if job.kind == JOB_RECLAIM:
+                    self._queued_tombstones.discard(job.tombstone)
+
+        for job in cancelled:
+            if job.kind == JOB_INSTANCE:
+                self.instance_deleted.emit(job.name, False, "已取消")
+                self._finish_job(job, failed=True)
+            else:
+                self._finish_job(job)
+        print(f"已取消{len(cancelled)}个删除任务")
+
+    def pending_count(self):
+        """返回当前批次尚未完成的实例数"""
+        with self._lock:
+            return self._total - self._done
+
+    def _put(self, priority, job):
+        """把任务放入队列"""
+        self._queue.put((priority, next(self._sequence), job))
+
+    def _next_job(self):
+        """工作线程取下一个任务，服务停止时返回None"""
+        _, _, job = self._queue.get()
+        if self._stopping:
+            return None
+        return job
+
+    def _run_job(self, job):
+        """执行一个任务"""
+        try:
+            if job.kind == JOB_INSTANCE:
+                self._run_instance_job(job)
+            else:
+                self._run_reclaim_job(job)
+        except Exception as e:
+            print(f"执行删除任务出错: {str(e)}")
+            if job.kind == JOB_INSTANCE:
+                self.instance_deleted.emit(job.name, False, str(e))
+            else:
+                with self._lock:
+                    self._queued_tombstones.discard(job.tombstone)
+            self._finish_job(job, failed=True)
+
+    def _run_instance_job(self, job):
+        """
+        把数据目录移入回收站，再删除快捷方式
+
+        数据目录无法删除时快捷方式保持不变，实例仍能被启动，也能在同步时被重新发现。
+        """
+        if not os.path.isdir(job.data_dir):
+            self._remove_shortcut(job)
+            self.instance_deleted.emit(job.name, True, "")
+            self._finish_job(job)
+            return
+
+        detector = ProfileUsageDetector(process_max_age=job.process_max_age)
+        if detector.is_in_use(job.data_dir):
+            self.instance_deleted.emit(job.name, False, "Chrome正在运行，无法删除数据目录")
+            self._finish_job(job, failed=True)
+            return
+
+        tombstone = None
+        if job.data_root:
+            try:
+                tombstone = move_to_trash(job.data_dir, job.data_root)
+            except TrashInUseError:
+                self.instance_deleted.emit(job.name, False, "数据目录正在被使用，无法删除")
+                self._finish_job(job, failed=True)
+                return
+
+        if tombstone is None:
+            # 数据目录与回收站不在同一磁盘，直接删除
+            result = self._delete_tree(job, job.data_dir)
+            if result.success:
+                self._remove_shortcut(job)
+            self.instance_deleted.emit(job.name, result.success, "" if result.success else "部分文件无法删除")
+            self._finish_job(job, failed=not result.success, bytes_freed=result.bytes_freed)
+            return
+
+        self._remove_shortcut(job)
+        self.instance_deleted.emit(job.name, True, "")
+        # 实例已经消失，回收墓碑目录后才计入批次完成数
+        job.kind = JOB_RECLAIM
+        job.tombstone = tombstone
+        with self._lock:
+            self._queued_tombstones.add(tombstone)
+        self._put(PRIORITY_RECLAIM, job)
+
+    def _remove_shortcut(self, job):
+        """删除实例的快捷方式文件"""
+        if job.shortcut_path and os.path.exists(job.shortcut_path):
+            try:
+                os.remove(job.shortcut_path)
+            except OSError as e:
+                print(f"快捷方式文件删除失败: {str(e)}")
+
+    def _run_reclaim_job(self, job):
+        """删除墓碑目录"""
+        result = self._delete_tree(job, job.tombstone)
+        if result.success:
+            print(f"已回收 {job.tombstone}: {result.files_deleted}个文件, 耗时{result.elapsed:.2f}秒")
+        elif not result.cancelled:
+            print(f"回收 {job.tombstone} 不完整，{result.error_count}个项目无法删除，下次启动重试")
+        with self._lock:
+            self._queued_tombstones.discard(job.tombstone)
+        self._finish_job(job, bytes_freed=result.bytes_freed)
+
+    def _delete_tree(self, job, path):
+        """用删除引擎删除目录，并把进度汇总到当前批次"""
+        def on_progress(files_deleted, bytes_freed):
+            if job.counted:
+                with self._lock:
+                    self._inflight_bytes[id(job)] = bytes_freed
+                self._emit_progress()
+
+        deleter = DirectoryDeleter(
+            max_workers=self.DELETER_WORKERS,
+            progress_callback=on_progress,
+            progress_interval=self.PROGRESS_INTERVAL,
+            cancel_event=self._cancel_event,
+        )
+        return deleter.delete(path)
+
+    def _finish_job(self, job, failed=False, bytes_freed=0):
+        """记录任务完成，整批完成时发出批次完成信号"""
+        if not job.counted:
+            return
+
+        finished = None
+        with self._lock:
+            self._inflight_bytes.pop(id(job), None)
+            self._done += 1
+            self._bytes_freed += bytes_freed
+            if failed:
+                self._failed += 1
+            if self._done >= self._total:
+                finished = (self._done - self._failed, self._failed, self._bytes_freed)
+                self._reset_batch()
+
+        if finished is not None:
+            self.progress_changed.emit(finished[0] + finished[1], finished[0] + finished[1], finished[2])
+            self.batch_finished.emit(*finished)
+        else:
+            self._emit_progress()
+
+    def _emit_progress(self, force=False):
+        """按最短间隔发出批次进度信号"""
+        with self._lock:
+            now = time.time()
+            if not force and now - self._last_progress_time < self.PROGRESS_INTERVAL:
+                return
+            self._last_progress_time = now
+            done, total = self._done, self._total
+            bytes_freed = self._bytes_freed + sum(self._inflight_bytes.values())
+        if total:
+            self.progress_changed.emit(done, total, bytes_freed)
@@ -0,0 +1,287 @@
+"""
+实例仓库模块，在内存中保存所有Chrome实例并通知各页面增量更新
+"""
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .database_manager import parse_instance_number
+from .process_index import normalize_data_dir
+
+
+class InstanceRecord:
+    """一个Chrome实例，支持按键读取以兼容原来的实例字典"""
+
+    __slots__ = ("name", "data_dir", "instance_number", "data_dir_key")
+
+    def __init__(self, name, data_dir, instance_number=None):
+        self.name = name
+        self.data_dir = data_dir
+        self.instance_number = instance_number
+        self.data_dir_key = normalize_data_dir(data_dir)  # 规范化数据目录，与进程索引的键一致
+
+    @classmethod
+    def from_dict(cls, instance):
+        """从实例字典创建，没有编号时从数据目录或名称解析"""
+        number = instance.get("instance_number")
+        if number is None:
+            number = parse_instance_number(instance["name"], instance.get("data_dir"))
+        return cls(instance["name"], instance["data_dir"], number)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def sort_key(self):
+        """与instance_sort_key和SQL中的默认排序一致：按编号从小到大，没有编号的排在最后"""
+        return (self.instance_number is None, self.instance_number or 0, self.name)
+
+    def to_dict(self):
+        return {"name": self.name, "data_dir": self.data_dir, "instance_number": self.instance_number}
+
+    def __repr__(self):
+        return f"InstanceRecord({self.name!r}, {self.data_dir!r}, {self.instance_number!r})"
+
+
+class InstanceRepository(QObject):
+    """
+    实例仓库
+
+    按名称、编号和规范化数据目录建立索引，增删改都是O(1)，按编号排序的列表在
+    修改后第一次读取时才重新排序。每次操作只发出一个信号，携带受影响的全部记录，
+    页面据此增量更新。
+
+    仓库同时记录自上次写入数据库以来新增、修改和删除的实例，保存配置时
+    PersistenceTracker直接取出这些变更，不需要再与数据库状态逐条比较。
+    只在UI线程中使用。
+    """
+
+    # [InstanceRecord]
+    instances_added = pyqtSignal(list)
+    # [InstanceRecord]，已从仓库中移除的记录
+    instances_removed = pyqtSignal(list)
+    # [InstanceRecord]
+    instances_changed = pyqtSignal(list)
+    # 整个仓库被重新加载
+    instances_reset = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._by_name = {}  # 实例名称 -> 记录
+        self._by_number = {}  # 编号 -> [记录]，数据库中编号冲突时同一编号可能对应多个实例
+        self._by_data_dir = {}  # 规范化数据目录 -> 记录
+        self._sorted = None  # 按编号排序的记录列表缓存
+        self._persisted = {}  # 数据库中的状态：实例名称 -> 数据目录
+        self._dirty = set()  # 需要写入数据库的实例名称
+        self._deleted = set()  # 需要从数据库删除的实例名称
+
+    def load(self, instances):
+        """
+        以从数据库读取的实例替换仓库内容，作为持久化的基准状态
+
+        Args:
+            instances: 实例字典列表
+        """
+        self._by_name.clear()
+        self._by_number.clear()
+        self._by_data_dir.clear()
+        for instance in instances:
+            self._index(InstanceRecord.from_dict(instance))
+        self._sorted = None
+        self._persisted = {name: record.data_dir for name, record in self._by_name.items()}
+        self._dirty.clear()
+        self._deleted.clear()
+        self.instances_reset.emit()
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __bool__(self):
+        return bool(self._by_name)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        """按编号顺序遍历"""
+        return iter(self.sorted_records())
+
+    def get(self, name):
+        """按名称查找"""
+        return self._by_name.get(name)
+
+    def by_number(self, number):
+        """按编号查找，同一编号有多个实例时返回最先加入的一个"""
+        records = self._by_number.get(number)
+        return records[0] if records else None
+
+    def next_free_number(self, start=1):
+        """返回不小于start的最小未使用编号，与内存中的实例保持一致，不必等待写线程"""
+        number = start
+        while number in self._by_number:
+            number += 1
+        return number
+
+    def by_data_dir(self, data_dir):
+        """按数据目录查找（路径会被规范化）"""
+        return self._by_data_dir.get(normalize_data_dir(data_dir))
+
+    def by_data_dir_key(self, data_dir_key):
+        """按已规范化的数据目录键查找（进程索引和资源监控使用的键）"""
+        return self._by_data_dir.get(data_dir_key)
+
+    def names(self):
+        """所有实例名称（集合视图）"""
+        return self._by_name.keys()
+
+    def sorted_records(self):
+        """按编号排序的记录列表（内部缓存，调用方不得修改）"""
+        if self._sorted is None:
+            self._sorted = sorted(self._by_name.values(), key=InstanceRecord.sort_key)
+        return self._sorted
+
+    def add(self, instance, persisted=False):
+        """添加一个实例，参数同add_many，返回添加的记录或None"""
+        added = self.add_many([instance], persisted)
+        return added[0] if added else None
+
+    def add_many(self, instances, persisted=False):
+        """
+        添加实例，名称或数据目录已存在的实例被跳过
+
+        Args:
+            instances: 实例字典或InstanceRecord列表
+            persisted: 实例是否已经由其他途径写入数据库（如批量创建），为True时不再写入
+
+        Returns:
+            list: 添加的记录
+        """
+        added = []
+        for instance in instances:
+            record = instance if isinstance(instance, InstanceRecord) else InstanceRecord.from_dict(instance)
+            if record.name in self._by_name or record.data_dir_key in self._by_data_dir:
+                continue
+            self._index(record)
+            self._deleted.discard(record.name)
+            if persisted:
+                self._persisted[record.name] = record.data_dir
+                self._dirty.discard(record.name)
+            else:
+                self._dirty.add(record.name)
+            added.append(record)
+
+        if added:
+            self._sorted = None
+            self.instances_added.emit(added)
+        return added
+
+    def remove(self, name):
+        """移除一个实例，返回被移除的记录或None"""
+        removed = self.remove_many([name])
+        return removed[0] if removed else None
+
+    def remove_many(self, names):
+        """
+        移除实例，不存在的名称被忽略
+
+        Returns:
+            list: 被移除的记录
+        """
+        removed = []
+        for name in names:
+            record = self._by_name.pop(name, None)
+            if record is None:
+                continue
+            self._unindex_number(record)
+            if self._by_data_dir.get(record.data_dir_key) is record:
+                del self._by_data_dir[record.data_dir_key]
+            self._dirty.discard(name)
+            if name in self._persisted:
+                self._deleted.add(name)
+            removed.append(record)
+
+        if removed:
+            self._sorted = None
+            self.instances_removed.emit(removed)
+        return removed
+
+    def update(self, name, data_dir):
+        """
+        修改实例的数据目录
+
+        Returns:
+            InstanceRecord或None: 修改后的记录，实例不存在或目录被其他实例使用时返回None
+        """
+        record = self._by_name.get(name)
+        key = normalize_data_dir(data_dir)
+        if record is None or self._by_data_dir.get(key, record) is not record:
+            return None
+        if record.data_dir == data_dir:
+            return record
+
+        self._by_name.pop(name)
+        self._unindex_number(record)
+        self._by_data_dir.pop(record.data_dir_key, None)
+        record.data_dir = data_dir
+        record.data_dir_key = key
+        record.instance_number = parse_instance_number(name, data_dir)
+        self._index(record)
+        self._dirty.add(name)
+        self._sorted = None
+        self.instances_changed.emit([record])
+        return record
+
+    def pending_changes(self):
+        """
+        自上次写入以来的变更
+
+        Returns:
+            tuple: ([需要写入的实例字典], [需要删除的实例名称])
+        """
+        upserts = []
+        for name in self._dirty:
+            record = self._by_name[name]
+            if self._persisted.get(name) != record.data_dir:
+                upserts.append({"name": name, "data_dir": record.data_dir})
+        return upserts, list(self._deleted)
+
+    def mark_persisted(self, upserts, deleted):
+        """
+        变更已写入数据库，合并到基准状态
+
+        写入期间又被修改或重新添加的实例保留待写入标记，等待下一次保存。
+        """
+        for name in deleted:
+            self._persisted.pop(name, None)
+            if name not in self._by_name:
+                self._deleted.discard(name)
+        for instance in upserts:
+            name = instance["name"]
+            self._persisted[name] = instance["data_dir"]
+            record = self._by_name.get(name)
+            if record is not None and record.data_dir == instance["data_dir"]:
+                self._dirty.discard(name)
+
+    def _index(self, record):
+        self._by_name[record.name] = record
+        if record.instance_number is not None:
+            self._by_number.setdefault(record.instance_number, []).append(record)
+        self._by_data_dir[record.data_dir_key] = record
+
+    def _unindex_number(self, record):
+        """从编号索引中移除记录，同一编号的其他实例仍可被查到"""
+        records = self._by_number.get(record.instance_number)
+        if records is None:
+            return
+        try:
+            records.remove(record)
+        except ValueError:
+            return
+        if not records:
+            del self._by_number[record.instance_number]
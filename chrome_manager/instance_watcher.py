@@ -0,0 +1,91 @@
+"""
+实例状态监视模块，在后台检测Chrome实例的启动/退出并通知UI
+"""
+
+import time
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .process_index import get_process_index
+
+
+class InstanceStateWatcher(QThread):
+    """
+    实例运行状态监视线程
+
+    周期性刷新进程索引，与上一次快照比较，只把状态发生变化的实例
+    通过一个批量信号发送给UI。刷新间隔自适应：启动浏览器后短时间内
+    快速刷新，状态长时间不变时逐步放慢。
+    """
+
+    # {规范化数据目录: 是否正在运行}，只包含状态发生变化的实例
+    states_changed = pyqtSignal(dict)
+
+    MIN_INTERVAL = 0.5  # 最短刷新间隔（秒）
+    MAX_INTERVAL = 10.0  # 最长刷新间隔（秒）
+    LAUNCH_BOOST_DURATION = 15.0  # 启动浏览器后保持快速刷新的时长（秒）
+
+    def __init__(self, parent=None, process_index=None):
+        """
+        初始化状态监视线程
+
+        Args:
+            parent: 父对象
+            process_index: 使用的进程索引，默认使用全局共享索引
+        """
+        super().__init__(parent)
+        self.process_index = process_index or get_process_index()
+        self._running_dirs = set()
+        self._interval = self.MIN_INTERVAL
+        self._boost_until = 0
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def running_data_dirs(self):
+        """返回最近一次检测到的运行中数据目录集合（副本）"""
+        return set(self._running_dirs)
+
+    def notify_launch(self):
+        """通知监视线程刚启动了浏览器，立即进入快速刷新"""
+        self._boost_until = time.time() + self.LAUNCH_BOOST_DURATION
+        self._interval = self.MIN_INTERVAL
+        self._wake_event.set()
+
+    def stop(self):
+        """停止监视线程并等待其退出"""
+        self._stop_event.set()
+        self._wake_event.set()
+        self.wait()
+
+    def run(self):
+        """监视循环"""
+        try:
+            self.setPriority(QThread.Priority.LowPriority)
+        except Exception as e:
+            print(f"设置状态监视线程优先级失败: {str(e)}")
+
+        while not self._stop_event.is_set():
+            try:
+                running = set(self.process_index.refresh().keys())
+            except Exception as e:
+                print(f"刷新实例运行状态出错: {str(e)}")
+                running = self._running_dirs
+
+            started = running - self._running_dirs
+            stopped = self._running_dirs - running
+            self._running_dirs = running
+
+            if started or stopped:
+                changes = {data_dir: True for data_dir in started}
+                changes.update({data_dir: False for data_dir in stopped})
+                self.states_changed.emit(changes)
+                # 状态有变化，说明用户正在操作，保持快速刷新
+                self._interval = self.MIN_INTERVAL
+            elif time.time() < self._boost_until:
+                self._interval = self.MIN_INTERVAL
+            else:
+                # 状态稳定，逐步放慢刷新
+                self._interval = min(self._interval * 2, self.MAX_INTERVAL)
+
+            self._wake_event.wait(self._interval)
+            self._wake_event.clear()
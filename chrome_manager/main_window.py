@@ -10,9 +10,9 @@ import subprocess
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QStackedWidget, QStyleFactory, QDialog, QFrame, QPushButton,
-    QApplication, QStatusBar, QMessageBox, QScrollArea
+    QStatusBar, QMessageBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, QUrl, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QUrl, QTimer
 from PyQt6.QtGui import QFont, QPixmap, QDesktopServices, QIcon
 
 from .constants import (
@@ -24,11 +24,15 @@ from .constants import (
 from .config import ConfigManager
 from .shortcuts import ShortcutManager
 from .ui.components import ModernButton
+from .ui.icon_cache import IconCache
 from .ui.message import MessageDialogs
-from .ui.pages import HomePage, SettingsPage, AccountPage, ScriptPage
+from .ui.pages import HomePage, SettingsPage, AccountPage, ScriptPage, MonitorPage
 from .utils import get_system_info
-from .database_manager import DatabaseManager
 from .app_updater import AppUpdater
+from .instance_watcher import InstanceStateWatcher
+from .resource_monitor import ResourceMonitor, InstanceResourceModel
+from .trash import is_trash_dir_name
+from .deletion_service import DeletionService
 
 class ChromeShortcutManager(QMainWindow):
     """Chrome多实例快捷方式管理器主窗口类"""
@@ -67,7 +71,7 @@ class ChromeShortcutManager(QMainWindow):
         self.chrome_path = self.find_chrome_path()  # 使用函数查找Chrome路径
         self.data_root = os.getcwd()  # 默认使用当前目录
         self.user_modified_data_root = False
-        self.shortcuts = []
+        self.instances = []  # 实例仓库，加载配置后为config_manager.instances
         self.account_info = {}  # 确保账号信息有默认值
         self.current_page_index = 0
         
@@ -82,9 +86,21 @@ class ChromeShortcutManager(QMainWindow):
             # 打印系统信息
             self._print_system_info()
             
+            # 实例资源占用模型，由监控页面和主页卡片共享
+            self.resource_model = InstanceResourceModel(self)
+            
+            # Chrome图标缓存，所有卡片共用一个图标
+            self.icon_cache = IconCache(os.path.join(self.config_manager.config_dir, 'icon_cache'))
+            
             # 创建UI
             self.init_ui()
             
+            # 共享删除服务，需在加载配置前创建，同步文件系统时会扫描回收站中残留的墓碑
+            self.deletion_service = DeletionService(self)
+            self.deletion_service.progress_changed.connect(self.shortcut_manager.on_delete_progress)
+            self.deletion_service.instance_deleted.connect(self.shortcut_manager.on_instance_deleted)
+            self.deletion_service.batch_finished.connect(self.shortcut_manager.on_delete_batch_finished)
+            
             # 加载配置
             self.load_config()
             
@@ -95,6 +111,30 @@ class ChromeShortcutManager(QMainWindow):
             self.auto_save_timer = QTimer(self)
             self.auto_save_timer.timeout.connect(self.auto_save_config)
             self.auto_save_timer.start(30000)  # 每30秒自动保存一次
+            
+            # 启动实例运行状态监视线程
+            self.instance_watcher = InstanceStateWatcher(self)
+            self.instance_watcher.states_changed.connect(
+                self.home_page.on_instance_states_changed,
+                type=Qt.ConnectionType.QueuedConnection
+            )
+            self.instance_watcher.start()
+
+            # 启动实例资源监控线程
+            self.resource_monitor = ResourceMonitor(self)
+            self.resource_monitor.sample_ready.connect(
+                self.resource_model.update_sample,
+                type=Qt.ConnectionType.QueuedConnection
+            )
+            self.resource_model.usage_changed.connect(self.home_page.on_resource_usage_changed)
+            self.resource_monitor.start()
+            
+            # 删除服务的结果同步到主页
+            self.deletion_service.instance_deleted.connect(self.home_page.on_instance_deleted)
+            self.deletion_service.batch_finished.connect(self.home_page.on_deletion_batch_finished)
+            
+            # 启动删除服务，继续回收上次未删完的目录
+            self.deletion_service.start()
 
             # 初始化应用更新器
             self.app_updater = AppUpdater(self)
@@ -212,11 +252,13 @@ class ChromeShortcutManager(QMainWindow):
         self.home_btn = self.create_menu_button("主页", True)
         self.account_btn = self.create_menu_button("账号管理")
         self.script_btn = self.create_menu_button("脚本插件")  
+        self.monitor_btn = self.create_menu_button("资源监控")
         self.settings_btn = self.create_menu_button("设置")
         
         sidebar_layout.addWidget(self.home_btn)
         sidebar_layout.addWidget(self.account_btn)
         sidebar_layout.addWidget(self.script_btn)  
+        sidebar_layout.addWidget(self.monitor_btn)
         sidebar_layout.addWidget(self.settings_btn)
         
         # 添加弹性空间
@@ -286,6 +328,7 @@ class ChromeShortcutManager(QMainWindow):
         self.account_btn.clicked.connect(lambda: self.switch_page(1))
         self.script_btn.clicked.connect(lambda: self.switch_page(2))
         self.settings_btn.clicked.connect(lambda: self.switch_page(3))
+        self.monitor_btn.clicked.connect(lambda: self.switch_page(4))
 
     def create_menu_button(self, text, is_active=False):
         """创建菜单按钮"""
@@ -360,6 +403,10 @@ class ChromeShortcutManager(QMainWindow):
         settings_scroll.setStyleSheet("QScrollArea {background-color: transparent; border: none;}")
         self.content_stack.addWidget(settings_scroll)
         
+        # 资源监控页面，表格自带滚动，不需要滚动区域
+        self.monitor_page = MonitorPage(self, self.resource_model)
+        self.content_stack.addWidget(self.monitor_page)
+        
         # 设置默认页面
         self.content_stack.setCurrentIndex(0)
         
@@ -368,7 +415,8 @@ class ChromeShortcutManager(QMainWindow):
             self.home_page.update_browser_grid,
             self.account_page.update_cards,
             self.script_page.update,
-            self.settings_page.update_ui
+            self.settings_page.update_ui,
+            self.monitor_page.update_page
         ]
 
     def switch_page(self, index):
@@ -380,6 +428,7 @@ class ChromeShortcutManager(QMainWindow):
         self.account_btn.setChecked(index == 1)
         self.script_btn.setChecked(index == 2)
         self.settings_btn.setChecked(index == 3)
+        self.monitor_btn.setChecked(index == 4)
         
         # 如果切换到账号管理页面，更新账号卡片
         if index == 1:
@@ -389,17 +438,20 @@ class ChromeShortcutManager(QMainWindow):
         if index == 3:
             self.settings_page.update_ui()
             
-        # 如果切换到首页，更新浏览器网格
-        if index == 0:
-            self.home_page.update_browser_grid()
+        # 如果切换到资源监控页面，刷新实例名称
+        if index == 4:
+            self.monitor_page.update_page()
+        
+        # 首页的实例列表模型跟随实例仓库实时更新，切换回首页时不需要重建
 
     def update_ui(self):
         """更新所有UI页面"""
         # 更新首页
         self.home_page.update_browser_grid()
         
-        # 更新账号页
-        self.account_page.update_cards()
+        # 更新账号页，不在账号页时切换过去再创建卡片，避免启动时解密账号
+        if self.content_stack.currentIndex() == 1:
+            self.account_page.update_cards()
         
         # 更新设置页
         self.settings_page.update_ui()
@@ -426,10 +478,9 @@ class ChromeShortcutManager(QMainWindow):
                 self.shortcut_manager.set_shortcuts_dir(shortcuts_dir)
             print(f"加载配置 - 快捷方式目录: {self.shortcuts_dir}")
             
-            # 加载快捷方式
-            self.shortcuts = config.get('shortcuts', [])
-            print(f"加载配置 - 快捷方式数量: {len(self.shortcuts)}")
-            print(f"加载配置 - 快捷方式详情: {[s.get('name') for s in self.shortcuts]}")
+            # 加载实例仓库
+            self.instances = self.config_manager.instances
+            print(f"加载配置 - 快捷方式数量: {len(self.instances)}")
             
             # 新增：检查文件系统中是否存在数据目录和快捷方式
             self._sync_shortcuts_with_filesystem()
@@ -443,8 +494,8 @@ class ChromeShortcutManager(QMainWindow):
             import traceback
             traceback.print_exc()
             # 在出错时使用默认配置
-            self.shortcuts = []
-            self.account_info = {}
+            self.instances = self.config_manager.instances
+            self.account_info = self.config_manager.account_store
     
     def _sync_shortcuts_with_filesystem(self):
         """
@@ -454,26 +505,28 @@ class ChromeShortcutManager(QMainWindow):
         """
         try:
             print("开始同步快捷方式与文件系统...")
-            valid_shortcuts = []
-            shortcut_names = set()
+            invalid_names = set()
+            discovered = []
             
             # 1. 验证现有快捷方式
-            for shortcut in self.shortcuts:
-                name = shortcut.get('name')
-                data_dir = shortcut.get('data_dir')
+            for record in self.instances:
+                name = record.name
                 shortcut_path = os.path.join(self.shortcuts_dir, f"{name}.lnk")
                 
                 # 检查数据目录或快捷方式文件是否存在
-                if os.path.exists(data_dir) or os.path.exists(shortcut_path):
-                    valid_shortcuts.append(shortcut)
-                    shortcut_names.add(name)
-                    print(f"  验证快捷方式: {name} - 有效")
-                else:
+                if not (os.path.exists(record.data_dir) or os.path.exists(shortcut_path)):
+                    invalid_names.add(name)
                     print(f"  验证快捷方式: {name} - 无效(文件不存在)")
             
             # 2. 扫描文件系统中的数据目录
             if os.path.exists(self.data_root):
+                # 回收站中的墓碑目录交给回收线程，不参与实例扫描
+                if hasattr(self, 'deletion_service'):
+                    self.deletion_service.scan_trash(self.data_root)
+                
                 for item in os.listdir(self.data_root):
+                    if is_trash_dir_name(item):
+                        continue
                     full_path = os.path.join(self.data_root, item)
                     # 只检查目录且以Profile开头
                     if os.path.isdir(full_path) and item.startswith("Profile"):
@@ -483,19 +536,19 @@ class ChromeShortcutManager(QMainWindow):
                             # 构建快捷方式名称
                             shortcut_name = f"Chrome实例{profile_num}"
                             
-                            # 检查这个名称是否已经在列表中
-                            if shortcut_name not in shortcut_names:
+                            # 检查这个名称或目录是否已经在仓库中
+                            if (shortcut_name not in self.instances or shortcut_name in invalid_names) \
+                                    and self.instances.by_data_dir(full_path) is None:
                                 print(f"  发现未记录的数据目录: {item}, 对应实例名: {shortcut_name}")
                                 # 检查快捷方式是否存在
                                 shortcut_path = os.path.join(self.shortcuts_dir, f"{shortcut_name}.lnk")
                                 if os.path.exists(shortcut_path):
-                                    # 添加到列表中
-                                    new_shortcut = {
+                                    # 添加到仓库中
+                                    discovered.append({
                                         "name": shortcut_name,
-                                        "data_dir": full_path
-                                    }
-                                    valid_shortcuts.append(new_shortcut)
-                                    shortcut_names.add(shortcut_name)
+                                        "data_dir": full_path,
+                                        "instance_number": profile_num
+                                    })
                                     print(f"  添加发现的快捷方式: {shortcut_name}")
                                 else:
                                     print(f"  数据目录存在但无对应快捷方式: {item}")
@@ -503,10 +556,12 @@ class ChromeShortcutManager(QMainWindow):
                             # 如果无法从目录名提取数字，则跳过
                             pass
             
-            # 如果发现有差异，更新内存中的列表并保存到数据库
-            if len(valid_shortcuts) != len(self.shortcuts):
-                print(f"快捷方式列表已更新: {len(self.shortcuts)} -> {len(valid_shortcuts)}")
-                self.shortcuts = valid_shortcuts
+            # 如果发现有差异，更新仓库并保存到数据库
+            if invalid_names or discovered:
+                before = len(self.instances)
+                self.instances.remove_many(invalid_names)
+                self.instances.add_many(discovered)
+                print(f"快捷方式列表已更新: {before} -> {len(self.instances)}")
                 # 立即保存更新后的列表到数据库
                 self.auto_save_config()
                 print("已保存更新后的快捷方式列表")
@@ -517,126 +572,26 @@ class ChromeShortcutManager(QMainWindow):
             import traceback
             traceback.print_exc()
 
-    # 修改ConfigSaveThread类
-    class ConfigSaveThread(QThread):
-        """配置保存线程"""
-        
-        save_finished = pyqtSignal(bool, str)  # 保存完成信号
-        
-        def __init__(self, config_data, config_dir):
-            super().__init__()
-            self.config_data = config_data
-            self.config_dir = config_dir  # 保存配置目录路径而非配置管理器实例
-            
-        def run(self):
-            """运行线程，保存配置"""
-            try:
-                # 创建一个新的数据库管理器实例
-                db_manager = DatabaseManager(self.config_dir)
-                
-                print(f"\n============ 开始保存配置 ============")
-                print(f"保存配置 - Chrome路径: {self.config_data.get('chrome_path')}")
-                print(f"保存配置 - 数据根目录: {self.config_data.get('data_root')}")
-                print(f"保存配置 - 快捷方式列表数量: {len(self.config_data.get('shortcuts', []))}")
-                print(f"保存配置 - 快捷方式详情: {[s.get('name') for s in self.config_data.get('shortcuts', [])]}")
-                
-                # 确保数据根目录不为空
-                if not self.config_data.get('data_root'):
-                    self.config_data['data_root'] = os.getcwd()
-                    print(f"数据根目录为空，使用当前目录: {self.config_data['data_root']}")
-                
-                # 确保目录存在
-                if not os.path.exists(self.config_data.get('data_root')):
-                    try:
-                        os.makedirs(self.config_data.get('data_root'), exist_ok=True)
-                        print(f"创建数据根目录: {self.config_data.get('data_root')}")
-                    except Exception as e:
-                        print(f"创建数据根目录失败: {str(e)}")
-                
-                # 保存Chrome实例信息
-                # 先清空现有实例
-                print(f"正在清空数据库中的Chrome实例数据")
-                db_manager.clear_chrome_instances()
-                
-                # 重新添加所有实例
-                print(f"开始保存{len(self.config_data.get('shortcuts', []))}个Chrome实例到数据库")
-                for shortcut in self.config_data.get('shortcuts', []):
-                    print(f"  保存实例: {shortcut.get('name')}")
-                    db_manager.save_chrome_instance(shortcut)
-                
-                # 保存账号信息
-                for name, account_data in self.config_data.get('account_info', {}).items():
-                    if any(s["name"] == name for s in self.config_data.get('shortcuts', [])):
-                        db_manager.save_account_info(name, account_data)
-                
-                # 保存其他配置
-                db_manager.save_config(self.config_data)
-                
-                print("配置已成功保存")
-                print(f"============ 配置保存结束 ============\n")
-                
-                # 关闭数据库连接
-                db_manager.close()
-                
-                self.save_finished.emit(True, "")
-            except Exception as e:
-                error_msg = f"保存配置失败：{str(e)}"
-                print(f"保存配置错误: {error_msg}")
-                import traceback
-                traceback.print_exc()
-                self.save_finished.emit(False, str(e))
-
-    def auto_save_config(self):
-        """自动保存配置"""
-        print(f"准备保存配置...")
-        print(f"当前快捷方式列表: {[s['name'] for s in self.shortcuts]}")
-        
-        # 处理一些UI事件，确保界面响应
-        QApplication.processEvents()
-        
-        config = {
+    def current_config(self):
+        """返回当前内存中的配置字典"""
+        return {
             'chrome_path': self.chrome_path,
-            'data_root': self.data_root,
+            'data_root': self.data_root or os.getcwd(),
             'user_modified_data_root': self.user_modified_data_root,
             'shortcuts_dir': self.shortcuts_dir,
-            'shortcuts': self.shortcuts,
+            'shortcuts': self.instances,
             'account_info': self.account_info
         }
-        
-        # 创建后台线程保存配置，传递配置目录路径而非配置管理器实例
-        self.save_thread = self.ConfigSaveThread(config, self.config_manager.config_dir)
-        self.save_thread.save_finished.connect(self._on_save_finished, type=Qt.ConnectionType.QueuedConnection)
-        self.save_thread.start()
-        
-        # 立即返回，不阻塞UI
-        QApplication.processEvents()
-
-    def _on_save_finished(self, success, error):
-        """配置保存完成回调"""
-        if success:
-            print(f"配置已保存到数据库")
-            print(f"已保存配置 - Chrome路径: {self.chrome_path}")
-            print(f"已保存配置 - 数据根目录: {self.data_root}")
-            print(f"已保存配置 - 快捷方式目录: {self.shortcuts_dir}")
-            print(f"已保存配置 - 快捷方式列表: {[s['name'] for s in self.shortcuts]}")
-        else:
-            print(f"保存配置失败: {error}")
-        
-        # 确保UI处理所有事件
-        QApplication.processEvents()
 
-    def changeEvent(self, event):
-        """窗口状态改变事件（最大化/还原）"""
-        if event.type() == event.Type.WindowStateChange:
-            # 窗口状态改变时更新网格布局
-            self.home_page.update_browser_grid()
-        super().changeEvent(event)
+    def auto_save_config(self):
+        """自动保存配置，只把自上次保存以来发生变化的记录交给数据库写线程"""
+        self.config_manager.save_config(self.current_config())
 
     def closeEvent(self, event):
         """窗口关闭事件"""
         try:
-            # 保存配置
-            self.auto_save_config()
+            # 把剩余的变更交给写线程，关闭前写线程会执行完队列
+            self.config_manager.save_config(self.current_config())
             
             # 显示最终性能报告
             print("\n=== 性能报告 ===")
@@ -645,6 +600,29 @@ class ChromeShortcutManager(QMainWindow):
             # 确保相关资源被释放
             if hasattr(self, 'auto_save_timer'):
                 self.auto_save_timer.stop()
+            
+            # 停止实例状态监视线程
+            if hasattr(self, 'instance_watcher'):
+                self.instance_watcher.stop()
+            
+            # 停止资源监控线程
+            if hasattr(self, 'resource_monitor'):
+                self.resource_monitor.stop()
+            
+            # 停止删除服务，未删完的墓碑下次启动继续回收
+            if hasattr(self, 'deletion_service'):
+                self.deletion_service.stop()
+            
+            # 取消正在进行的批量创建，等待线程池中正在写入的快捷方式完成
+            if hasattr(self, 'home_page'):
+                self.home_page.stop_bulk_create()
+            
+            # 取消正在进行的导入导出，当前批次写完后线程退出（需在写线程停止前等待）
+            if hasattr(self, 'account_page'):
+                self.account_page.stop_transfer()
+            
+            # 等待数据库写线程写完队列中的变更并关闭连接
+            self.config_manager.close()
                 
             # 接受关闭事件
             event.accept()
@@ -0,0 +1,103 @@
+"""
+持久化变更跟踪模块，只把自上次写入以来发生变化的实例、账号和配置写入数据库
+"""
+
+import copy
+import json
+
+# 以键值对形式保存在config表中的配置项
+CONFIG_KEYS = ("chrome_path", "data_root", "user_modified_data_root", "shortcuts_dir")
+
+
+def _stored_value(value):
+    """配置项在config表中的存储形式（与DatabaseManager.save_config一致）"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+class ChangeSet:
+    """一次写入需要执行的变更"""
+
+    def __init__(self):
+        self.config_updates = {}  # 配置项 -> 新值
+        self.upsert_instances = []  # 新增或修改的实例字典
+        self.deleted_instances = []  # 被删除的实例名称
+        self.upsert_accounts = {}  # 实例名称 -> 规范化的账号信息
+
+    def is_empty(self):
+        """是否没有任何需要写入的变更"""
+        return not (self.config_updates or self.upsert_instances
+                    or self.deleted_instances or self.upsert_accounts)
+
+    def summary(self):
+        """变更摘要，用于日志"""
+        return (f"配置{len(self.config_updates)}项, 实例新增/修改{len(self.upsert_instances)}个, "
+                f"实例删除{len(self.deleted_instances)}个, 账号{len(self.upsert_accounts)}个")
+
+
+class PersistenceTracker:
+    """
+    持久化变更跟踪器
+
+    在内存中保存最后一次成功写入数据库的配置项，保存时与当前状态比较，
+    只生成需要upsert/delete的记录。没有任何修改时生成空的变更集，
+    调用方可以完全跳过数据库写入。实例的增删由InstanceRepository记录，
+    账号信息的修改由AccountStore记录，比较时不需要遍历实例或解密任何账号。
+    """
+
+    def __init__(self, account_store, instances):
+        """
+        Args:
+            account_store: AccountStore，记录尚未写入的账号修改
+            instances: InstanceRepository，记录尚未写入的实例增删
+        """
+        self.account_store = account_store
+        self.instances = instances
+        self._config = {}
+
+    def reset(self, config):
+        """
+        以从数据库加载的配置作为基准状态
+
+        Args:
+            config: ConfigManager.load_config返回的配置字典
+        """
+        self._config = {key: _stored_value(config[key]) for key in CONFIG_KEYS if key in config}
+
+    def diff(self, config):
+        """
+        计算当前配置相对于基准状态的变更
+
+        Args:
+            config: 当前配置字典，实例和账号信息分别从仓库和账号存储中读取
+
+        Returns:
+            ChangeSet: 变更集（值均为副本，之后修改内存状态不会影响它）
+        """
+        changes = ChangeSet()
+
+        for key in CONFIG_KEYS:
+            # 按存储形式比较，避免布尔值等读回后类型不同造成的重复写入
+            if key in config and _stored_value(config[key]) != self._config.get(key):
+                changes.config_updates[key] = copy.deepcopy(config[key])
+
+        changes.upsert_instances, changes.deleted_instances = self.instances.pending_changes()
+
+        # 只保存仍然存在的实例的账号信息，与原来的保存逻辑一致
+        for name, account in self.account_store.modified_items():
+            if name in self.instances:
+                changes.upsert_accounts[name] = account
+
+        return changes
+
+    def mark_persisted(self, changes):
+        """把已成功写入数据库的变更合并到基准状态"""
+        for key, value in changes.config_updates.items():
+            self._config[key] = _stored_value(value)
+        self.instances.mark_persisted(changes.upsert_instances, changes.deleted_instances)
+        for name in changes.deleted_instances:
+            if name not in self.instances:
+                self.account_store.discard(name)
+        for name, account in changes.upsert_accounts.items():
+            self.account_store.mark_persisted(name, account)
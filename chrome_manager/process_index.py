@@ -0,0 +1,391 @@
+"""
+进程索引模块，一次扫描建立 数据目录 -> Chrome进程 的映射
+"""
+
+import os
+import sys
+import time
+import threading
+import psutil
+
+# 共享快照默认最长有效时间（秒）
+DEFAULT_MAX_AGE = 2.0
+
+# 命令行参数标记
+USER_DATA_DIR_FLAG = "--user-data-dir="
+PROCESS_TYPE_FLAG = "--type="
+
+# 进程名过滤关键字
+CHROME_NAME_MARKERS = ("chrome", "chromium")
+
+
+def normalize_data_dir(path):
+    """
+    将数据目录路径规范化为索引键
+
+    Args:
+        path: 数据目录路径，可能带引号或多余的分隔符
+
+    Returns:
+        str: 规范化后的路径，空路径返回空字符串
+    """
+    if not path:
+        return ""
+    path = path.strip().strip('"').strip("'")
+    if not path:
+        return ""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def is_chrome_process_name(name):
+    """根据进程名判断是否为Chrome/Chromium进程"""
+    if not name:
+        return False
+    name = name.lower()
+    return any(marker in name for marker in CHROME_NAME_MARKERS)
+
+
+def parse_chrome_cmdline(cmdline):
+    """
+    解析Chrome命令行，提取数据目录和进程类型
+
+    Args:
+        cmdline: 命令行参数列表
+
+    Returns:
+        tuple: (规范化的数据目录或None, 是否为浏览器主进程)
+    """
+    data_dir = None
+    is_browser = True
+    for arg in cmdline or ():
+        if not isinstance(arg, str):
+            continue
+        if arg.startswith(USER_DATA_DIR_FLAG):
+            data_dir = normalize_data_dir(arg[len(USER_DATA_DIR_FLAG):]) or None
+        elif arg.startswith(PROCESS_TYPE_FLAG):
+            # 渲染/GPU/工具等子进程都带有--type参数，主进程没有
+            is_browser = False
+    return data_dir, is_browser
+
+
+class PsutilProcessScanner:
+    """
+    基于psutil的进程扫描后端，所有平台可用
+
+    每个进程都会构造一个psutil.Process对象，进程很多时开销较大，
+    作为默认和备用后端。
+    """
+
+    name = "psutil"
+
+    def iter_chrome_processes(self):
+        """
+        逐个产出名称匹配的Chrome进程
+
+        Yields:
+            tuple: (pid, 父进程pid, 创建时间, 读取命令行用的句柄)
+        """
+        for proc in psutil.process_iter(['name', 'ppid', 'create_time']):
+            try:
+                if not is_chrome_process_name(proc.info['name']):
+                    continue
+                yield proc.pid, proc.info['ppid'], proc.info['create_time'], proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+    def read_cmdline(self, handle):
+        """
+        读取进程命令行
+
+        Returns:
+            list或None: 命令行参数，无权读取时返回None
+
+        Raises:
+            ProcessLookupError: 进程已经退出
+        """
+        try:
+            return handle.cmdline()
+        except psutil.AccessDenied:
+            return None
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            raise ProcessLookupError(handle.pid)
+
+
+class ProcfsProcessScanner:
+    """
+    直接读取/proc的进程扫描后端，仅Linux可用
+
+    先读取/proc/<pid>/comm按名称过滤，只有Chrome进程才读取stat和cmdline，
+    不为其他进程创建任何对象，结果以生成器方式流式产出。
+    """
+
+    name = "procfs"
+
+    def __init__(self, proc_root="/proc"):
+        """
+        初始化扫描后端
+
+        Args:
+            proc_root: procfs挂载点
+        """
+        self.proc_root = proc_root
+
+    @classmethod
+    def is_available(cls, proc_root="/proc"):
+        """检查当前系统是否可以使用procfs后端"""
+        return sys.platform.startswith("linux") and os.path.isdir(os.path.join(proc_root, "self"))
+
+    def iter_chrome_processes(self):
+        """
+        逐个产出名称匹配的Chrome进程
+
+        Yields:
+            tuple: (pid, 父进程pid, 启动时间(时钟滴答数), pid)
+        """
+        try:
+            entries = os.scandir(self.proc_root)
+        except OSError as e:
+            print(f"读取{self.proc_root}失败: {str(e)}")
+            return
+
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid_dir = entry.path
+                try:
+                    with open(os.path.join(pid_dir, "comm"), "rb") as f:
+                        name = f.read().decode("utf-8", "replace").strip()
+                    if not is_chrome_process_name(name):
+                        continue
+                    with open(os.path.join(pid_dir, "stat"), "rb") as f:
+                        stat = f.read()
+                except OSError:
+                    # 进程已退出或无权访问
+                    continue
+
+                # 进程名可能包含空格和括号，从最后一个')'之后开始解析
+                # 之后的第2个字段为父进程pid，第20个字段(stat第22个字段)为启动时间
+                fields = stat[stat.rfind(b")") + 2:].split()
+                try:
+                    ppid = int(fields[1])
+                    start_time = int(fields[19])
+                except (IndexError, ValueError):
+                    continue
+                pid = int(entry.name)
+                yield pid, ppid, start_time, pid
+
+    def read_cmdline(self, pid):
+        """
+        读取进程命令行
+
+        Returns:
+            list或None: 命令行参数，无权读取时返回None
+
+        Raises:
+            ProcessLookupError: 进程已经退出
+        """
+        try:
+            with open(os.path.join(self.proc_root, str(pid), "cmdline"), "rb") as f:
+                data = f.read()
+        except (FileNotFoundError, ProcessLookupError):
+            raise ProcessLookupError(pid)
+        except PermissionError:
+            return None
+        return [arg.decode("utf-8", "surrogateescape") for arg in data.split(b"\0") if arg]
+
+
+def create_default_scanner():
+    """根据当前平台选择最快的可用扫描后端，psutil作为备用"""
+    if ProcfsProcessScanner.is_available():
+        return ProcfsProcessScanner()
+    return PsutilProcessScanner()
+
+
+class ProcessIndex:
+    """
+    Chrome进程索引
+
+    一次遍历所有进程，每个进程只解析一次命令行，得到
+    {规范化数据目录: {"browser_pid": 主进程PID, "child_pids": [子进程PID...]}}
+    的快照。快照在max_age秒内被所有调用方共享，查询为O(1)。
+
+    命令行解析结果按 (pid, create_time) 缓存并跨刷新保留，稳定状态下
+    刷新只需枚举PID，只有新出现的进程才需要读取命令行。
+
+    进程枚举由可替换的扫描后端完成，Linux上默认直接读取/proc。
+    """
+
+    def __init__(self, max_age=DEFAULT_MAX_AGE, scanner=None):
+        """
+        初始化进程索引
+
+        Args:
+            max_age: 快照最长有效时间（秒）
+            scanner: 进程扫描后端，默认根据平台自动选择
+        """
+        self.max_age = max_age
+        self.scanner = scanner or create_default_scanner()
+        self._snapshot = {}
+        self._snapshot_time = 0
+        self._lock = threading.Lock()
+        # 命令行解析缓存: (pid, create_time) -> (数据目录, 是否主进程)
+        self._cmdline_cache = {}
+
+    def set_max_age(self, max_age):
+        """设置快照最长有效时间"""
+        self.max_age = max_age
+
+    def invalidate(self):
+        """使当前快照失效，下次查询时重新扫描"""
+        self._snapshot_time = 0
+
+    def snapshot_age(self):
+        """返回当前快照已存在的时间（秒）"""
+        return time.time() - self._snapshot_time
+
+    def refresh(self):
+        """
+        立即重新扫描进程并发布新的快照
+
+        Returns:
+            dict: 新的快照
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def get_snapshot(self, max_age=None):
+        """
+        获取快照，超过有效期时重新扫描
+
+        Args:
+            max_age: 本次查询允许的快照最长有效时间，None表示使用默认值
+
+        Returns:
+            dict: 数据目录到进程信息的映射（只读，不要修改）
+        """
+        if max_age is None:
+            max_age = self.max_age
+        if self.snapshot_age() < max_age:
+            return self._snapshot
+
+        with self._lock:
+            # 等锁期间其他线程可能已经完成了扫描
+            if self.snapshot_age() < max_age:
+                return self._snapshot
+            return self._refresh_locked()
+
+    def lookup(self, data_dir, max_age=None):
+        """
+        查询数据目录对应的进程信息
+
+        Returns:
+            dict或None: {"browser_pid": ..., "child_pids": [...]}
+        """
+        return self.get_snapshot(max_age).get(normalize_data_dir(data_dir))
+
+    def is_running(self, data_dir, max_age=None):
+        """检查是否有Chrome进程正在使用该数据目录"""
+        return self.lookup(data_dir, max_age) is not None
+
+    def running_data_dirs(self, max_age=None):
+        """返回所有正在被使用的规范化数据目录集合"""
+        return set(self.get_snapshot(max_age).keys())
+
+    def clear_cmdline_cache(self):
+        """清空命令行解析缓存"""
+        with self._lock:
+            self._cmdline_cache = {}
+
+    def _assign_by_parent(self, snapshot, pid_owner, unowned):
+        """将没有数据目录参数的Chrome进程按父子关系归入所属实例"""
+        while unowned:
+            remaining = []
+            for pid, ppid in unowned:
+                data_dir = pid_owner.get(ppid)
+                if data_dir is None:
+                    remaining.append((pid, ppid))
+                    continue
+                snapshot[data_dir]["child_pids"].append(pid)
+                pid_owner[pid] = data_dir
+            if len(remaining) == len(unowned):
+                # 剩余进程不属于任何实例（如系统默认Chrome）
+                break
+            unowned = remaining
+
+    def _refresh_locked(self):
+        """执行一次完整扫描（调用方需持有锁）"""
+        start_time = time.time()
+        snapshot = {}
+        cmdline_cache = {}
+        pid_owner = {}  # pid -> 规范化数据目录
+        unowned = []  # 命令行中没有数据目录的Chrome进程: (pid, ppid)
+        scanned = 0
+        cmdline_reads = 0
+
+        try:
+            for pid, ppid, create_time, handle in self.scanner.iter_chrome_processes():
+                scanned += 1
+
+                # PID可能被复用，必须同时匹配创建时间
+                key = (pid, create_time)
+                parsed = self._cmdline_cache.get(key)
+                if parsed is None:
+                    cmdline_reads += 1
+                    try:
+                        cmdline = self.scanner.read_cmdline(handle)
+                    except ProcessLookupError:
+                        continue
+                    # 无权读取的进程也缓存下来，避免每次刷新重复尝试
+                    parsed = parse_chrome_cmdline(cmdline)
+                # 只保留本次仍然存活的进程，已退出的进程自然被淘汰
+                cmdline_cache[key] = parsed
+
+                data_dir, is_browser = parsed
+                if not data_dir:
+                    unowned.append((pid, ppid))
+                    continue
+
+                entry = snapshot.get(data_dir)
+                if entry is None:
+                    entry = {"browser_pid": None, "child_pids": []}
+                    snapshot[data_dir] = entry
+                if is_browser and entry["browser_pid"] is None:
+                    entry["browser_pid"] = pid
+                else:
+                    entry["child_pids"].append(pid)
+                pid_owner[pid] = data_dir
+
+            # 部分子进程（如crashpad）命令行中没有数据目录，按父进程归属到实例
+            self._assign_by_parent(snapshot, pid_owner, unowned)
+        except Exception as e:
+            print(f"扫描Chrome进程时出错: {str(e)}")
+            # 扫描中断时保留旧快照和旧缓存，不把不完整的结果当作最新状态发布；
+            # 快照时间不更新，下次读取时会重新扫描
+            return self._snapshot
+
+        self._cmdline_cache = cmdline_cache
+        self._snapshot = snapshot
+        self._snapshot_time = time.time()
+
+        # 后台监视线程会频繁刷新，只在有新进程或耗时较长时输出日志
+        elapsed = self._snapshot_time - start_time
+        if cmdline_reads or elapsed > 0.1:
+            print(f"进程索引已刷新: {scanned}个Chrome进程({cmdline_reads}个新读取命令行), "
+                  f"{len(snapshot)}个实例, 耗时{elapsed:.3f}秒")
+        return snapshot
+
+
+# 全局共享的进程索引
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_process_index():
+    """获取全局共享的进程索引"""
+    global _shared_index
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                _shared_index = ProcessIndex()
+    return _shared_index
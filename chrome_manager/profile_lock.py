@@ -0,0 +1,170 @@
+"""
+配置文件锁检测模块，通过Chrome在用户数据目录中留下的锁文件快速判断实例是否在使用
+"""
+
+import os
+import socket
+import psutil
+
+from .process_index import (
+    get_process_index, normalize_data_dir, is_chrome_process_name, parse_chrome_cmdline
+)
+
+# 锁文件名称
+WINDOWS_LOCK_FILE = "lockfile"  # Windows: Chrome以独占写方式打开，退出时自动删除
+SINGLETON_LOCK_FILE = "SingletonLock"  # Linux/macOS: 指向 "主机名-PID" 的符号链接
+DEVTOOLS_PORT_FILE = "DevToolsActivePort"  # 开启远程调试时写入，退出后可能残留
+
+# 探测结果
+LOCK_STATE_FREE = "free"  # 确定未被使用
+LOCK_STATE_IN_USE = "in_use"  # 确定正在被使用
+LOCK_STATE_UNKNOWN = "unknown"  # 无法确定（如崩溃后残留的锁），需要进程检查
+
+
+def _probe_windows_lockfile(lock_path):
+    """
+    探测Windows锁文件
+
+    Chrome运行时以只共享读的方式持有lockfile，此时无法以写方式打开；
+    能打开说明是残留文件，需要进一步确认。
+    """
+    try:
+        fd = os.open(lock_path, os.O_WRONLY)
+    except FileNotFoundError:
+        return LOCK_STATE_FREE
+    except PermissionError:
+        return LOCK_STATE_IN_USE
+    except OSError:
+        return LOCK_STATE_UNKNOWN
+    os.close(fd)
+    return LOCK_STATE_UNKNOWN
+
+
+def _validate_lock_pid(pid, data_dir):
+    """
+    验证锁文件中记录的PID是否确实是使用该目录的Chrome进程
+
+    只读取这一个进程的信息，不需要扫描全部进程。
+    """
+    try:
+        proc = psutil.Process(pid)
+        if not is_chrome_process_name(proc.name()):
+            # PID已被其他程序复用，锁是残留的
+            return LOCK_STATE_FREE
+        proc_data_dir, _ = parse_chrome_cmdline(proc.cmdline())
+    except psutil.NoSuchProcess:
+        return LOCK_STATE_FREE
+    except (psutil.AccessDenied, psutil.ZombieProcess):
+        return LOCK_STATE_UNKNOWN
+
+    if proc_data_dir == normalize_data_dir(data_dir):
+        return LOCK_STATE_IN_USE
+    return LOCK_STATE_FREE
+
+
+def _probe_singleton_lock(lock_path, data_dir):
+    """
+    探测SingletonLock符号链接
+
+    链接内容为 "主机名-PID"，在本机上可直接验证该PID，
+    其他主机创建的锁无法验证，返回不确定。
+    """
+    try:
+        target = os.readlink(lock_path)
+    except FileNotFoundError:
+        return LOCK_STATE_FREE
+    except OSError:
+        return LOCK_STATE_UNKNOWN
+
+    hostname, _, pid_text = target.rpartition("-")
+    try:
+        pid = int(pid_text)
+    except ValueError:
+        return LOCK_STATE_UNKNOWN
+
+    if hostname != socket.gethostname():
+        # 其他主机（如网络共享目录）创建的锁，无法在本机验证
+        return LOCK_STATE_UNKNOWN
+    return _validate_lock_pid(pid, data_dir)
+
+
+def probe_profile_lock(data_dir):
+    """
+    通过锁文件探测数据目录是否被Chrome使用
+
+    Args:
+        data_dir: 数据目录路径
+
+    Returns:
+        str: LOCK_STATE_FREE / LOCK_STATE_IN_USE / LOCK_STATE_UNKNOWN
+    """
+    if not os.path.isdir(data_dir):
+        return LOCK_STATE_FREE
+
+    if os.name == "nt":
+        state = _probe_windows_lockfile(os.path.join(data_dir, WINDOWS_LOCK_FILE))
+    else:
+        state = _probe_singleton_lock(os.path.join(data_dir, SINGLETON_LOCK_FILE), data_dir)
+
+    if state == LOCK_STATE_FREE and os.path.exists(os.path.join(data_dir, DEVTOOLS_PORT_FILE)):
+        # 没有锁但有调试端口文件，可能是异常退出的残留，也可能锁文件被清理过
+        return LOCK_STATE_UNKNOWN
+    return state
+
+
+class ProfileUsageDetector:
+    """
+    实例使用状态检测器
+
+    先用锁文件探测（每个目录一次stat/open，锁中有PID时只验证这一个进程），
+    只有结果不确定（如崩溃后残留的锁）时才查询进程索引。
+    """
+
+    def __init__(self, process_index=None, process_max_age=None):
+        """
+        初始化检测器
+
+        Args:
+            process_index: 进程索引，默认使用全局共享索引
+            process_max_age: 回退到进程索引时允许的快照最长有效时间
+        """
+        self.process_index = process_index or get_process_index()
+        self.process_max_age = process_max_age
+
+    def is_in_use(self, data_dir):
+        """检查单个数据目录是否正在被Chrome使用"""
+        state = probe_profile_lock(data_dir)
+        if state == LOCK_STATE_UNKNOWN:
+            return self.process_index.is_running(data_dir, self.process_max_age)
+        return state == LOCK_STATE_IN_USE
+
+    def find_in_use(self, data_dirs):
+        """
+        批量检查多个数据目录
+
+        所有目录先做锁文件探测，不确定的目录共用同一份进程快照，
+        因此无论目录多少，最多只扫描一次进程。
+
+        Args:
+            data_dirs: 数据目录路径列表
+
+        Returns:
+            set: 正在被使用的数据目录（原始路径）
+        """
+        in_use = set()
+        ambiguous = []
+        for data_dir in data_dirs:
+            state = probe_profile_lock(data_dir)
+            if state == LOCK_STATE_IN_USE:
+                in_use.add(data_dir)
+            elif state == LOCK_STATE_UNKNOWN:
+                ambiguous.append(data_dir)
+
+        if ambiguous:
+            snapshot = self.process_index.get_snapshot(self.process_max_age)
+            for data_dir in ambiguous:
+                if normalize_data_dir(data_dir) in snapshot:
+                    in_use.add(data_dir)
+
+        print(f"锁文件检测完成: {len(data_dirs)}个目录, {len(ambiguous)}个需要进程验证, {len(in_use)}个正在使用")
+        return in_use
@@ -0,0 +1,261 @@
+"""
+资源监控模块，按实例汇总Chrome进程树的内存、CPU和线程/句柄占用
+"""
+
+import sys
+import time
+import threading
+import psutil
+from PyQt6.QtCore import QThread, QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from .process_index import get_process_index
+
+
+def format_bytes(size):
+    """将字节数格式化为易读的字符串"""
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f}{unit}" if unit in ("B", "KB") else f"{size:.1f}{unit}"
+        size /= 1024.0
+
+
+class ResourceCollector:
+    """
+    实例资源采样器
+
+    基于进程索引的快照，把浏览器主进程和它的渲染/GPU/工具子进程按数据目录分组，
+    一次遍历采集所有进程的RSS/USS、CPU%、线程数和句柄数。
+    psutil.Process对象跨采样保留，用于计算CPU占用的增量。
+    """
+
+    def __init__(self, process_index=None):
+        """
+        初始化采样器
+
+        Args:
+            process_index: 进程索引，默认使用全局共享索引
+        """
+        self.process_index = process_index or get_process_index()
+        self._processes = {}  # pid -> psutil.Process
+        self.collect_uss = True
+        self._has_handles = sys.platform == 'win32'
+
+    def sample(self, include_uss=False):
+        """
+        采集一次所有实例的资源占用
+
+        Args:
+            include_uss: 是否采集USS（需要遍历进程内存映射，开销较大）
+
+        Returns:
+            dict: {规范化数据目录: {"process_count", "rss", "uss", "cpu_percent", "threads", "handles"}}
+        """
+        snapshot = self.process_index.get_snapshot()
+        processes = {}
+        result = {}
+
+        for data_dir, entry in snapshot.items():
+            pids = list(entry["child_pids"])
+            if entry["browser_pid"] is not None:
+                pids.append(entry["browser_pid"])
+
+            usage = {
+                "process_count": 0,
+                "rss": 0,
+                "uss": 0 if include_uss else None,
+                "cpu_percent": 0.0,
+                "threads": 0,
+                "handles": 0 if self._has_handles else None,
+            }
+            for pid in pids:
+                proc = self._processes.get(pid)
+                try:
+                    if proc is None or not proc.is_running():
+                        proc = psutil.Process(pid)
+                    with proc.oneshot():
+                        if include_uss:
+                            mem = proc.memory_full_info()
+                            usage["uss"] += mem.uss
+                        else:
+                            mem = proc.memory_info()
+                        usage["rss"] += mem.rss
+                        # 第一次采样的进程没有基准，返回0
+                        usage["cpu_percent"] += proc.cpu_percent(interval=None)
+                        usage["threads"] += proc.num_threads()
+                        if self._has_handles:
+                            usage["handles"] += proc.num_handles()
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    continue
+                except psutil.AccessDenied:
+                    processes[pid] = proc
+                    continue
+                processes[pid] = proc
+                usage["process_count"] += 1
+
+            if usage["process_count"]:
+                result[data_dir] = usage
+
+        # 只保留仍在运行的进程对象，已退出的进程被释放
+        self._processes = processes
+        return result
+
+
+class ResourceMonitor(QThread):
+    """
+    资源监控线程
+
+    周期性调用ResourceCollector采样，并将采样耗时限制在固定的CPU预算内：
+    单次采样耗时除以预算得到最短采样间隔，超出预算时先停止采集USS。
+    """
+
+    sample_ready = pyqtSignal(dict)  # 采样结果，格式见ResourceCollector.sample
+
+    BASE_INTERVAL = 3.0  # 基础采样间隔（秒）
+    CPU_BUDGET = 0.02  # 采样最多占用单核2%的CPU时间
+    USS_EVERY = 5  # 每隔多少次采样采集一次USS
+
+    def __init__(self, parent=None, collector=None):
+        super().__init__(parent)
+        self.collector = collector or ResourceCollector()
+        self.interval = self.BASE_INTERVAL
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """停止监控线程并等待其退出"""
+        self._stop_event.set()
+        self.wait()
+
+    def run(self):
+        """采样循环"""
+        try:
+            self.setPriority(QThread.Priority.LowestPriority)
+        except Exception as e:
+            print(f"设置资源监控线程优先级失败: {str(e)}")
+
+        sample_count = 0
+        while not self._stop_event.is_set():
+            include_uss = self.collector.collect_uss and sample_count % self.USS_EVERY == 0
+            start_cpu = time.thread_time()
+            try:
+                sample = self.collector.sample(include_uss=include_uss)
+                self.sample_ready.emit(sample)
+            except Exception as e:
+                print(f"采集实例资源占用出错: {str(e)}")
+            cost = time.thread_time() - start_cpu
+            sample_count += 1
+
+            # 根据本次采样的CPU耗时调整间隔，保证不超过预算
+            required_interval = cost / self.CPU_BUDGET
+            if include_uss and required_interval > self.BASE_INTERVAL * self.USS_EVERY:
+                print(f"USS采集耗时{cost:.3f}秒，超出CPU预算，停止采集USS")
+                self.collector.collect_uss = False
+            self.interval = max(self.BASE_INTERVAL, required_interval)
+
+            self._stop_event.wait(self.interval)
+
+
+class InstanceResourceModel(QAbstractTableModel):
+    """
+    实例资源占用表格模型
+
+    每行对应一个正在运行的实例。监控页面直接绑定该模型，
+    主页卡片通过usage_changed信号只更新占用发生变化的实例。
+    """
+
+    # {规范化数据目录: 资源占用字典或None(已停止)}
+    usage_changed = pyqtSignal(dict)
+
+    COLUMNS = ["实例", "进程数", "内存(RSS)", "独占内存(USS)", "CPU%", "线程数", "句柄数"]
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # 规范化数据目录列表
+        self._usage = {}
+        self._names = {}  # 规范化数据目录 -> 实例名称
+
+    def set_instance_names(self, names):
+        """
+        设置数据目录到实例名称的映射
+
+        Args:
+            names: {规范化数据目录: 实例名称}
+        """
+        self._names = dict(names)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0))
+
+    def usage_for(self, data_dir_key):
+        """获取某个实例最近一次的资源占用"""
+        return self._usage.get(data_dir_key)
+
+    def update_sample(self, sample):
+        """用新的采样结果更新模型"""
+        # USS不是每次都采集，沿用上一次的值
+        for key, usage in sample.items():
+            previous = self._usage.get(key)
+            if usage["uss"] is None and previous is not None:
+                usage["uss"] = previous["uss"]
+
+        changes = {key: usage for key, usage in sample.items() if self._usage.get(key) != usage}
+        changes.update({key: None for key in self._usage if key not in sample})
+
+        rows = sorted(sample.keys())
+        if rows != self._rows:
+            self.beginResetModel()
+            self._rows = rows
+            self._usage = sample
+            self.endResetModel()
+        else:
+            self._usage = sample
+            if rows:
+                self.dataChanged.emit(self.index(0, 1), self.index(len(rows) - 1, len(self.COLUMNS) - 1))
+
+        if changes:
+            self.usage_changed.emit(changes)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._rows[index.row()]
+        usage = self._usage[key]
+        column = index.column()
+
+        if column == 0:
+            value = self._names.get(key, key)
+            return value if role in (Qt.ItemDataRole.DisplayRole, self.SORT_ROLE) else None
+
+        raw = [
+            None,
+            usage["process_count"],
+            usage["rss"],
+            usage["uss"],
+            usage["cpu_percent"],
+            usage["threads"],
+            usage["handles"],
+        ][column]
+
+        if role == self.SORT_ROLE:
+            return raw if raw is not None else -1
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if column in (2, 3):
+            return format_bytes(raw)
+        if column == 4:
+            return f"{raw:.1f}"
+        return "-" if raw is None else str(raw)
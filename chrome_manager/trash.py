@@ -0,0 +1,72 @@
+"""
+回收站模块，删除实例时先把数据目录重命名为墓碑目录，再由删除服务在后台回收
+"""
+
+import os
+import uuid
+import errno
+
+# 数据根目录下存放墓碑目录的子目录，不以Profile开头，不会被当成实例目录
+TRASH_DIR_NAME = ".trash"
+
+# Windows上跨卷移动返回的错误码（ERROR_NOT_SAME_DEVICE）
+_WINERROR_NOT_SAME_DEVICE = 17
+
+
+class TrashInUseError(OSError):
+    """数据目录中有文件被占用，无法移入回收站"""
+
+
+def get_trash_dir(data_root):
+    """返回数据根目录对应的回收站目录"""
+    return os.path.join(data_root, TRASH_DIR_NAME)
+
+
+def is_trash_dir_name(name):
+    """判断目录名是否为回收站目录"""
+    return name == TRASH_DIR_NAME
+
+
+def move_to_trash(data_dir, data_root):
+    """
+    把数据目录原子地重命名为回收站中的墓碑目录
+
+    重命名在同一卷上是O(1)的，完成后原目录名立即可以复用。
+
+    Args:
+        data_dir: 要删除的数据目录
+        data_root: 数据根目录
+
+    Returns:
+        str或None: 墓碑目录路径；数据目录与回收站不在同一卷时返回None，
+            调用方需要直接删除
+
+    Raises:
+        TrashInUseError: 目录中有文件被占用（Windows上Chrome运行时无法重命名）
+        OSError: 其他重命名失败
+    """
+    trash_dir = get_trash_dir(data_root)
+    os.makedirs(trash_dir, exist_ok=True)
+    tombstone = os.path.join(trash_dir, uuid.uuid4().hex)
+    try:
+        os.replace(data_dir, tombstone)
+    except PermissionError as e:
+        raise TrashInUseError(e.errno, f"数据目录正在被使用: {data_dir}") from e
+    except OSError as e:
+        if e.errno == errno.EXDEV or getattr(e, "winerror", None) == _WINERROR_NOT_SAME_DEVICE:
+            return None
+        raise
+    return tombstone
+
+
+def list_tombstones(data_root):
+    """列出回收站中所有待回收的墓碑目录"""
+    trash_dir = get_trash_dir(data_root)
+    try:
+        with os.scandir(trash_dir) as entries:
+            return [entry.path for entry in entries]
+    except FileNotFoundError:
+        return []
+    except OSError as e:
+        print(f"读取回收站目录失败: {str(e)}")
+        return []
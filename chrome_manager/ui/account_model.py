@@ -0,0 +1,175 @@
+"""
+账号表格模型，把实例和账号信息提供给账号管理页面的QTableView
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+from .instance_model import InstanceListModel
+
+# 表格中的账号列：(字段, 表头)
+ACCOUNT_COLUMNS = (
+    ("wallet", "钱包地址"),
+    ("twitter", "Twitter"),
+    ("discord", "Discord"),
+    ("telegram", "Telegram"),
+    ("gmail", "Gmail"),
+    ("note", "备注"),
+)
+
+NAME_COLUMN = 0  # 实例名称列，只读
+DIRTY_COLOR = "#FFF8E1"  # 已修改未保存的单元格背景色
+
+
+class AccountTableModel(QAbstractTableModel):
+    """
+    账号表格模型
+
+    行与主页相同，由一个InstanceListModel跟随实例仓库维护，本模型转发它的行信号，
+    增删实例只插入或删除对应的行。账号信息在视图请求某个单元格时才通过AccountStore
+    解密，视图只请求可见的行。
+
+    编辑的内容按单元格保存在待保存表中，被修改的单元格以浅色背景标出；
+    保存时只把这些单元格合并到对应实例的账号信息中，未编辑的实例不会被读取或写入。
+    """
+
+    def __init__(self, repository, account_store, parent=None):
+        """
+        初始化模型
+
+        Args:
+            repository: InstanceRepository
+            account_store: AccountStore，按需解密账号信息
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.account_store = account_store
+        self._edits = {}  # 实例名称 -> {字段: 编辑后的值}
+        self._rows = InstanceListModel(repository, parent=self)
+
+        self._rows.rowsAboutToBeInserted.connect(
+            lambda parent, first, last: self.beginInsertRows(QModelIndex(), first, last))
+        self._rows.rowsInserted.connect(lambda *args: self.endInsertRows())
+        self._rows.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        self._rows.rowsRemoved.connect(lambda *args: self.endRemoveRows())
+        self._rows.modelAboutToBeReset.connect(self.beginResetModel)
+        self._rows.modelReset.connect(self.endResetModel)
+        self._rows.dataChanged.connect(self._on_rows_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows.rowCount()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(ACCOUNT_COLUMNS) + 1
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if section == NAME_COLUMN:
+            return "实例"
+        return ACCOUNT_COLUMNS[section - 1][1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._rows.rowCount():
+            return None
+        record = self._rows.record_at(index.row())
+        column = index.column()
+
+        if column == NAME_COLUMN:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return record.name
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return record.data_dir
+            return None
+
+        field = ACCOUNT_COLUMNS[column - 1][0]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ToolTipRole):
+            edits = self._edits.get(record.name)
+            if edits is not None and field in edits:
+                return edits[field]
+            value = self.account_store.get(record.name).get(field, "")
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return value or None
+            return value
+        if role == Qt.ItemDataRole.BackgroundRole and field in self._edits.get(record.name, ()):
+            return QColor(DIRTY_COLOR)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() != NAME_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """编辑单元格：与已保存的值相同时取消该单元格的修改标记"""
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or index.column() == NAME_COLUMN:
+            return False
+        name = self._rows.record_at(index.row()).name
+        field = ACCOUNT_COLUMNS[index.column() - 1][0]
+        value = (value or "").strip()
+
+        edits = self._edits.setdefault(name, {})
+        if value == self.account_store.get(name).get(field, ""):
+            edits.pop(field, None)
+        else:
+            edits[field] = value
+        if not edits:
+            del self._edits[name]
+        self.dataChanged.emit(index, index)
+        return True
+
+    def record_at(self, row):
+        """返回某一行的实例记录"""
+        return self._rows.record_at(row)
+
+    def row_of_name(self, name):
+        """实例名称所在的行，不存在时返回-1"""
+        record = self._rows.repository.get(name)
+        return -1 if record is None else self._rows.row_of(record)
+
+    def has_edits(self):
+        """是否有尚未保存的修改"""
+        return bool(self._edits)
+
+    def commit_edits(self):
+        """
+        把修改过的单元格合并到账号存储，只读取和修改被编辑过的实例
+
+        Returns:
+            int: 内容发生变化的实例数
+        """
+        changed = 0
+        edits, self._edits = self._edits, {}
+        for name, fields in edits.items():
+            if name not in self._rows.repository:
+                continue
+            # 在原记录上修改，保留表格中没有的额外字段
+            account = self.account_store.get(name)
+            account.update(fields)
+            if self.account_store.set(name, account):
+                changed += 1
+            row = self.row_of_name(name)
+            if row >= 0:
+                self.dataChanged.emit(self.index(row, 1), self.index(row, len(ACCOUNT_COLUMNS)))
+        return changed
+
+    def refresh(self):
+        """账号存储重新加载后通知视图重绘，视图只会重新读取可见的行"""
+        if self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, len(ACCOUNT_COLUMNS)))
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        # 被删除实例的修改一并丢弃；数据目录改变的实例会先删除再插入，保留其修改
+        repository = self._rows.repository
+        for row in range(first, last + 1):
+            name = self._rows.record_at(row).name
+            if name not in repository:
+                self._edits.pop(name, None)
+        self.beginRemoveRows(QModelIndex(), first, last)
+
+    def _on_rows_changed(self, top_left, bottom_right, roles=()):
+        self.dataChanged.emit(self.index(top_left.row(), 0),
+                              self.index(bottom_right.row(), len(ACCOUNT_COLUMNS)))
@@ -2,340 +2,321 @@
 卡片UI组件模块
 """
 
-import os
-import sys
-from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QMessageBox, QHBoxLayout, QCheckBox, QPushButton, QWidget
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon, QFont, QPixmap
+import subprocess
+from PyQt6.QtWidgets import QMessageBox, QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QEvent, QRect, QRectF, QPointF, QSize, pyqtSignal
+from PyQt6.QtGui import (
+    QFont, QColor, QPen, QBrush, QPainter, QPainterPath, QRadialGradient
+)
 
-# 导入提取图标所需的库
-if sys.platform == 'win32':
-    try:
-        import win32com.client
-    except ImportError:
-        print("无法导入win32com模块，将使用备用图标")
+from ..constants import PRIMARY_COLOR, TEXT_PRIMARY_COLOR, TEXT_HINT_COLOR, SUCCESS_COLOR, FONT_FAMILY
+from ..resource_monitor import format_bytes
+from .instance_model import NAME_ROLE, DATA_DIR_ROLE, RUNNING_ROLE, USAGE_ROLE, BATCH_MODE_ROLE
 
-from ..constants import (
-    PRIMARY_COLOR, BACKGROUND_COLOR, BORDER_COLOR, 
-    TEXT_PRIMARY_COLOR, TEXT_SECONDARY_COLOR, FONT_FAMILY
-)
-from .components import ModernButton
 
-# 添加图标提取函数
-def extract_icon_from_exe(exe_path):
+def confirm_delete_instance(parent, name):
     """
-    从exe文件中提取图标
+    显示删除实例的确认对话框
+    
+    Returns:
+        bool: 用户是否确认删除
+    """
+    msg_box = QMessageBox(parent)
+    msg_box.setWindowTitle("确认删除")
+    msg_box.setText(f"确定要删除 {name} 吗？")
+    msg_box.setInformativeText("此操作将删除快捷方式和对应的数据目录，删除后将无法恢复！")
+    msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+    msg_box.setDefaultButton(QMessageBox.StandardButton.No)
+    msg_box.setIcon(QMessageBox.Icon.Warning)
+    msg_box.setFont(QFont("Microsoft YaHei UI", 9))
+    msg_box.setProperty("variant", "confirm-delete")
+    
+    # 自定义按钮文本
+    yes_button = msg_box.button(QMessageBox.StandardButton.Yes)
+    no_button = msg_box.button(QMessageBox.StandardButton.No)
+    if yes_button:
+        yes_button.setText("删除")
+    if no_button:
+        no_button.setText("取消")
+    
+    return msg_box.exec() == QMessageBox.StandardButton.Yes
+
+
+def launch_browser(parent, chrome_path, data_dir):
+    """
+    启动浏览器实例
     
-    Args:
-        exe_path: exe文件路径
-        
     Returns:
-        QPixmap: 提取的图标
+        bool: 是否启动成功
     """
     try:
-        if not os.path.exists(exe_path):
-            return None
-            
-        if sys.platform == 'win32':
-            # 使用快捷方式方法提取图标（更可靠）
-            try:
-                # 创建临时快捷方式
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortCut("temp.lnk")
-                shortcut.TargetPath = exe_path
-                # 使用Chrome的默认图标
-                shortcut.IconLocation = f"{exe_path}, 0"
-                shortcut.Save()
-                
-                # 从快捷方式创建QIcon并获取像素图
-                if os.path.exists("temp.lnk"):
-                    icon = QIcon("temp.lnk")
-                    # 清理临时文件
-                    os.remove("temp.lnk")
-                    
-                    if not icon.isNull():
-                        return icon.pixmap(48, 48)
-            except Exception as e:
-                print(f"创建临时快捷方式提取图标时出错: {str(e)}")
-        
-        # 尝试直接从exe创建QIcon
-        icon = QIcon(exe_path)
-        if not icon.isNull():
-            return icon.pixmap(48, 48)
-            
-        return None
+        cmd = [chrome_path, f'--user-data-dir={data_dir}']
+        print(f"启动Chrome命令: {cmd}")
+        subprocess.Popen(cmd)
+        return True
     except Exception as e:
-        print(f"提取图标时出错: {str(e)}")
-        return None
+        QMessageBox.critical(parent, "错误", f"启动Chrome失败：{str(e)}")
+        return False
 
-class BrowserCard(QFrame):
-    """浏览器实例卡片组件"""
+
+class BrowserCardDelegate(QStyledItemDelegate):
+    """
+    浏览器实例卡片委托
     
-    def __init__(self, name, data_dir, chrome_path, parent=None, on_delete=None):
-        super().__init__(parent)
-        self.name = name
-        self.data_dir = data_dir
-        self.chrome_path = chrome_path
-        self.on_delete = on_delete  # 删除回调函数
-        self.is_select_mode = False  # 是否处于选择模式
-        self.is_selected = False     # 是否被选中
-        self.setup_ui()
-        
-    def setup_ui(self):
-        self.setFixedSize(180, 180)  # 卡片尺寸
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 10px;
-            }
-        """)
+    在QListView中为每个实例绘制卡片，视图只为可见的行调用paint，
+    实例再多也不会创建任何卡片控件。删除和启动按钮也是绘制出来的，
+    点击时发出对应的信号；批量模式下整张卡片由视图的选择模型处理选中。
+    """
+    
+    # 实例名称, 数据目录
+    launch_requested = pyqtSignal(str, str)
+    delete_requested = pyqtSignal(str, str)
+    
+    CARD_SIZE = QSize(180, 180)  # 卡片尺寸
+    MARGIN = 10  # 卡片内边距
+    ICON_SIZE = 48  # 图标尺寸
+    
+    def __init__(self, view, icon_cache, chrome_path=None):
+        """
+        初始化委托
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(5)  # 进一步减小整体间距
+        Args:
+            view: 使用此委托的QListView，用于跟踪鼠标悬停
+            icon_cache: IconCache，提供所有卡片共用的图标
+            chrome_path: Chrome路径，内置图标图片不存在时使用Chrome的图标
+        """
+        super().__init__(view)
+        self.view = view
+        self.icon_cache = icon_cache
+        self.chrome_path = chrome_path
+        self._icon = None  # 所有卡片共用的图标，第一次绘制时从图标缓存取得
+        self._icon_loaded = False
+        self._hover_row = -1  # 鼠标所在的行
+        self._hover_part = None  # 鼠标所在的按钮："delete"、"launch"或None
         
-        # 顶部布局，包含选择框和删除按钮
-        top_layout = QHBoxLayout()
-        top_layout.setContentsMargins(0, 0, 0, 0)
-        top_layout.setSpacing(4)
+        self._status_font = QFont(FONT_FAMILY)
+        self._status_font.setPixelSize(11)
+        self._name_font = QFont(FONT_FAMILY)
+        self._name_font.setPixelSize(13)
+        self._name_font.setWeight(QFont.Weight.Medium)
+        self._button_font = QFont(FONT_FAMILY)
+        self._button_font.setPixelSize(13)
+        self._button_font.setWeight(QFont.Weight.Medium)
+        self._delete_font = QFont(FONT_FAMILY)
+        self._delete_font.setPixelSize(14)
+        self._delete_font.setBold(True)
         
-        # 选择框（默认隐藏）
-        self.select_checkbox = QCheckBox()
-        self.select_checkbox.setVisible(False)
-        self.select_checkbox.stateChanged.connect(self.on_selection_changed)
-        self.select_checkbox.setStyleSheet("""
-            QCheckBox {
-                background-color: transparent;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #E0E0E0;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #4285F4;
-                border-radius: 3px;
-                background-color: #4285F4;
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"><polyline points="20 6 9 17 4 12"></polyline></svg>');
-            }
-        """)
+        self._viewport = view.viewport()
+        view.setMouseTracking(True)
+        self._viewport.installEventFilter(self)
+    
+    def set_chrome_path(self, chrome_path):
+        """Chrome路径改变后重新加载图标"""
+        if chrome_path == self.chrome_path:
+            return
+        self.chrome_path = chrome_path
+        self._icon = None
+        self._icon_loaded = False
+        self._viewport.update()
+    
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+    
+    def _card_rect(self, rect):
+        """卡片在单元格中居中"""
+        card = QRect(0, 0, self.CARD_SIZE.width(), self.CARD_SIZE.height())
+        card.moveCenter(rect.center())
+        return card
+    
+    def _layout(self, rect):
+        """
+        计算卡片各部分的位置
         
-        # 删除按钮 - 改进样式和大小
-        self.delete_btn = QPushButton("×")
-        self.delete_btn.setFixedSize(20, 20)
-        self.delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F2F2F2;
-                color: #666666;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 10px;
-                text-align: center;
-                padding: 0px;
-                line-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #FF5252;
-                color: white;
-            }
-        """)
-        self.delete_btn.clicked.connect(self.on_delete_clicked)
+        Returns:
+            dict: 部分名称 -> QRect
+        """
+        card = self._card_rect(rect)
+        m = self.MARGIN
+        left, top, width = card.left() + m, card.top() + m, card.width() - 2 * m
+        icon_left = card.left() + (card.width() - self.ICON_SIZE) // 2
+        return {
+            "card": card,
+            "checkbox": QRect(left, top + 1, 18, 18),
+            "status": QRect(left, top, width - 24, 20),
+            "delete": QRect(card.right() - m - 19, top, 20, 20),
+            "icon": QRect(icon_left, top + 25, self.ICON_SIZE, self.ICON_SIZE),
+            "name": QRect(left, top + 78, width, 20),
+            "usage": QRect(left, top + 100, width, 16),
+            "launch": QRect(left, card.bottom() - m - 31, width, 32),
+        }
+    
+    def _hit_test(self, rect, pos, batch_mode):
+        """返回位置所在的按钮"""
+        parts = self._layout(rect)
+        if not batch_mode and parts["delete"].contains(pos):
+            return "delete"
+        if parts["launch"].contains(pos):
+            return "launch"
+        return None
+    
+    def _load_icon(self):
+        """从图标缓存取得所有卡片共用的图标"""
+        self._icon_loaded = True
+        self._icon = self.icon_cache.card_icon(self.chrome_path)
+    
+    def paint(self, painter, option, index):
+        parts = self._layout(option.rect)
+        card = QRectF(parts["card"]).adjusted(0.5, 0.5, -0.5, -0.5)
+        row = index.row()
+        batch_mode = index.data(BATCH_MODE_ROLE)
+        selected = batch_mode and bool(option.state & QStyle.StateFlag.State_Selected)
+        hover_part = self._hover_part if row == self._hover_row else None
         
-        top_layout.addWidget(self.select_checkbox, 0, Qt.AlignmentFlag.AlignLeft)
-        top_layout.addStretch()
-        top_layout.addWidget(self.delete_btn, 0, Qt.AlignmentFlag.AlignRight)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        layout.addLayout(top_layout)
+        # 卡片背景和边框，选中时使用主色边框
+        if selected:
+            painter.setPen(QPen(QColor(PRIMARY_COLOR), 2))
+            painter.setBrush(QColor("#F0F6FF"))
+        else:
+            painter.setPen(QPen(QColor("#E0E0E0"), 1))
+            painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(card, 10, 10)
         
-        # Chrome图标 - 使用指定图片作为图标
-        icon_label = QLabel()
-        icon_label.setFixedSize(48, 48)  # 图标尺寸
+        # 选择框或删除按钮
+        status_rect = QRect(parts["status"])
+        if batch_mode:
+            self._paint_checkbox(painter, parts["checkbox"], selected)
+            status_rect.setLeft(parts["checkbox"].right() + 5)
+        else:
+            self._paint_delete_button(painter, parts["delete"], hover_part == "delete")
         
-        # 图标图片路径
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons", "image.png")
+        # 运行状态
+        running = index.data(RUNNING_ROLE)
+        painter.setFont(self._status_font)
+        painter.setPen(QColor(SUCCESS_COLOR if running else TEXT_HINT_COLOR))
+        painter.drawText(status_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         "● 运行中" if running else "○ 未运行")
         
-        # 检查图片是否存在
-        if os.path.exists(icon_path):
-            # 加载图片
-            pixmap = QPixmap(icon_path)
-            icon_label.setPixmap(pixmap)
-            icon_label.setScaledContents(True)  # 确保图标填充整个标签
+        # 图标
+        if not self._icon_loaded:
+            self._load_icon()
+        if self._icon is not None:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(parts["icon"], self._icon)
         else:
-            # 如果图片不存在，尝试提取Chrome图标作为备选
-            chrome_pixmap = extract_icon_from_exe(self.chrome_path)
-            
-            if chrome_pixmap:
-                # 如果成功提取到图标，则使用它
-                icon_label.setPixmap(chrome_pixmap)
-                icon_label.setScaledContents(True)  # 确保图标填充整个标签
-            else:
-                # 如果无法提取图标，则使用CSS绘制的Chrome风格图标作为最后备选
-                icon_label.setStyleSheet("""
-                    QLabel {
-                        background-color: transparent;
-                        border-radius: 24px;
-                        background: qradialgradient(
-                            cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5, 
-                            stop:0 #4285F4, stop:0.3 #4285F4, 
-                            stop:0.31 white, stop:0.34 white, 
-                            stop:0.35 #4285F4, stop:0.37 #4285F4,
-                            stop:0.38 #34A853, stop:0.50 #34A853,
-                            stop:0.51 #FBBC05, stop:0.63 #FBBC05,
-                            stop:0.64 #EA4335, stop:0.76 #EA4335,
-                            stop:0.77 #4285F4, stop:1 #4285F4
-                        );
-                    }
-                """)
+            self._paint_fallback_icon(painter, parts["icon"])
         
-        layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignCenter)
+        # 名称
+        painter.setFont(self._name_font)
+        painter.setPen(QColor(TEXT_PRIMARY_COLOR))
+        name = painter.fontMetrics().elidedText(index.data(NAME_ROLE), Qt.TextElideMode.ElideRight,
+                                                parts["name"].width())
+        painter.drawText(parts["name"], Qt.AlignmentFlag.AlignCenter, name)
         
-        # 名称标签 - 简单文本
-        name_label = QLabel(self.name)
-        name_label.setFixedHeight(20)  # 固定高度
-        name_label.setStyleSheet("""
-            color: #333333;
-            font-size: 13px;
-            font-weight: 500;
-            background-color: transparent;
-            border: none;
-            padding: 0;
-            margin: 0;
-        """)
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(name_label)
-        
-        # 添加弹性空间
-        layout.addStretch()
+        # 资源占用，实例未运行时不显示
+        usage = index.data(USAGE_ROLE)
+        if usage is not None:
+            painter.setFont(self._status_font)
+            painter.setPen(QColor(TEXT_HINT_COLOR))
+            painter.drawText(parts["usage"], Qt.AlignmentFlag.AlignCenter,
+                             f"内存 {format_bytes(usage['rss'])} · CPU {usage['cpu_percent']:.0f}%")
         
         # 启动按钮
-        launch_btn = ModernButton("启动", accent=True)
-        launch_btn.setFixedHeight(32)
-        launch_btn.clicked.connect(self.launch_browser)
-        layout.addWidget(launch_btn)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#1C75E5" if hover_part == "launch" else PRIMARY_COLOR))
+        painter.drawRoundedRect(QRectF(parts["launch"]), 6, 6)
+        painter.setFont(self._button_font)
+        painter.setPen(QColor("white"))
+        painter.drawText(parts["launch"], Qt.AlignmentFlag.AlignCenter, "启动")
         
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-    def on_delete_clicked(self):
-        """删除按钮点击事件"""
-        if self.on_delete and callable(self.on_delete):
-            msg_box = QMessageBox()
-            msg_box.setWindowTitle("确认删除")
-            msg_box.setText(f"确定要删除 {self.name} 吗？")
-            msg_box.setInformativeText("此操作将删除快捷方式和对应的数据目录，删除后将无法恢复！")
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            msg_box.setDefaultButton(QMessageBox.StandardButton.No)
-            msg_box.setIcon(QMessageBox.Icon.Warning)
-            
-            # 设置字体和样式
-            font = QFont("Microsoft YaHei UI", 9)
-            msg_box.setFont(font)
-            
-            # 应用现代化样式
-            msg_box.setStyleSheet("""
-                QMessageBox {
-                    background-color: white;
-                    border-radius: 8px;
-                }
-                QLabel {
-                    color: #1F1F1F;
-                    font-size: 14px;
-                    padding: 10px;
-                }
-                QLabel#qt_msgbox_label {
-                    font-weight: 500;
-                    font-size: 15px;
-                    padding-bottom: 0px;
-                }
-                QLabel#qt_msgbox_informativelabel {
-                    color: #666666;
-                    font-size: 13px;
-                    padding-top: 0px;
-                }
-                QLabel#qt_msgboxex_icon_label {
-                    padding: 15px;
-                }
-                QPushButton {
-                    background-color: #F5F5F5;
-                    color: #333333;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 24px;
-                    min-width: 90px;
-                    font-size: 13px;
-                    font-weight: 500;
-                    margin: 0px 5px;
-                }
-                QPushButton:hover {
-                    background-color: #EEEEEE;
-                }
-                QPushButton:pressed {
-                    background-color: #E0E0E0;
-                }
-                QPushButton[text="删除"] {
-                    background-color: #FF4D4F;
-                    color: white;
-                }
-                QPushButton[text="删除"]:hover {
-                    background-color: #FF7875;
-                }
-                QPushButton[text="删除"]:pressed {
-                    background-color: #D9363E;
-                }
-                QPushButton[text="取消"] {
-                    background-color: white;
-                    border: 1px solid #D9D9D9;
-                }
-                QPushButton[text="取消"]:hover {
-                    background-color: #FAFAFA;
-                    border-color: #40A9FF;
-                    color: #40A9FF;
-                }
-            """)
-            
-            # 自定义按钮文本
-            yes_button = msg_box.button(QMessageBox.StandardButton.Yes)
-            no_button = msg_box.button(QMessageBox.StandardButton.No)
-            if yes_button:
-                yes_button.setText("删除")
-            if no_button:
-                no_button.setText("取消")
-            
-            ret = msg_box.exec()
-            if ret == QMessageBox.StandardButton.Yes:
-                self.on_delete(self.name, self.data_dir)
+        painter.restore()
     
-    def set_select_mode(self, enabled):
-        """设置选择模式"""
-        self.is_select_mode = enabled
-        self.select_checkbox.setVisible(enabled)
-        self.delete_btn.setVisible(not enabled)
-        
-    def set_selected(self, selected):
-        """设置选中状态"""
-        self.is_selected = selected
-        self.select_checkbox.setChecked(selected)
-        
-    def on_selection_changed(self, state):
-        """选择状态改变事件"""
-        self.is_selected = state == Qt.CheckState.Checked.value
-        
-    def launch_browser(self):
-        """启动浏览器实例"""
-        try:
-            import subprocess
-            # 修复命令行参数格式
-            cmd = [
-                self.chrome_path,
-                f'--user-data-dir={self.data_dir}'  # 移除多余的引号
-            ]
-            print(f"启动Chrome命令: {cmd}")
-            subprocess.Popen(cmd)
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"启动Chrome失败：{str(e)}") 
\ No newline at end of file
+    def _paint_checkbox(self, painter, rect, checked):
+        box = QRectF(rect).adjusted(1, 1, -1, -1)
+        if checked:
+            painter.setPen(QPen(QColor("#4285F4"), 2))
+            painter.setBrush(QColor("#4285F4"))
+            painter.drawRoundedRect(box, 3, 3)
+            check = QPainterPath(QPointF(box.left() + 3.5, box.center().y()))
+            check.lineTo(box.left() + box.width() * 0.42, box.bottom() - 4)
+            check.lineTo(box.right() - 3, box.top() + 4)
+            pen = QPen(QColor("white"), 2)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            painter.setPen(pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPath(check)
+        else:
+            painter.setPen(QPen(QColor("#E0E0E0"), 2))
+            painter.setBrush(QColor("white"))
+            painter.drawRoundedRect(box, 3, 3)
+    
+    def _paint_delete_button(self, painter, rect, hovered):
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#FF5252" if hovered else "#F2F2F2"))
+        painter.drawEllipse(QRectF(rect))
+        painter.setFont(self._delete_font)
+        painter.setPen(QColor("white" if hovered else "#666666"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "×")
+    
+    def _paint_fallback_icon(self, painter, rect):
+        """没有图标时绘制Chrome风格的圆形图标"""
+        gradient = QRadialGradient(QPointF(rect.center()), rect.width() / 2)
+        for stop, color in (
+            (0, "#4285F4"), (0.3, "#4285F4"), (0.31, "white"), (0.34, "white"),
+            (0.35, "#4285F4"), (0.37, "#4285F4"), (0.38, "#34A853"), (0.50, "#34A853"),
+            (0.51, "#FBBC05"), (0.63, "#FBBC05"), (0.64, "#EA4335"), (0.76, "#EA4335"),
+            (0.77, "#4285F4"), (1, "#4285F4"),
+        ):
+            gradient.setColorAt(stop, QColor(color))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawEllipse(QRectF(rect))
+    
+    def editorEvent(self, event, model, option, index):
+        """点击绘制的删除和启动按钮"""
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                                QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        batch_mode = index.data(BATCH_MODE_ROLE)
+        part = self._hit_test(option.rect, event.position().toPoint(), batch_mode)
+        if part is None:
+            # 批量模式下由视图处理选中
+            return False
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            name, data_dir = index.data(NAME_ROLE), index.data(DATA_DIR_ROLE)
+            if part == "delete":
+                self.delete_requested.emit(name, data_dir)
+            else:
+                self.launch_requested.emit(name, data_dir)
+        return True
+    
+    def eventFilter(self, obj, event):
+        """跟踪鼠标所在的按钮，只重绘悬停状态发生变化的卡片"""
+        if obj is self._viewport:
+            if event.type() == QEvent.Type.MouseMove:
+                pos = event.position().toPoint()
+                index = self.view.indexAt(pos)
+                part = None
+                if index.isValid():
+                    part = self._hit_test(self.view.visualRect(index), pos, index.data(BATCH_MODE_ROLE))
+                self._set_hover(index.row() if index.isValid() else -1, part)
+            elif event.type() == QEvent.Type.Leave:
+                self._set_hover(-1, None)
+        return super().eventFilter(obj, event)
+    
+    def _set_hover(self, row, part):
+        if row == self._hover_row and part == self._hover_part:
+            return
+        model = self.view.model()
+        for changed_row in {self._hover_row, row}:
+            if 0 <= changed_row < model.rowCount():
+                self.view.update(model.index(changed_row, 0))
+        self._hover_row = row
+        self._hover_part = part
+        cursor = Qt.CursorShape.PointingHandCursor if part is not None else Qt.CursorShape.ArrowCursor
+        self._viewport.setCursor(cursor)
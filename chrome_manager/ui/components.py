@@ -7,44 +7,29 @@ from PyQt6.QtCore import Qt, QSize, QRectF
 from PyQt6.QtGui import QPainter, QPainterPath, QColor
 
 from chrome_manager.constants import (
-    PRIMARY_COLOR, BACKGROUND_COLOR, BORDER_COLOR, TEXT_PRIMARY_COLOR, 
-    TEXT_HINT_COLOR, SURFACE_COLOR, FONT_FAMILY, TEXT_SECONDARY_COLOR,
     SUCCESS_COLOR, DANGER_COLOR, WARNING_COLOR, get_screen_size
 )
+from .theme import set_style_property
 
 class ModernLineEdit(QLineEdit):
-    """现代风格的输入框组件"""
+    """现代风格的输入框组件，样式由应用样式表中的ModernLineEdit规则提供"""
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setMinimumHeight(36)
-        self.setStyleSheet(f"""
-            QLineEdit {{
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: {BACKGROUND_COLOR};
-                color: {TEXT_PRIMARY_COLOR};
-                selection-background-color: {PRIMARY_COLOR}40;
-            }}
-            QLineEdit:focus {{
-                border: 1.5px solid {PRIMARY_COLOR};
-            }}
-            QLineEdit:hover:!focus {{
-                border: 1px solid #B0B0B0;
-            }}
-            QLineEdit:disabled {{
-                background-color: {SURFACE_COLOR};
-                color: {TEXT_HINT_COLOR};
-            }}
-        """)
 
 class ModernButton(QPushButton):
-    """现代风格的按钮组件"""
+    """
+    现代风格的按钮组件
+    
+    样式由应用样式表提供，强调、危险和选中状态通过动态属性accent、danger、selected区分，
+    切换状态只需修改属性，不需要重新设置样式表。
+    """
     
     def __init__(self, text="", icon=None, accent=False, *args, **kwargs):
         super().__init__(text, *args, **kwargs)
         self.accent = accent
+        self.setProperty("accent", accent)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         # 根据屏幕分辨率调整按钮高度
@@ -60,79 +45,22 @@ class ModernButton(QPushButton):
         if icon:
             self.setIcon(icon)
             self.setIconSize(QSize(18, 18))
-        
-        # 根据是否是强调按钮设置样式
-        self._update_style()
     
-    def _update_style(self):
-        if self.accent:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {PRIMARY_COLOR};
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: #1C75E5;
-                }}
-                QPushButton:pressed {{
-                    background-color: #1567D3;
-                }}
-                QPushButton:disabled {{
-                    background-color: {SURFACE_COLOR};
-                    color: {TEXT_HINT_COLOR};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {SURFACE_COLOR};
-                    color: {TEXT_PRIMARY_COLOR};
-                    border: 1px solid {BORDER_COLOR};
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: #EAECEF;
-                }}
-                QPushButton:pressed {{
-                    background-color: #DEE2E6;
-                }}
-                QPushButton:disabled {{
-                    background-color: {SURFACE_COLOR};
-                    color: {TEXT_HINT_COLOR};
-                }}
-            """)
+    def set_accent(self, accent):
+        """切换强调样式"""
+        self.accent = accent
+        set_style_property(self, "accent", accent)
+    
+    def set_selected(self, selected):
+        """切换选中样式"""
+        set_style_property(self, "selected", selected)
 
 class DangerButton(ModernButton):
     """危险操作按钮组件"""
     
     def __init__(self, text="", icon=None, *args, **kwargs):
         super().__init__(text, icon, False, *args, **kwargs)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DANGER_COLOR};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #E53935;
-            }}
-            QPushButton:pressed {{
-                background-color: #D32F2F;
-            }}
-            QPushButton:disabled {{
-                background-color: {SURFACE_COLOR};
-                color: {TEXT_HINT_COLOR};
-            }}
-        """)
+        self.setProperty("danger", True)
 
 class StatusWidget(QWidget):
     """状态显示组件"""
@@ -10,10 +10,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtGui import QColor, QMouseEvent
 
-from ..constants import (
-    PRIMARY_COLOR, BACKGROUND_COLOR, TEXT_PRIMARY_COLOR, 
-    TEXT_SECONDARY_COLOR, FONT_FAMILY
-)
 from .components import ModernLineEdit, ModernButton
 
 class ModernDialog(QDialog):
@@ -35,13 +31,7 @@ class ModernDialog(QDialog):
             
         self.setWindowModality(Qt.WindowModality.ApplicationModal)
         
-        # 设置样式 - 使用边框
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {BACKGROUND_COLOR};
-                border: 1px solid #E0E0E0;
-            }}
-        """)
+        # 背景和边框由应用样式表中的ModernDialog规则提供
         
         # 添加阴影效果
         shadow = QGraphicsDropShadowEffect(self)
@@ -88,27 +78,11 @@ class AddShortcutDialog(ModernDialog):
         title_bar.setSpacing(0)
         
         title_label = QLabel("添加新的Chrome实例")
-        title_label.setStyleSheet(f"color: {TEXT_PRIMARY_COLOR}; font-weight: bold; font-size: 12pt;")
+        title_label.setProperty("role", "dialog-title")
         
         close_btn = ModernButton("×")
         close_btn.setFixedSize(30, 30)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 15px;
-                color: {TEXT_SECONDARY_COLOR};
-                font-size: 16pt;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 0, 0, 0.05);
-                color: {TEXT_PRIMARY_COLOR};
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        close_btn.setProperty("variant", "close")
         close_btn.clicked.connect(self.reject)
         
         title_bar.addWidget(title_label)
@@ -126,7 +100,7 @@ class AddShortcutDialog(ModernDialog):
         name_layout = QVBoxLayout()
         name_layout.setSpacing(8)
         name_label = QLabel("快捷方式名称")
-        name_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        name_label.setProperty("role", "field-label")
         self.name_edit = ModernLineEdit(f"Chrome实例{shortcut_count + 1}")
         name_layout.addWidget(name_label)
         name_layout.addWidget(self.name_edit)
@@ -136,7 +110,7 @@ class AddShortcutDialog(ModernDialog):
         dir_layout = QVBoxLayout()
         dir_layout.setSpacing(8)
         dir_label = QLabel("数据目录名")
-        dir_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        dir_label.setProperty("role", "field-label")
         self.dir_edit = ModernLineEdit(f"Profile{shortcut_count + 1}")
         dir_layout.addWidget(dir_label)
         dir_layout.addWidget(self.dir_edit)
@@ -147,7 +121,7 @@ class AddShortcutDialog(ModernDialog):
         
         # 添加说明文本
         help_text = QLabel("数据目录名会作为Chrome用户数据存储目录的名称，\n不同实例应使用不同的数据目录名以避免冲突。")
-        help_text.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR}; font-size: 9pt;")
+        help_text.setProperty("role", "help")
         help_text.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(help_text)
         
@@ -160,41 +134,6 @@ class AddShortcutDialog(ModernDialog):
         self.cancel_button = ModernButton("取消")
         self.ok_button = ModernButton("确定", accent=True)
         
-        # 优化按钮样式
-        self.cancel_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #F5F5F5;
-                color: {TEXT_PRIMARY_COLOR};
-                border: 1px solid #E0E0E0;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #EAEAEA;
-            }}
-            QPushButton:pressed {{
-                background-color: #DADADA;
-            }}
-        """)
-        
-        self.ok_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {PRIMARY_COLOR};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #1C75E5;
-            }}
-            QPushButton:pressed {{
-                background-color: #1567D3;
-            }}
-        """)
-        
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
         
@@ -223,7 +162,7 @@ class SettingsDialog(ModernDialog):
         
         # 标题
         title_label = QLabel("全局设置")
-        title_label.setStyleSheet(f"color: {TEXT_PRIMARY_COLOR}; font-weight: bold; font-size: 16pt;")
+        title_label.setProperty("role", "dialog-title-large")
         layout.addWidget(title_label)
         
         # Chrome路径设置
@@ -231,7 +170,7 @@ class SettingsDialog(ModernDialog):
         chrome_layout.setSpacing(8)
         
         chrome_label = QLabel("Chrome路径")
-        chrome_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        chrome_label.setProperty("role", "field-label")
         
         chrome_input_layout = QHBoxLayout()
         self.chrome_path_edit = ModernLineEdit(self.chrome_path)
@@ -252,7 +191,7 @@ class SettingsDialog(ModernDialog):
         data_layout.setSpacing(8)
         
         data_label = QLabel("数据根目录")
-        data_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        data_label.setProperty("role", "field-label")
         
         data_input_layout = QHBoxLayout()
         self.data_root_edit = ModernLineEdit(self.data_root)
@@ -325,27 +264,11 @@ class BatchAddShortcutDialog(ModernDialog):
         title_bar.setSpacing(0)
         
         title_label = QLabel("批量添加Chrome实例")
-        title_label.setStyleSheet(f"color: {TEXT_PRIMARY_COLOR}; font-weight: bold; font-size: 12pt;")
+        title_label.setProperty("role", "dialog-title")
         
         close_btn = ModernButton("×")
         close_btn.setFixedSize(30, 30)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 15px;
-                color: {TEXT_SECONDARY_COLOR};
-                font-size: 16pt;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 0, 0, 0.05);
-                color: {TEXT_PRIMARY_COLOR};
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        close_btn.setProperty("variant", "close")
         close_btn.clicked.connect(self.reject)
         
         title_bar.addWidget(title_label)
@@ -363,7 +286,7 @@ class BatchAddShortcutDialog(ModernDialog):
         start_layout = QVBoxLayout()
         start_layout.setSpacing(8)
         start_label = QLabel("起始编号")
-        start_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        start_label.setProperty("role", "field-label")
         self.start_edit = ModernLineEdit(str(next_shortcut_number))
         start_layout.addWidget(start_label)
         start_layout.addWidget(self.start_edit)
@@ -373,7 +296,7 @@ class BatchAddShortcutDialog(ModernDialog):
         count_layout = QVBoxLayout()
         count_layout.setSpacing(8)
         count_label = QLabel("创建数量")
-        count_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        count_label.setProperty("role", "field-label")
         self.count_edit = ModernLineEdit("5")
         count_layout.addWidget(count_label)
         count_layout.addWidget(self.count_edit)
@@ -383,7 +306,7 @@ class BatchAddShortcutDialog(ModernDialog):
         prefix_layout = QVBoxLayout()
         prefix_layout.setSpacing(8)
         prefix_label = QLabel("命名前缀 (可选)")
-        prefix_label.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR};")
+        prefix_label.setProperty("role", "field-label")
         self.prefix_edit = ModernLineEdit("Chrome实例")
         prefix_layout.addWidget(prefix_label)
         prefix_layout.addWidget(self.prefix_edit)
@@ -394,7 +317,7 @@ class BatchAddShortcutDialog(ModernDialog):
         
         # 添加说明文本
         help_text = QLabel("将批量创建多个Chrome实例，每个实例名称将以指定前缀加上从起始编号开始的数字命名。\n数据目录会自动设置为Profile加数字的形式。")
-        help_text.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR}; font-size: 9pt;")
+        help_text.setProperty("role", "help")
         help_text.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(help_text)
         
@@ -407,41 +330,6 @@ class BatchAddShortcutDialog(ModernDialog):
         self.cancel_button = ModernButton("取消")
         self.ok_button = ModernButton("确定", accent=True)
         
-        # 优化按钮样式
-        self.cancel_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #F5F5F5;
-                color: {TEXT_PRIMARY_COLOR};
-                border: 1px solid #E0E0E0;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #EAEAEA;
-            }}
-            QPushButton:pressed {{
-                background-color: #DADADA;
-            }}
-        """)
-        
-        self.ok_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {PRIMARY_COLOR};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: #1C75E5;
-            }}
-            QPushButton:pressed {{
-                background-color: #1567D3;
-            }}
-        """)
-        
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
         
@@ -0,0 +1,183 @@
+"""
+图标缓存模块，每个Chrome程序的图标只提取一次，所有卡片共用同一个QPixmap
+"""
+
+import os
+import sys
+import hashlib
+import tempfile
+from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache
+
+# 导入提取图标所需的库
+if sys.platform == 'win32':
+    try:
+        import win32com.client
+    except ImportError:
+        print("无法导入win32com模块，将使用备用图标")
+
+ICON_SIZE = 48  # 提取的图标尺寸
+BUNDLED_ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons", "image.png")
+
+
+def extract_icon_from_exe(exe_path):
+    """
+    从exe文件中提取图标
+
+    临时快捷方式写入系统临时目录下的唯一文件，多个调用同时执行也不会互相覆盖。
+
+    Args:
+        exe_path: exe文件路径
+
+    Returns:
+        QPixmap: 提取的图标
+    """
+    try:
+        if not os.path.exists(exe_path):
+            return None
+
+        if sys.platform == 'win32':
+            # 使用快捷方式方法提取图标（更可靠）
+            fd, lnk_path = tempfile.mkstemp(suffix=".lnk", prefix="chrome_icon_")
+            os.close(fd)
+            try:
+                shell = win32com.client.Dispatch("WScript.Shell")
+                shortcut = shell.CreateShortCut(lnk_path)
+                shortcut.TargetPath = exe_path
+                # 使用Chrome的默认图标
+                shortcut.IconLocation = f"{exe_path}, 0"
+                shortcut.Save()
+
+                # 从快捷方式创建QIcon并获取像素图
+                icon = QIcon(lnk_path)
+                if not icon.isNull():
+                    return icon.pixmap(ICON_SIZE, ICON_SIZE)
+            except Exception as e:
+                print(f"创建临时快捷方式提取图标时出错: {str(e)}")
+            finally:
+                try:
+                    os.remove(lnk_path)
+                except OSError:
+                    pass
+
+        # 尝试直接从exe创建QIcon
+        icon = QIcon(exe_path)
+        if not icon.isNull():
+            return icon.pixmap(ICON_SIZE, ICON_SIZE)
+
+        return None
+    except Exception as e:
+        print(f"提取图标时出错: {str(e)}")
+        return None
+
+
+def icon_cache_key(exe_path):
+    """
+    由程序路径、修改时间和大小生成缓存键，Chrome更新后键随之改变
+
+    Returns:
+        str或None: 缓存键，文件不存在时为None
+    """
+    try:
+        stat = os.stat(exe_path)
+    except OSError:
+        return None
+    identity = f"{os.path.normcase(os.path.abspath(exe_path))}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class IconCache:
+    """
+    Chrome图标缓存
+
+    查找顺序为进程内的QPixmapCache、配置目录下的磁盘缓存，最后才通过快捷方式提取，
+    提取结果写入磁盘缓存，下次启动直接读取PNG。提取失败的程序在本次运行中不再重试。
+    只在UI线程中使用。
+    """
+
+    def __init__(self, cache_dir):
+        """
+        初始化图标缓存
+
+        Args:
+            cache_dir: 磁盘缓存目录
+        """
+        self.cache_dir = cache_dir
+        self._failed = set()  # 提取失败的缓存键
+        self._pinned = {}  # 缓存键 -> QPixmap，保证被QPixmapCache淘汰后也不用重新读取
+
+    def card_icon(self, chrome_path):
+        """
+        实例卡片使用的图标：优先使用内置图标图片，其次使用Chrome程序的图标
+
+        Returns:
+            QPixmap或None
+        """
+        pixmap = self._bundled_icon()
+        if pixmap is not None:
+            return pixmap
+        return self.chrome_icon(chrome_path)
+
+    def chrome_icon(self, exe_path):
+        """
+        返回Chrome程序的图标，每个程序版本只提取一次
+
+        Returns:
+            QPixmap或None
+        """
+        if not exe_path:
+            return None
+        key = icon_cache_key(exe_path)
+        if key is None or key in self._failed:
+            return None
+
+        pixmap = self._find(key)
+        if pixmap is not None:
+            return pixmap
+
+        disk_path = os.path.join(self.cache_dir, f"{key}.png")
+        pixmap = QPixmap(disk_path) if os.path.exists(disk_path) else None
+        if pixmap is None or pixmap.isNull():
+            pixmap = extract_icon_from_exe(exe_path)
+            if pixmap is None or pixmap.isNull():
+                self._failed.add(key)
+                return None
+            self._save(pixmap, disk_path)
+
+        self._insert(key, pixmap)
+        return pixmap
+
+    def _bundled_icon(self):
+        key = "bundled"
+        pixmap = self._find(key)
+        if pixmap is not None or key in self._failed:
+            return pixmap
+        pixmap = QPixmap(BUNDLED_ICON_PATH) if os.path.exists(BUNDLED_ICON_PATH) else None
+        if pixmap is None or pixmap.isNull():
+            self._failed.add(key)
+            return None
+        self._insert(key, pixmap)
+        return pixmap
+
+    def _find(self, key):
+        pixmap = QPixmapCache.find(f"chrome_icon:{key}")
+        if pixmap is None or pixmap.isNull():
+            return self._pinned.get(key)
+        return pixmap
+
+    def _insert(self, key, pixmap):
+        QPixmapCache.insert(f"chrome_icon:{key}", pixmap)
+        self._pinned[key] = pixmap
+
+    def _save(self, pixmap, disk_path):
+        """写入磁盘缓存，先写临时文件再替换，中断时不会留下不完整的PNG"""
+        temp_path = disk_path + ".part"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if pixmap.save(temp_path, "PNG"):
+                os.replace(temp_path, disk_path)
+        except OSError as e:
+            print(f"写入图标缓存失败: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
@@ -0,0 +1,245 @@
+"""
+实例列表模型，把实例仓库提供给主页的QListView
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+# 自定义数据角色
+NAME_ROLE = Qt.ItemDataRole.UserRole + 1
+DATA_DIR_ROLE = Qt.ItemDataRole.UserRole + 2
+RUNNING_ROLE = Qt.ItemDataRole.UserRole + 3
+USAGE_ROLE = Qt.ItemDataRole.UserRole + 4
+BATCH_MODE_ROLE = Qt.ItemDataRole.UserRole + 5
+
+
+class InstanceListModel(QAbstractListModel):
+    """
+    主页实例列表模型
+
+    行按实例编号排序，与实例仓库的顺序一致。仓库的增删信号被转换为
+    行插入/删除，视图只重新布局受影响的位置；一次增删很多实例或仓库被重新加载时，
+    按实例名称比较新旧两个列表，只删除消失的行、插入新增的行，连续的行合并为一个范围，
+    未变化的行保持不动，视图的选中状态和滚动位置随之保留。
+    运行状态和资源占用变化时只通知对应的行重绘。
+
+    批量模式是模型的一个标志：批量模式下行可以被选中，委托绘制选择框而不是删除按钮。
+    """
+
+    BULK_THRESHOLD = 64  # 一次增删超过此数量时整体比较新旧列表，而不是逐行二分插入
+
+    def __init__(self, repository, resource_model=None, parent=None):
+        """
+        初始化模型
+
+        Args:
+            repository: InstanceRepository
+            resource_model: InstanceResourceModel，提供资源占用，可以为None
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.repository = repository
+        self.resource_model = resource_model
+        self.batch_mode = False
+        self._records = list(repository.sorted_records())
+        self._running = set()  # 正在运行的规范化数据目录
+
+        repository.instances_added.connect(self._on_instances_added)
+        repository.instances_removed.connect(self._on_instances_removed)
+        repository.instances_changed.connect(self._on_instances_changed)
+        repository.instances_reset.connect(self._on_instances_reset)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._records):
+            return None
+        record = self._records[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, NAME_ROLE):
+            return record.name
+        if role == DATA_DIR_ROLE:
+            return record.data_dir
+        if role == RUNNING_ROLE:
+            return record.data_dir_key in self._running
+        if role == USAGE_ROLE:
+            return self._usage(record)
+        if role == BATCH_MODE_ROLE:
+            return self.batch_mode
+        if role == Qt.ItemDataRole.ToolTipRole:
+            usage = self._usage(record)
+            if usage is None:
+                return record.data_dir
+            return f"{record.data_dir}\n{usage['process_count']}个进程, {usage['threads']}个线程"
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if self.batch_mode:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def record_at(self, row):
+        """返回某一行的实例记录"""
+        return self._records[row]
+
+    def row_of(self, record):
+        """按排序键二分查找记录所在的行，不在模型中时返回-1"""
+        row = self._insert_position(record.sort_key())
+        if row < len(self._records) and self._records[row] is record:
+            return row
+        return -1
+
+    def set_batch_mode(self, enabled):
+        """切换批量模式，所有行需要重绘选择框"""
+        if self.batch_mode == enabled:
+            return
+        self.batch_mode = enabled
+        self._emit_all_changed([BATCH_MODE_ROLE])
+
+    def set_running_states(self, changes):
+        """
+        更新运行状态，只通知状态变化的行
+
+        Args:
+            changes: {规范化数据目录: 是否正在运行}
+        """
+        for data_dir_key, running in changes.items():
+            if running:
+                self._running.add(data_dir_key)
+            else:
+                self._running.discard(data_dir_key)
+            self._emit_row_changed(data_dir_key, [RUNNING_ROLE, USAGE_ROLE])
+
+    def running_data_dirs(self):
+        """正在运行的规范化数据目录集合"""
+        return self._running
+
+    def update_usage(self, changes):
+        """
+        资源占用变化，只通知对应的行
+
+        Args:
+            changes: {规范化数据目录: 资源占用字典或None}
+        """
+        for data_dir_key in changes:
+            self._emit_row_changed(data_dir_key, [USAGE_ROLE, Qt.ItemDataRole.ToolTipRole])
+
+    def _usage(self, record):
+        if self.resource_model is None:
+            return None
+        return self.resource_model.usage_for(record.data_dir_key)
+
+    def _emit_row_changed(self, data_dir_key, roles):
+        record = self.repository.by_data_dir_key(data_dir_key)
+        if record is None:
+            return
+        row = self.row_of(record)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, roles)
+
+    def _emit_all_changed(self, roles):
+        if self._records:
+            self.dataChanged.emit(self.index(0), self.index(len(self._records) - 1), roles)
+
+    def _insert_position(self, key):
+        """排序键在当前行中的插入位置（二分查找）"""
+        low, high = 0, len(self._records)
+        while low < high:
+            mid = (low + high) // 2
+            if self._records[mid].sort_key() < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _insert_record(self, record):
+        self._insert_rows(self._insert_position(record.sort_key()), [record])
+
+    def _on_instances_added(self, records):
+        if len(records) > self.BULK_THRESHOLD:
+            self._reconcile()
+            return
+        for record in records:
+            self._insert_record(record)
+
+    def _on_instances_removed(self, records):
+        if len(records) > self.BULK_THRESHOLD:
+            self._reconcile()
+            return
+        for record in records:
+            row = self.row_of(record)
+            if row >= 0:
+                self._remove_rows(row, row)
+
+    def _on_instances_changed(self, records):
+        for record in records:
+            # 排序键可能已经改变，按对象查找原来的行
+            for row, existing in enumerate(self._records):
+                if existing is record:
+                    self._remove_rows(row, row)
+                    break
+            self._insert_record(record)
+
+    def _on_instances_reset(self):
+        self._reconcile()
+
+    def _reconcile(self):
+        """
+        按实例名称把当前行与仓库的列表对齐，只发出必要的行删除、插入和数据变化通知
+
+        新旧两个列表都按排序键有序，先从后往前删除消失或排序位置改变的行，
+        再顺序合并插入新增的行，整体为O(N)。
+        """
+        target = self.repository.sorted_records()
+        by_name = {record.name: record for record in target}
+
+        # 删除：名称已不存在或排序键改变的行，连续的行合并为一次删除
+        end = None
+        for row in range(len(self._records) - 1, -1, -1):
+            old = self._records[row]
+            new = by_name.get(old.name)
+            stale = new is None or new.sort_key() != old.sort_key()
+            if stale and end is None:
+                end = row
+            elif not stale and end is not None:
+                self._remove_rows(row + 1, end)
+                end = None
+        if end is not None:
+            self._remove_rows(0, end)
+
+        # 保留的行换用仓库中的新记录，数据目录变化的行通知重绘
+        for row, old in enumerate(self._records):
+            new = by_name[old.name]
+            if new is old:
+                continue
+            self._records[row] = new
+            if new.data_dir != old.data_dir:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+        # 插入：顺序合并，目标列表中连续的新行一次插入
+        row = 0
+        pending = []
+        for record in target:
+            if row < len(self._records) and self._records[row].name == record.name:
+                if pending:
+                    self._insert_rows(row, pending)
+                    row += len(pending)
+                    pending = []
+                row += 1
+            else:
+                pending.append(record)
+        if pending:
+            self._insert_rows(row, pending)
+
+    def _remove_rows(self, first, last):
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._records[first:last + 1]
+        self.endRemoveRows()
+
+    def _insert_rows(self, row, records):
+        self.beginInsertRows(QModelIndex(), row, row + len(records) - 1)
+        self._records[row:row] = records
+        self.endInsertRows()
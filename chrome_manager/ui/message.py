@@ -4,12 +4,8 @@
 
 from PyQt6.QtWidgets import QMessageBox
 
-from ..constants import (
-    PRIMARY_COLOR, BACKGROUND_COLOR, TEXT_PRIMARY_COLOR, FONT_FAMILY
-)
-
 class MessageDialogs:
-    """消息对话框工具类，提供各种类型的消息对话框"""
+    """消息对话框工具类，提供各种类型的消息对话框，样式由应用样式表中的QMessageBox[variant="message"]规则提供"""
     
     def __init__(self, parent):
         """
@@ -32,7 +28,7 @@ class MessageDialogs:
         msg_box.setIcon(QMessageBox.Icon.Information)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStyleSheet(self._get_message_style())
+        msg_box.setProperty("variant", "message")
         msg_box.exec()
     
     def show_error_message(self, message, title="错误"):
@@ -47,7 +43,7 @@ class MessageDialogs:
         msg_box.setIcon(QMessageBox.Icon.Critical)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStyleSheet(self._get_message_style())
+        msg_box.setProperty("variant", "message")
         msg_box.exec()
     
     def show_success_message(self, message, title="成功"):
@@ -62,7 +58,7 @@ class MessageDialogs:
         msg_box.setIcon(QMessageBox.Icon.Information)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStyleSheet(self._get_message_style())
+        msg_box.setProperty("variant", "message")
         msg_box.exec()
     
     def show_confirm_dialog(self, message, title="确认"):
@@ -82,36 +78,5 @@ class MessageDialogs:
         msg_box.setText(message)
         msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         msg_box.setDefaultButton(QMessageBox.StandardButton.Yes)
-        msg_box.setStyleSheet(self._get_message_style())
+        msg_box.setProperty("variant", "message")
         return msg_box.exec() == QMessageBox.StandardButton.Yes
-    
-    def _get_message_style(self):
-        """
-        获取消息对话框样式
-        
-        Returns:
-            str: 样式表字符串
-        """
-        return f"""
-            QMessageBox {{
-                background-color: {BACKGROUND_COLOR};
-            }}
-            QLabel {{
-                color: {TEXT_PRIMARY_COLOR};
-            }}
-            QPushButton {{
-                background-color: {PRIMARY_COLOR};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                min-width: 80px;
-                min-height: 30px;
-            }}
-            QPushButton:hover {{
-                background-color: #1C75E5;
-            }}
-            QPushButton:pressed {{
-                background-color: #1567D3;
-            }}
-        """ 
\ No newline at end of file
@@ -6,5 +6,6 @@ from .home_page import HomePage
 from .account_page import AccountPage
 from .settings_page import SettingsPage 
 from .script_page import ScriptPage
+from .monitor_page import MonitorPage
 
-__all__ = ['HomePage', 'AccountPage', 'SettingsPage', 'ScriptPage'] 
\ No newline at end of file
+__all__ = ['HomePage', 'AccountPage', 'SettingsPage', 'ScriptPage', 'MonitorPage'] 
\ No newline at end of file
@@ -3,16 +3,26 @@
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QScrollArea, QGridLayout, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFileDialog,
+    QTableView, QHeaderView, QStackedWidget, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from ...constants import (
-    TEXT_PRIMARY_COLOR, TEXT_SECONDARY_COLOR, TEXT_HINT_COLOR, FONT_FAMILY
-)
+from ...constants import FONT_FAMILY
 from ..components import ModernButton, ModernLineEdit
+from ...database_manager import BLIND_INDEX_FIELDS
+from ...account_io import AccountTransferThread
+from ..account_model import AccountTableModel, NAME_COLUMN
+
+# 盲索引字段的显示名称
+FIELD_LABELS = {
+    "wallet": "钱包地址",
+    "twitter": "Twitter",
+    "discord": "Discord",
+    "telegram": "Telegram",
+    "gmail": "Gmail"
+}
 
 class AccountPage(QWidget):
     """账号管理页面类"""
@@ -21,7 +31,16 @@ class AccountPage(QWidget):
         """初始化账号管理页面"""
         super().__init__(parent)
         self.main_window = parent
+        self.transfer_thread = None  # 正在进行的导入或导出
+        
+        # 表格的行跟随实例仓库增删，账号信息在行可见时才解密
+        config_manager = self.main_window.config_manager
+        self.account_model = AccountTableModel(config_manager.instances, config_manager.account_store, self)
         self._init_ui()
+        
+        self.account_model.rowsInserted.connect(self._update_placeholder)
+        self.account_model.rowsRemoved.connect(self._update_placeholder)
+        self.account_model.modelReset.connect(self._update_placeholder)
     
     def _init_ui(self):
         """初始化UI"""
@@ -36,79 +55,72 @@ class AccountPage(QWidget):
         
         # 说明文字
         description = QLabel("管理每个浏览器实例对应的账号信息，包括钱包和社交媒体账号")
-        description.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR}; font-size: 14px; margin-bottom: 8px;")
+        description.setProperty("role", "page-description")
         description.setWordWrap(True)
         account_layout.addWidget(description)
         
-        # 账号信息区域（滚动区域）
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                width: 8px;
-                background: transparent;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #CCCCCC;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #AAAAAA;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """)
-        
-        # 背景容器
-        background_widget = QWidget()
-        background_widget.setStyleSheet("background-color: white; border-radius: 8px;")
-        background_layout = QVBoxLayout(background_widget)
-        background_layout.setContentsMargins(0, 0, 0, 0)
+        # 账号信息表格，没有实例时显示占位符
+        self.account_stack = QStackedWidget()
         
-        # 内容容器
-        self.account_content_widget = QWidget()
-        self.account_content_widget.setStyleSheet("background-color: transparent;")
-        self.account_content_layout = QVBoxLayout(self.account_content_widget)
-        self.account_content_layout.setContentsMargins(16, 16, 16, 16)  # 内边距
-        self.account_content_layout.setSpacing(12)  # 减小卡片之间的间距
-        
-        # 先添加一个占位符，后续会根据实际情况更新
         self.account_placeholder = QLabel("暂无浏览器实例数据。请先在主页创建浏览器实例，然后在此处管理对应的账号信息。")
-        self.account_placeholder.setStyleSheet(f"""
-            color: #505050; 
-            font-size: 15px;
-            margin: 40px 20px;
-            padding: 20px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            border: 1px dashed #cccccc;
-        """)
+        self.account_placeholder.setObjectName("accountPlaceholder")
         self.account_placeholder.setWordWrap(True)
-        self.account_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.account_content_layout.addWidget(self.account_placeholder)
-        
-        # 添加弹性空间
-        self.account_content_layout.addStretch()
+        self.account_placeholder.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
+        self.account_stack.addWidget(self.account_placeholder)
         
-        # 将内容添加到背景容器
-        background_layout.addWidget(self.account_content_widget)
-        
-        # 设置滚动区域的内容
-        scroll_area.setWidget(background_widget)
-        account_layout.addWidget(scroll_area)
+        # 视图只为可见的行请求数据，实例再多也只解密屏幕上的账号
+        self.account_table = QTableView()
+        self.account_table.setObjectName("accountTable")
+        self.account_table.setModel(self.account_model)
+        self.account_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
+        self.account_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.account_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        self.account_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.account_table.setWordWrap(False)
+        self.account_table.setAlternatingRowColors(True)
+        self.account_table.verticalHeader().setVisible(False)
+        # 固定行高和列宽模式，不需要为计算尺寸而读取所有行
+        self.account_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.account_table.verticalHeader().setDefaultSectionSize(36)
+        header = self.account_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(NAME_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(NAME_COLUMN, 140)
+        header.setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        header.setHighlightSections(False)
+        self.account_stack.addWidget(self.account_table)
+        account_layout.addWidget(self.account_stack)
         
         # 保存按钮
         save_btn_layout = QHBoxLayout()
+        
+        # 按账号精确查找实例和检查重复账号，通过盲索引查询，不解密
+        self.account_search_edit = ModernLineEdit()
+        self.account_search_edit.setPlaceholderText("输入钱包地址、邮箱等查找所属实例")
+        self.account_search_edit.returnPressed.connect(self.search_account)
+        save_btn_layout.addWidget(self.account_search_edit, 1)
+        
+        search_btn = ModernButton("查找")
+        search_btn.clicked.connect(self.search_account)
+        save_btn_layout.addWidget(search_btn)
+        
+        duplicate_btn = ModernButton("检查重复账号")
+        duplicate_btn.clicked.connect(self.show_duplicate_accounts)
+        save_btn_layout.addWidget(duplicate_btn)
+        
+        # 批量导入导出在后台线程中流式执行
+        self.import_btn = ModernButton("导入")
+        self.import_btn.clicked.connect(self.import_accounts)
+        save_btn_layout.addWidget(self.import_btn)
+        
+        self.export_btn = ModernButton("导出")
+        self.export_btn.clicked.connect(self.export_accounts)
+        save_btn_layout.addWidget(self.export_btn)
+        
         save_account_btn = ModernButton("保存账号信息", accent=True)
         save_account_btn.clicked.connect(self.save_account_info)
         save_account_btn.setMinimumWidth(120)
@@ -116,243 +128,145 @@ class AccountPage(QWidget):
         save_btn_layout.addWidget(save_account_btn)
         account_layout.addLayout(save_btn_layout)
         
-        # 预先检查是否有实例，初始设置占位符状态
-        self.account_placeholder.setVisible(True)
+        self._update_placeholder()
     
     def update_cards(self):
-        """更新账号管理卡片"""
-        try:
-            # 清除现有的所有卡片
-            for i in reversed(range(self.account_content_layout.count()-1)):  # 保留最后的stretch
-                item = self.account_content_layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    # 不要删除占位符标签
-                    if widget != self.account_placeholder:
-                        widget.setParent(None)
-            
-            # 如果没有浏览器实例，显示占位符并返回
-            if not self.main_window.shortcuts:
-                self.account_placeholder.setVisible(True)
-                # 确保占位符在布局中的位置正确
-                self.account_content_layout.insertWidget(0, self.account_placeholder)
-                return
-            
-            # 有实例时隐藏占位符
-            self.account_placeholder.setVisible(False)
-            
-            # 对实例列表按照后缀数字从小到大排序
-            sorted_shortcuts = sorted(self.main_window.shortcuts, key=self._extract_instance_number)
-            
-            # 为每个浏览器实例创建一个账号信息卡片
-            for shortcut in sorted_shortcuts:
-                name = shortcut["name"]
-                data_dir = shortcut["data_dir"]
-                
-                # 创建卡片容器
-                card = QWidget()
-                card.setObjectName(f"account_card_{name}")
-                card.setStyleSheet("""
-                    QWidget {
-                        background-color: #f8f9fa;
-                        border-radius: 6px;
-                    }
-                """)
-                
-                card_layout = QVBoxLayout(card)
-                card_layout.setContentsMargins(16, 12, 16, 12)  # 减小内边距
-                card_layout.setSpacing(8)  # 减小间距
-                
-                # 标题和数据目录在一行
-                header_layout = QHBoxLayout()
-                header_layout.setSpacing(10)
-                
-                # 标题
-                title = QLabel(name)
-                title.setFont(QFont(FONT_FAMILY, 12, QFont.Weight.Bold))
-                title.setStyleSheet("color: #1a73e8;")
-                header_layout.addWidget(title)
-                header_layout.addStretch()
-                
-                card_layout.addLayout(header_layout)
-                
-                # 添加分隔线
-                separator = QFrame()
-                separator.setFrameShape(QFrame.Shape.HLine)
-                separator.setStyleSheet("background-color: #e0e0e0; margin: 0 -8px;")
-                separator.setMaximumHeight(1)
-                card_layout.addWidget(separator)
-                
-                # 账号信息表单 - 使用三列布局提高空间利用率
-                form_layout = QGridLayout()
-                form_layout.setHorizontalSpacing(20)  # 水平间距稍大
-                form_layout.setVerticalSpacing(10)  # 减小垂直间距
-                
-                # 定义标签样式
-                label_style = "color: #555555; font-weight: 500; font-size: 13px;"
-                
-                # 定义输入框样式
-                input_style = """
-                    ModernLineEdit {
-                        border: none;
-                        border-bottom: 1px solid #dadce0;
-                        background-color: transparent;
-                        padding: 4px 0;
-                    }
-                    ModernLineEdit:focus {
-                        border-bottom: 2px solid #1a73e8;
-                    }
-                """
-                
-                # 第一列 - 钱包和Twitter
-                # 钱包地址
-                wallet_label = QLabel("钱包地址:")
-                wallet_label.setStyleSheet(label_style)
-                wallet_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("wallet", ""))
-                wallet_input.setObjectName(f"wallet_{name}")
-                wallet_input.setPlaceholderText("请输入钱包地址")
-                wallet_input.setStyleSheet(input_style)
-                form_layout.addWidget(wallet_label, 0, 0)
-                form_layout.addWidget(wallet_input, 0, 1)
-                
-                # Twitter
-                twitter_label = QLabel("Twitter:")
-                twitter_label.setStyleSheet(label_style)
-                twitter_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("twitter", ""))
-                twitter_input.setObjectName(f"twitter_{name}")
-                twitter_input.setPlaceholderText("请输入Twitter账号")
-                twitter_input.setStyleSheet(input_style)
-                form_layout.addWidget(twitter_label, 1, 0)
-                form_layout.addWidget(twitter_input, 1, 1)
-                
-                # 第二列 - Discord和Telegram
-                # Discord
-                discord_label = QLabel("Discord:")
-                discord_label.setStyleSheet(label_style)
-                discord_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("discord", ""))
-                discord_input.setObjectName(f"discord_{name}")
-                discord_input.setPlaceholderText("请输入Discord账号")
-                discord_input.setStyleSheet(input_style)
-                form_layout.addWidget(discord_label, 0, 2)
-                form_layout.addWidget(discord_input, 0, 3)
-                
-                # Telegram
-                telegram_label = QLabel("Telegram:")
-                telegram_label.setStyleSheet(label_style)
-                telegram_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("telegram", ""))
-                telegram_input.setObjectName(f"telegram_{name}")
-                telegram_input.setPlaceholderText("请输入Telegram账号")
-                telegram_input.setStyleSheet(input_style)
-                form_layout.addWidget(telegram_label, 1, 2)
-                form_layout.addWidget(telegram_input, 1, 3)
-                
-                # 第三列 - Gmail和备注
-                # Gmail
-                gmail_label = QLabel("Gmail:")
-                gmail_label.setStyleSheet(label_style)
-                gmail_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("gmail", ""))
-                gmail_input.setObjectName(f"gmail_{name}")
-                gmail_input.setPlaceholderText("请输入Gmail账号")
-                gmail_input.setStyleSheet(input_style)
-                form_layout.addWidget(gmail_label, 0, 4)
-                form_layout.addWidget(gmail_input, 0, 5)
-                
-                # 备注
-                note_label = QLabel("备注:")
-                note_label.setStyleSheet(label_style)
-                note_input = ModernLineEdit(self.main_window.account_info.get(name, {}).get("note", ""))
-                note_input.setObjectName(f"note_{name}")
-                note_input.setPlaceholderText("其他备注信息")
-                note_input.setStyleSheet(input_style)
-                form_layout.addWidget(note_label, 1, 4)
-                form_layout.addWidget(note_input, 1, 5)
-                
-                # 设置各列的拉伸比例
-                for col in [1, 3, 5]:  # 输入框列
-                    form_layout.setColumnStretch(col, 1)
-                
-                card_layout.addLayout(form_layout)
-                
-                # 添加卡片到容器
-                self.account_content_layout.insertWidget(self.account_content_layout.count()-1, card)
-        except Exception as e:
-            # 捕获并处理异常，避免在没有实例时弹出Python窗口
-            print(f"更新账号卡片时出错: {str(e)}")
-            # 确保占位符可见
-            self.account_placeholder.setVisible(True)
-            # 确保占位符在布局中的位置正确
-            self.account_content_layout.insertWidget(0, self.account_placeholder)
-    
-    def _extract_instance_number(self, shortcut):
-        """从实例名称中提取数字用于排序"""
-        name = shortcut["name"]
-        try:
-            # 提取"Chrome实例"后面的数字
-            if name.startswith("Chrome实例"):
-                return int(name[len("Chrome实例"):])
-            
-            # 如果不是以Chrome实例开头，尝试其他方式提取数字
-            # 从末尾开始寻找数字
-            digits = ""
-            for char in reversed(name):
-                if char.isdigit():
-                    digits = char + digits
-                elif digits:  # 如果已经找到了数字，且当前字符不是数字，则中断
-                    break
-            
-            if digits:
-                return int(digits)
-        except (ValueError, IndexError):
-            pass
+        """
+        刷新账号表格
         
-        # 如果无法提取数字，返回一个大数作为默认值（放在最后）
-        return float('inf')
+        表格的行由模型跟随实例仓库维护，这里只在账号信息重新加载后通知视图重绘可见的行。
+        """
+        self.account_model.refresh()
+        self._update_placeholder()
+    
+    def _update_placeholder(self, *args):
+        """没有实例时显示占位符"""
+        has_rows = self.account_model.rowCount() > 0
+        self.account_stack.setCurrentWidget(self.account_table if has_rows else self.account_placeholder)
     
     def save_account_info(self):
-        """保存账号信息"""
+        """保存账号信息，只写入被编辑过的单元格所属的实例"""
         # 检查是否有浏览器实例
-        if not self.main_window.shortcuts:
+        if not self.main_window.instances:
             # 不再弹出消息框，而是在状态栏显示消息
             self.main_window.statusBar().showMessage("暂无浏览器实例数据。请先在主页创建浏览器实例，然后再管理账号信息。", 5000)
             return
-            
-        updated_account_info = {}
         
-        # 遍历所有浏览器实例
-        for shortcut in self.main_window.shortcuts:
-            name = shortcut["name"]
-            instance_info = {}
-            
-            # 获取各个字段的值
-            wallet_input = self.findChild(ModernLineEdit, f"wallet_{name}")
-            twitter_input = self.findChild(ModernLineEdit, f"twitter_{name}")
-            discord_input = self.findChild(ModernLineEdit, f"discord_{name}")
-            telegram_input = self.findChild(ModernLineEdit, f"telegram_{name}")
-            gmail_input = self.findChild(ModernLineEdit, f"gmail_{name}")
-            note_input = self.findChild(ModernLineEdit, f"note_{name}")
-            
-            if wallet_input:
-                instance_info["wallet"] = wallet_input.text().strip()
-            if twitter_input:
-                instance_info["twitter"] = twitter_input.text().strip()
-            if discord_input:
-                instance_info["discord"] = discord_input.text().strip()
-            if telegram_input:
-                instance_info["telegram"] = telegram_input.text().strip()
-            if gmail_input:
-                instance_info["gmail"] = gmail_input.text().strip()
-            if note_input:
-                instance_info["note"] = note_input.text().strip()
-            
-            updated_account_info[name] = instance_info
+        # 正在编辑的单元格先提交到模型
+        self.account_table.setFocus()
         
-        # 更新账号信息
-        self.main_window.account_info = updated_account_info
+        changed = self.account_model.commit_edits()
         
-        # 保存到配置
-        config = self.main_window.config_manager.load_config()
-        config["account_info"] = self.main_window.account_info
-        self.main_window.config_manager.save_config(config)
+        # 保存到配置，只会写入发生变化的账号
+        print(f"账号信息有{changed}个实例发生变化")
+        self.main_window.config_manager.save_config(self.main_window.current_config())
         
         # 使用状态栏显示成功消息，而不是弹窗
-        self.main_window.statusBar().showMessage("账号信息已保存", 3000) 
\ No newline at end of file
+        self.main_window.statusBar().showMessage("账号信息已保存", 3000)
+    
+    def search_account(self):
+        """按账号字段的精确值查找实例（只查询已保存的账号）"""
+        value = self.account_search_edit.text().strip()
+        if not value:
+            return
+        
+        db_manager = self.main_window.config_manager.db_manager
+        matches = []
+        for field in BLIND_INDEX_FIELDS:
+            for name in db_manager.find_instances_by_account(field, value):
+                matches.append(f"{name}（{FIELD_LABELS[field]}）")
+        
+        if matches:
+            self.main_window.statusBar().showMessage(f"找到 {len(matches)} 个匹配: {', '.join(matches[:10])}", 8000)
+            # 定位到第一个匹配的实例
+            row = self.account_model.row_of_name(matches[0].split("（")[0])
+            if row >= 0:
+                index = self.account_model.index(row, NAME_COLUMN)
+                self.account_table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+                self.account_table.setCurrentIndex(index)
+        else:
+            self.main_window.statusBar().showMessage("没有找到使用该账号的实例", 5000)
+    
+    def show_duplicate_accounts(self):
+        """显示在多个实例中重复使用的账号（只统计已保存的账号）"""
+        report = self.main_window.config_manager.db_manager.find_duplicate_accounts()
+        if not report:
+            self.main_window.message_dialogs.show_info_message("没有发现重复使用的账号", "检查重复账号")
+            return
+        
+        lines = []
+        for field, groups in report.items():
+            for names in groups:
+                lines.append(f"{FIELD_LABELS[field]}: {', '.join(names)}")
+        self.main_window.message_dialogs.show_info_message(
+            "以下实例使用了相同的账号：\n\n" + "\n".join(lines), "检查重复账号"
+        )
+    
+    def import_accounts(self):
+        """从CSV或JSONL文件导入实例和账号信息"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "导入账号信息", "", "账号文件 (*.csv *.jsonl);;所有文件 (*)"
+        )
+        if path:
+            self._start_transfer("import", path)
+    
+    def export_accounts(self):
+        """把所有实例和账号信息导出为CSV或JSONL文件"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "导出账号信息", "accounts.csv", "CSV文件 (*.csv);;JSONL文件 (*.jsonl)"
+        )
+        if path:
+            self._start_transfer("export", path)
+    
+    def _start_transfer(self, mode, path):
+        """保存页面上的修改后在后台开始导入或导出"""
+        if self.transfer_thread is not None:
+            return
+        
+        # 先把页面上的修改交给写线程，导入导出在其后执行
+        self.save_account_info()
+        
+        self.transfer_thread = AccountTransferThread(
+            mode, path, self.main_window.config_manager, self.main_window.data_root, self
+        )
+        self.transfer_thread.progress_changed.connect(self._on_transfer_progress)
+        self.transfer_thread.transfer_finished.connect(self._on_transfer_finished)
+        self.import_btn.setEnabled(False)
+        self.export_btn.setEnabled(False)
+        self.transfer_thread.start()
+    
+    def stop_transfer(self):
+        """取消正在进行的导入导出并等待线程退出"""
+        if self.transfer_thread is not None:
+            self.transfer_thread.cancel()
+            self.transfer_thread.wait()
+    
+    def _on_transfer_progress(self, processed, percent):
+        """显示导入导出进度"""
+        action = "导入" if self.transfer_thread.mode == "import" else "导出"
+        self.main_window.statusBar().showMessage(f"正在{action}: 已处理 {processed} 条 ({percent}%)")
+    
+    def _on_transfer_finished(self, result):
+        """导入导出完成"""
+        mode = self.transfer_thread.mode
+        self.transfer_thread.deleteLater()
+        self.transfer_thread = None
+        self.import_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+        
+        action = "导入" if mode == "import" else "导出"
+        # 导入直接写入了数据库，重新加载实例和账号信息
+        if mode == "import" and (result.imported or result.created):
+            self.main_window.load_config()
+            self.main_window.update_ui()
+        
+        lines = [result.summary()]
+        for where, reason in result.skipped[:10]:
+            lines.append(f"{where}: {reason}")
+        if result.skipped_count > 10:
+            lines.append(f"……共跳过 {result.skipped_count} 条")
+        self.main_window.statusBar().showMessage(f"{action}完成: {result.summary()}", 5000)
+        if result.error:
+            self.main_window.message_dialogs.show_error_message("\n".join(lines), f"{action}失败")
+        else:
+            self.main_window.message_dialogs.show_info_message("\n".join(lines), f"{action}账号信息")
@@ -5,31 +5,58 @@
 import os
 import time
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QScrollArea, QGridLayout, QApplication, QDialog, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDialog,
+    QListView, QStackedWidget, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QSize
 from PyQt6.QtGui import QFont
 
-from ...constants import (
-    TEXT_PRIMARY_COLOR, TEXT_SECONDARY_COLOR, TEXT_HINT_COLOR, FONT_FAMILY
-)
+from ...constants import FONT_FAMILY
 from ..components import ModernButton
 from ..dialogs import AddShortcutDialog, BatchAddShortcutDialog
-from ..cards import BrowserCard
-from chrome_manager.shortcuts import log_time
+from ..cards import BrowserCardDelegate, confirm_delete_instance, launch_browser
+from ..instance_model import InstanceListModel
+from chrome_manager.shortcuts import log_time, BulkCreateThread
+from chrome_manager.profile_lock import ProfileUsageDetector
 
 class HomePage(QWidget):
     """主页类，用于管理浏览器实例"""
     
+    # 批量删除期间进程快照的最长有效时间，整批最多只需扫描一次进程
+    BATCH_PROCESS_MAX_AGE = 60.0
+    
+    CARD_SPACING = 30  # 卡片间距
+    
     def __init__(self, parent=None):
         """初始化主页"""
         super().__init__(parent)
         self.main_window = parent
         self.is_batch_mode = False
         self.is_all_selected = False
-        self.card_widgets = []
+        self._batch_delete_pending = False  # 是否有批量删除等待删除服务完成
+        self._pending_deletes = set()  # 已提交删除、尚未移入回收站的实例名称
+        self._deleted_names = []  # 已删除、等待从仓库中移除的实例名称
+        self.bulk_create_thread = None  # 正在运行的批量创建线程
+        self.bulk_create_saving = False  # 批量创建的实例是否正在写入数据库
+        
+        # 实例列表模型直接跟随实例仓库的信号增删行，资源占用模型在主窗口初始化时创建
+        self.instance_model = InstanceListModel(
+            self.main_window.config_manager.instances,
+            getattr(self.main_window, 'resource_model', None),
+            self
+        )
         self._init_ui()
+        
+        # 行数变化时切换空状态提示
+        self.instance_model.rowsInserted.connect(self._update_empty_state)
+        self.instance_model.rowsRemoved.connect(self._update_empty_state)
+        self.instance_model.modelReset.connect(self._update_empty_state)
+        
+        # 删除结果陆续到达，合并后一次从仓库中移除
+        self._remove_deleted_timer = QTimer(self)
+        self._remove_deleted_timer.setSingleShot(True)
+        self._remove_deleted_timer.setInterval(200)
+        self._remove_deleted_timer.timeout.connect(self._remove_deleted_instances)
     
     def _init_ui(self):
         """初始化UI"""
@@ -69,8 +96,14 @@ class HomePage(QWidget):
         self.cancel_batch_btn.setVisible(False)
         self.cancel_batch_btn.clicked.connect(self.toggle_batch_mode)
         
+        # 取消尚未执行的删除任务（有删除任务时显示）
+        self.cancel_delete_btn = ModernButton("取消删除")
+        self.cancel_delete_btn.setVisible(False)
+        self.cancel_delete_btn.clicked.connect(self.cancel_pending_deletes)
+        
         top_bar.addWidget(page_title)
         top_bar.addStretch()
+        top_bar.addWidget(self.cancel_delete_btn)
         top_bar.addWidget(self.batch_btn)
         top_bar.addWidget(self.select_all_btn)
         top_bar.addWidget(self.confirm_delete_btn)
@@ -80,131 +113,95 @@ class HomePage(QWidget):
         
         home_layout.addLayout(top_bar)
         
-        # 浏览器网格区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                width: 8px;
-                background: transparent;
-            }
-            QScrollBar::handle:vertical {
-                background: #CCCCCC;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """)
-        
-        self.grid_widget = QWidget()
-        self.grid_widget.setStyleSheet("background-color: transparent;")
-        self.grid_layout = QGridLayout(self.grid_widget)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.grid_layout.setSpacing(16)
-        
-        scroll_area.setWidget(self.grid_widget)
-        home_layout.addWidget(scroll_area)
+        # 浏览器网格区域：QListView只绘制可见的卡片
+        self.grid_stack = QStackedWidget()
+        
+        empty_label = QLabel('暂无Chrome实例\n点击"添加新实例"创建')
+        empty_label.setFont(QFont(FONT_FAMILY, 14))
+        empty_label.setProperty("role", "empty-hint")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.grid_stack.addWidget(empty_label)
+        
+        self.grid_view = QListView()
+        self.grid_view.setObjectName("instanceGrid")
+        self.grid_view.setViewMode(QListView.ViewMode.IconMode)
+        self.grid_view.setMovement(QListView.Movement.Static)
+        self.grid_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.grid_view.setFlow(QListView.Flow.LeftToRight)
+        self.grid_view.setWrapping(True)
+        self.grid_view.setUniformItemSizes(True)
+        self.grid_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.grid_view.setBatchSize(200)
+        size = BrowserCardDelegate.CARD_SIZE
+        self.grid_view.setGridSize(QSize(size.width() + self.CARD_SPACING, size.height() + self.CARD_SPACING))
+        self.grid_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.grid_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.grid_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.grid_view.verticalScrollBar().setSingleStep(20)
+        self.grid_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.grid_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.grid_view.setModel(self.instance_model)
+        
+        self.card_delegate = BrowserCardDelegate(
+            self.grid_view, self.main_window.icon_cache, self.main_window.chrome_path
+        )
+        self.card_delegate.launch_requested.connect(self._on_launch_requested)
+        self.card_delegate.delete_requested.connect(self._on_delete_requested)
+        self.grid_view.setItemDelegate(self.card_delegate)
+        self.grid_stack.addWidget(self.grid_view)
+        
+        home_layout.addWidget(self.grid_stack)
     
     def update_browser_grid(self):
-        """更新浏览器网格"""
-        # 清除现有的网格项
-        for i in reversed(range(self.grid_layout.count())): 
-            self.grid_layout.itemAt(i).widget().setParent(None)
-        
-        # 清空卡片列表
-        self.card_widgets = []
-        
-        # 设置网格布局属性
-        self.grid_layout.setSpacing(16)  # 设置基础间距
-        self.grid_layout.setContentsMargins(30, 20, 30, 20)  # 调整外边距
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)  # 顶部水平居中对齐
-        
-        # 添加浏览器卡片
-        if not self.main_window.shortcuts:
-            empty_label = QLabel('暂无Chrome实例\n点击"添加新实例"创建')
-            empty_label.setFont(QFont(FONT_FAMILY, 14))
-            empty_label.setStyleSheet(f"color: {TEXT_HINT_COLOR};")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.grid_layout.addWidget(empty_label, 0, 0)
-            
-            # 更新批量删除按钮状态
-            self.batch_btn.setEnabled(False)
-            return
-        else:
-            # 有快捷方式时启用批量删除按钮
-            self.batch_btn.setEnabled(True)
-        
-        # 对实例列表按照后缀数字从小到大排序
-        sorted_shortcuts = sorted(self.main_window.shortcuts, key=self._extract_instance_number)
-        
-        # 卡片参数
-        card_width = 180  # 卡片宽度
-        card_spacing = 30  # 调整卡片间距
-        
-        # 根据窗口状态确定布局
-        if self.main_window.isMaximized():
-            # 最大化状态：动态计算列数，但确保间距合理
-            available_width = self.grid_widget.width() - 60  # 减去左右边距
-            max_cols = min(6, (available_width + card_spacing) // (card_width + card_spacing))
-        else:
-            # 默认大小状态：固定4列
-            max_cols = 4
-        
-        # 添加卡片到网格
-        for i, shortcut in enumerate(sorted_shortcuts):
-            row = i // max_cols
-            col = i % max_cols
-            card = BrowserCard(
-                shortcut["name"], 
-                shortcut["data_dir"], 
-                self.main_window.chrome_path,
-                on_delete=self.delete_shortcut
-            )
-            
-            # 设置选择模式状态
-            if self.is_batch_mode:
-                card.set_select_mode(True)
-                
-            self.grid_layout.addWidget(card, row, col)
-            self.card_widgets.append(card)
-        
-        # 设置水平和垂直间距
-        self.grid_layout.setHorizontalSpacing(card_spacing)  # 水平间距
-        self.grid_layout.setVerticalSpacing(card_spacing)  # 垂直间距
+        """
+        更新浏览器网格
+        
+        卡片由模型和视图维护，这里只同步Chrome路径和空状态；
+        列数由视图按宽度自动计算。
+        """
+        self.card_delegate.set_chrome_path(self.main_window.chrome_path)
+        self._update_empty_state()
+        self.grid_view.viewport().update()
     
-    def _extract_instance_number(self, shortcut):
-        """从实例名称中提取数字用于排序"""
-        name = shortcut["name"]
-        try:
-            # 提取"Chrome实例"后面的数字
-            if name.startswith("Chrome实例"):
-                return int(name[len("Chrome实例"):])
-            
-            # 如果不是以Chrome实例开头，尝试其他方式提取数字
-            # 从末尾开始寻找数字
-            digits = ""
-            for char in reversed(name):
-                if char.isdigit():
-                    digits = char + digits
-                elif digits:  # 如果已经找到了数字，且当前字符不是数字，则中断
-                    break
-            
-            if digits:
-                return int(digits)
-        except (ValueError, IndexError):
-            pass
-        
-        # 如果无法提取数字，返回一个大数作为默认值（放在最后）
-        return float('inf')
+    def _update_empty_state(self, *args):
+        """没有实例时显示提示并禁用批量删除"""
+        has_instances = self.instance_model.rowCount() > 0
+        self.grid_stack.setCurrentWidget(self.grid_view if has_instances else self.grid_stack.widget(0))
+        self.batch_btn.setEnabled(has_instances)
+    
+    def on_instance_states_changed(self, changes):
+        """
+        实例运行状态变化回调，只重绘状态发生变化的卡片
+        
+        Args:
+            changes: {规范化数据目录: 是否正在运行}
+        """
+        self.instance_model.set_running_states(changes)
+    
+    def on_resource_usage_changed(self, changes):
+        """
+        实例资源占用变化回调，只重绘占用发生变化的卡片
+        
+        Args:
+            changes: {规范化数据目录: 资源占用字典或None}
+        """
+        self.instance_model.update_usage(changes)
+    
+    def _on_launch_requested(self, name, data_dir):
+        """点击卡片上的启动按钮"""
+        if launch_browser(self, self.main_window.chrome_path, data_dir):
+            self._on_browser_launched(name, data_dir)
+    
+    def _on_delete_requested(self, name, data_dir):
+        """点击卡片上的删除按钮"""
+        if confirm_delete_instance(self, name):
+            self.delete_shortcut(name, data_dir)
+    
+    def _on_browser_launched(self, name, data_dir):
+        """浏览器启动后通知状态监视线程加快刷新"""
+        watcher = getattr(self.main_window, 'instance_watcher', None)
+        if watcher is not None:
+            watcher.notify_launch()
     
     def add_shortcut(self):
         """添加新快捷方式"""
@@ -221,79 +218,34 @@ class HomePage(QWidget):
                 self.main_window.statusBar().showMessage("名称和目录名不能为空！", 5000)
                 return
                 
-            if any(s["name"] == name for s in self.main_window.shortcuts):
+            if name in self.main_window.instances:
                 # 使用状态栏显示错误
                 self.main_window.statusBar().showMessage(f"名称 '{name}' 已存在！", 5000)
                 return
                 
             # 确保数据目录名称未被使用
-            if any(os.path.basename(s["data_dir"]) == dir_name for s in self.main_window.shortcuts):
+            # 确保数据目录名称未被使用
+            data_dir = os.path.join(self.main_window.data_root, dir_name)
+            if self.main_window.instances.by_data_dir(data_dir) is not None:
                 # 使用状态栏显示错误
                 self.main_window.statusBar().showMessage(f"数据目录名 '{dir_name}' 已存在！", 5000)
                 return
             
-            # 确保数据目录是绝对路径
-            data_dir = os.path.join(self.main_window.data_root, dir_name)
-            
-            shortcut = {
-                "name": name,
-                "data_dir": data_dir
-            }
-            
-            # 先添加到数据库
-            print(f"添加新实例到数据库: 名称={name}, 数据目录={data_dir}")
-            db_success = self.main_window.config_manager.db_manager.save_chrome_instance(shortcut)
-            print(f"数据库添加结果: {db_success}")
+            # 加入实例仓库，由写线程写入数据库，卡片随仓库的信号插入模型
+            print(f"添加新实例: 名称={name}, 数据目录={data_dir}")
+            self.main_window.instances.add({"name": name, "data_dir": data_dir})
+            self.main_window.auto_save_config()
             
-            if db_success:
-                self.main_window.shortcuts.append(shortcut)
-                
-                # 创建快捷方式
-                success = self.main_window.shortcut_manager.create_shortcut(name, data_dir, self.main_window.chrome_path)
-                if success:
-                    self.main_window.statusBar().showMessage(f"Chrome实例 '{name}' 创建成功", 3000)  # 显示3秒
-                    
-                    # 强制刷新实例列表 - 直接从数据库重新加载实例数据
-                    print("正在从数据库重新加载实例列表...")
-                    instances = self.main_window.config_manager.db_manager.get_all_chrome_instances()
-                    print(f"从数据库加载的实例数: {len(instances)}")
-                    self.main_window.shortcuts = instances
-                    
-                    # 更新界面和保存配置
-                    self.update_browser_grid()
-                    self.main_window.auto_save_config()
-                else:
-                    self.main_window.statusBar().showMessage(f"Chrome实例 '{name}' 创建失败", 3000)  # 显示3秒
+            # 创建快捷方式
+            success = self.main_window.shortcut_manager.create_shortcut(name, data_dir, self.main_window.chrome_path)
+            if success:
+                self.main_window.statusBar().showMessage(f"Chrome实例 '{name}' 创建成功", 3000)  # 显示3秒
+            else:
+                self.main_window.statusBar().showMessage(f"Chrome实例 '{name}' 创建失败", 3000)  # 显示3秒
     
     def _find_next_available_number(self):
-        """查找下一个可用的实例编号"""
-        used_numbers = set()
-        for shortcut in self.main_window.shortcuts:
-            # 从实例名称中提取编号
-            name = shortcut["name"]
-            if name.startswith("Chrome实例"):
-                try:
-                    num = int(name[len("Chrome实例"):])
-                    used_numbers.add(num)
-                except ValueError:
-                    pass
-            
-            # 从数据目录中提取编号
-            data_dir = shortcut["data_dir"]
-            dir_name = os.path.basename(data_dir)
-            if dir_name.startswith("Profile"):
-                try:
-                    num = int(dir_name[len("Profile"):])
-                    used_numbers.add(num)
-                except ValueError:
-                    pass
-                
-        # 找到可用的最小编号
-        next_number = 1
-        while next_number in used_numbers:
-            next_number += 1
-            
-        return next_number
+        """查找下一个可用的实例编号（按实例仓库的编号索引查询，与批量添加时的校验一致）"""
+        return self.main_window.instances.next_free_number()
     
     def batch_add_shortcuts(self):
         """批量添加快捷方式"""
@@ -308,93 +260,96 @@ class HomePage(QWidget):
                 self.main_window.statusBar().showMessage("输入错误，请检查数值设置", 5000)
                 return
                 
-            if count <= 0 or count > 50:
-                self.main_window.statusBar().showMessage("创建数量必须在1-50之间", 5000)
+            if count <= 0:
+                self.main_window.statusBar().showMessage("创建数量必须大于0", 5000)
                 return
             
-            # 先对页面做一次UI更新，告知用户操作已开始
-            self.main_window.statusBar().showMessage(f"开始创建 {count} 个实例，请稍候...", 3000)
-            self.main_window.setEnabled(False)  # 暂时禁用UI，避免用户点击其他按钮
-            QApplication.processEvents()  # 确保消息显示
-            
-            # 使用定时器处理批量创建，避免UI卡死
-            self.batch_create_index = 0
-            self.batch_create_count = count
-            self.batch_create_start_number = start_number
-            self.batch_create_prefix = prefix
-            self.batch_create_success_count = 0
-            self.batch_create_timer = QTimer()
-            self.batch_create_timer.timeout.connect(self._process_next_create)
-            self.batch_create_timer.start(100)  # 延迟100毫秒后开始处理
-    
-    def _process_next_create(self):
-        """处理下一个创建操作"""
-        if self.batch_create_index >= self.batch_create_count:
-            # 所有创建已完成
-            self.batch_create_timer.stop()
-            
-            # 终止操作后启用UI
-            self.main_window.setEnabled(True)
-            
-            # 通知用户已完成
-            self.main_window.statusBar().showMessage(f"成功创建 {self.batch_create_success_count} 个实例", 3000)
-            
-            # 强制刷新实例列表 - 直接从数据库重新加载实例数据
-            instances = self.main_window.config_manager.db_manager.get_all_chrome_instances()
-            self.main_window.shortcuts = instances
-            
-            # 更新UI
-            self.update_browser_grid()
+            if self.bulk_create_thread is not None or self.bulk_create_saving:
+                self.main_window.statusBar().showMessage("上一次批量创建尚未完成，请稍候", 5000)
+                return
             
-            # 保存配置
-            self.main_window.auto_save_config()
+            # 一次性校验整个编号范围，跳过名称或目录已存在的编号
+            instances, skipped = self._plan_batch_instances(start_number, count, prefix)
+            if not instances:
+                self.main_window.statusBar().showMessage(f"所选编号的 {skipped} 个实例均已存在", 5000)
+                return
             
+            # 所有记录由写线程在一个事务中写入数据库，写入成功后再创建文件
+            self.bulk_create_saving = True
+            self.main_window.config_manager.db_writer.submit(
+                lambda db: db.save_chrome_instances(instances),
+                callback=lambda saved: self._on_bulk_instances_saved(instances, skipped, saved)
+            )
+            self.main_window.statusBar().showMessage(f"正在保存 {len(instances)} 个实例...", 3000)
+    
+    def _on_bulk_instances_saved(self, instances, skipped, saved):
+        """批量创建的实例写入数据库后的回调"""
+        self.bulk_create_saving = False
+        if saved is None:
+            self.main_window.statusBar().showMessage("写入数据库失败，未创建任何实例", 5000)
             return
         
-        # 计算当前实例编号
-        current_number = self.batch_create_start_number + self.batch_create_index
-        
-        # 创建实例名称和数据目录名
-        name = f"{self.batch_create_prefix}{current_number}"
-        dir_name = f"Profile{current_number}"
-        
-        # 跳过已存在的实例
-        if any(s["name"] == name for s in self.main_window.shortcuts) or \
-           any(os.path.basename(s["data_dir"]) == dir_name for s in self.main_window.shortcuts):
-            self.batch_create_index += 1
-            self.batch_create_timer.start(50)  # 快速跳到下一个
-            return
-        
-        # 确保数据目录是绝对路径
-        data_dir = os.path.join(self.main_window.data_root, dir_name)
-        
-        shortcut = {
-            "name": name,
-            "data_dir": data_dir
-        }
+        # 已写入数据库的实例加入仓库，不再重复写入
+        self.main_window.instances.add_many(instances, persisted=True)
+        log_time(f"批量创建: {len(instances)}个实例已写入数据库, 跳过{skipped}个已存在的编号")
         
-        # 添加到数据库
-        db_success = self.main_window.config_manager.db_manager.save_chrome_instance(shortcut)
+        # 数据目录和快捷方式文件交给后台线程池创建
+        self.bulk_create_thread = BulkCreateThread(
+            instances, self.main_window.shortcuts_dir, self.main_window.chrome_path, self
+        )
+        self.bulk_create_thread.progress_changed.connect(self._on_bulk_create_progress)
+        self.bulk_create_thread.creation_finished.connect(self._on_bulk_create_finished)
+        self.bulk_create_thread.finished.connect(self.bulk_create_thread.deleteLater)
+        self.bulk_create_thread.start()
         
-        if db_success:
-            self.main_window.shortcuts.append(shortcut)
-            
-            # 创建快捷方式
-            success = self.main_window.shortcut_manager.create_shortcut(name, data_dir, self.main_window.chrome_path)
-            if success:
-                self.batch_create_success_count += 1
-        
-        # 增加索引，准备处理下一个
-        self.batch_create_index += 1
-        
-        # 更新状态栏
-        self.main_window.statusBar().showMessage(f"正在创建实例 {self.batch_create_index}/{self.batch_create_count}...", 1000)
-        
-        # 处理事件，确保UI响应
-        QApplication.processEvents()
-        
-        # 使用定时器继续下一个
-        self.batch_create_timer.start(200)
+        self.main_window.statusBar().showMessage(f"开始创建 {len(instances)} 个实例...", 3000)
+    
+    def _plan_batch_instances(self, start_number, count, prefix):
+        """
+        生成批量创建的实例列表
+        
+        Returns:
+            tuple: (待创建的实例字典列表, 跳过的编号数)
+        """
+        repository = self.main_window.instances
+        
+        instances = []
+        skipped = 0
+        for number in range(start_number, start_number + count):
+            name = f"{prefix}{number}"
+            data_dir = os.path.join(self.main_window.data_root, f"Profile{number}")
+            if name in repository or repository.by_data_dir(data_dir) is not None:
+                skipped += 1
+                continue
+            instances.append({
+                "name": name,
+                "data_dir": data_dir,
+                "instance_number": number
+            })
+        return instances, skipped
+    
+    def _on_bulk_create_progress(self, done, total, failed):
+        """批量创建进度回调"""
+        message = f"正在创建实例文件 {done}/{total}..."
+        if failed:
+            message += f"（{failed}个失败）"
+        self.main_window.statusBar().showMessage(message, 2000)
+    
+    def stop_bulk_create(self):
+        """取消正在进行的批量创建并等待线程退出"""
+        if self.bulk_create_thread is not None:
+            self.bulk_create_thread.cancel()
+            self.bulk_create_thread.wait()
+    
+    def _on_bulk_create_finished(self, succeeded, failed_names):
+        """批量创建完成回调"""
+        self.bulk_create_thread = None
+        if failed_names:
+            self.main_window.statusBar().showMessage(
+                f"成功创建 {succeeded} 个实例，{len(failed_names)} 个快捷方式创建失败: {', '.join(failed_names[:5])}", 5000
+            )
+        else:
+            self.main_window.statusBar().showMessage(f"成功创建 {succeeded} 个实例", 3000)
     
     def delete_shortcut(self, name, data_dir):
         """删除单个快捷方式"""
@@ -404,12 +359,12 @@ class HomePage(QWidget):
         data_dir = os.path.join(self.main_window.data_root, data_dir)
         log_time(f"数据目录路径: {data_dir}")
         
-        # 第一个确认对话框已经在cards.py中显示了，这里直接执行删除操作
+        # 确认对话框已经在_on_delete_requested中显示了，这里直接执行删除操作
         log_time("用户确认删除")
         
-        # 先保存配置，确保状态一致
-        log_time("保存配置确保状态一致")
-        self.main_window.auto_save_config()
+        if name in self._pending_deletes:
+            self.main_window.statusBar().showMessage(f"实例 {name} 正在删除中", 3000)
+            return True
         
         # 启动删除操作
         start_time = time.time()
@@ -419,14 +374,9 @@ class HomePage(QWidget):
         log_time(f"删除操作启动耗时: {elapsed:.4f}秒")
         
         if success:
-            # 从内存中移除快捷方式
-            log_time("从内存中移除快捷方式")
-            self.main_window.shortcuts = [s for s in self.main_window.shortcuts if s["name"] != name]
-            
-            # 更新UI
-            log_time("更新UI显示")
-            # 使用单次触发的计时器在下一个事件循环中更新UI
-            QTimer.singleShot(0, self.update_browser_grid)
+            # 数据目录移入回收站后才从仓库中移除，见on_instance_deleted
+            self._pending_deletes.add(name)
+            self._update_cancel_delete_button()
             
             # 显示成功消息
             self.main_window.statusBar().showMessage(f"实例 {name} 正在后台删除中...", 3000)
@@ -439,9 +389,11 @@ class HomePage(QWidget):
         return True
     
     def toggle_batch_mode(self):
-        """切换批量操作模式"""
+        """切换批量操作模式，批量模式下卡片可以通过视图的选择模型选中"""
         self.is_batch_mode = not self.is_batch_mode
         self.is_all_selected = False  # 重置全选状态
+        self.select_all_btn.setText("全选")
+        self.select_all_btn.set_selected(False)
         
         # 更新按钮状态
         self.batch_btn.setVisible(not self.is_batch_mode)
@@ -449,114 +401,125 @@ class HomePage(QWidget):
         self.confirm_delete_btn.setVisible(self.is_batch_mode)
         self.cancel_batch_btn.setVisible(self.is_batch_mode)
         
-        # 更新所有卡片的选择模式
-        for card in self.card_widgets:
-            card.set_select_mode(self.is_batch_mode)
-            if not self.is_batch_mode:
-                card.set_selected(False)  # 退出批量模式时取消所有选择
+        # 退出批量模式时取消所有选择
+        if not self.is_batch_mode:
+            self.grid_view.clearSelection()
+        self.grid_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.MultiSelection if self.is_batch_mode
+            else QAbstractItemView.SelectionMode.NoSelection
+        )
+        self.instance_model.set_batch_mode(self.is_batch_mode)
                 
     def toggle_select_all(self):
         """切换全选状态"""
         self.is_all_selected = not self.is_all_selected
         self.select_all_btn.setText("取消全选" if self.is_all_selected else "全选")
+        self.select_all_btn.set_selected(self.is_all_selected)
         
-        # 更新所有卡片的选中状态
-        for card in self.card_widgets:
-            card.set_selected(self.is_all_selected)
+        if self.is_all_selected:
+            self.grid_view.selectAll()
+        else:
+            self.grid_view.clearSelection()
     
     def delete_selected_shortcuts(self):
         """删除多个选中的实例"""
         log_time("开始批量删除操作")
         
-        # 收集选中的卡片
-        self.cards_to_delete = []
-        for card in self.card_widgets:
-            if card.is_selected:
-                self.cards_to_delete.append(card)
+        # 从选择模型收集选中的实例
+        records = [
+            self.instance_model.record_at(index.row())
+            for index in self.grid_view.selectionModel().selectedIndexes()
+        ]
+        # 已经在删除中的实例不再重复提交
+        records = [record for record in records if record.name not in self._pending_deletes]
         
-        if not self.cards_to_delete:
+        if not records:
             log_time("没有选中实例")
             self.main_window.statusBar().showMessage("请先选择要删除的实例", 3000)
             return
         
+        # 一次性检测所有选中实例是否正在运行，跳过正在运行的实例
+        detector = ProfileUsageDetector(process_max_age=self.BATCH_PROCESS_MAX_AGE)
+        in_use = detector.find_in_use([record.data_dir for record in records])
+        if in_use:
+            skipped_names = [record.name for record in records if record.data_dir in in_use]
+            records = [record for record in records if record.data_dir not in in_use]
+            log_time(f"跳过正在运行的实例: {skipped_names}")
+            self.main_window.statusBar().showMessage(
+                f"{len(skipped_names)} 个实例正在运行，已跳过: {', '.join(skipped_names[:5])}", 5000
+            )
+            if not records:
+                return
+        
         # 记录数量
-        count = len(self.cards_to_delete)
+        count = len(records)
         log_time(f"选中了 {count} 个实例待删除")
         
         # 退出批量模式
         self.toggle_batch_mode()
         
-        # 启动定时器处理删除
-        self.delete_index = 0
-        self.delete_count = 0
+        # 全部提交到共享删除服务，由它的工作线程池按磁盘速度处理
+        items = [(record.name, record.data_dir) for record in records]
+        success = self.main_window.shortcut_manager.delete_shortcuts(
+            items, process_max_age=self.BATCH_PROCESS_MAX_AGE
+        )
+        if not success:
+            log_time("批量删除提交失败")
+            return
         
-        # 先对页面做一次UI更新，告知用户操作已开始
-        self.main_window.statusBar().showMessage(f"开始删除 {count} 个实例，请稍候...", 3000)
-        self.main_window.setEnabled(False)  # 暂时禁用UI，避免用户点击其他按钮
-        QApplication.processEvents()  # 确保消息显示
+        # 实例在数据目录移入回收站后逐个从仓库中移除，失败或被取消的实例保留
+        self._pending_deletes.update(name for name, _ in items)
+        self._batch_delete_pending = True
+        self._update_cancel_delete_button()
         
-        # 使用定时器延迟执行，让UI有时间更新
-        self.delete_timer = QTimer()
-        self.delete_timer.setSingleShot(True)
-        self.delete_timer.timeout.connect(self._process_next_delete)
-        self.delete_timer.start(100)  # 延迟100毫秒后开始处理
+        self.main_window.statusBar().showMessage(f"开始删除 {count} 个实例...", 3000)
+    
+    def on_instance_deleted(self, name, success, error_msg):
+        """
+        删除服务处理完一个实例的回调
 
-    def _process_next_delete(self):
-        """处理下一个删除操作"""
-        if self.delete_index >= len(self.cards_to_delete):
-            # 所有删除已完成
-            self.delete_timer.stop()
-            
-            # 终止操作后启用UI
-            self.main_window.setEnabled(True)
-            
-            # 通知用户已完成
-            self.main_window.statusBar().showMessage(f"成功删除 {self.delete_count} 个实例", 3000)
-            
-            # 最后，确保所有的更改都被保存到数据库中
-            # 这一步很重要，因为之前的delete_shortcut操作可能没有正确更新内存中的实例列表
-            # 使用定时器，确保所有UI事件都被处理
-            QTimer.singleShot(800, self._sync_after_batch_delete)
-            
+        只有数据目录已移入回收站（或已删除）的实例才从仓库中移除；删除失败或被取消的
+        实例连同快捷方式和账号信息一起保留，卡片也留在主页上。
+        """
+        if name not in self._pending_deletes:
             return
-        
-        # 获取当前卡片
-        card = self.cards_to_delete[self.delete_index]
-        name = card.name
-        data_dir = card.data_dir
-        log_time(f"批量删除第 {self.delete_index+1}/{len(self.cards_to_delete)} 个: {name}")
-        
-        # 启动删除操作
-        start_time = time.time()
-        success = self.main_window.shortcut_manager.delete_shortcut(name, data_dir)
-        elapsed = time.time() - start_time
-        log_time(f"删除操作启动耗时: {elapsed:.4f}秒")
-        
+        self._pending_deletes.discard(name)
         if success:
-            # 从内存中移除快捷方式
-            log_time(f"从内存中移除快捷方式: {name}")
-            self.main_window.shortcuts = [s for s in self.main_window.shortcuts if s["name"] != name]
-            self.delete_count += 1
-            
-            # 直接更新UI，移除当前卡片的显示
-            card.setVisible(False)
-            card.deleteLater()
-            QApplication.processEvents()
-        else:
-            log_time(f"删除 {name} 失败")
-            
-        # 增加索引，准备处理下一个
-        self.delete_index += 1
-        
-        # 在处理下一个前保存配置
-        if self.delete_index < len(self.cards_to_delete):
-            # 先更新UI显示
-            QApplication.processEvents()
-            # 使用较短的延时继续下一个
-            self.delete_timer.start(200)
-        else:
-            # 这是最后一个，使用较长的延时让最后一个删除有时间处理
-            self.delete_timer.start(500)
+            self._deleted_names.append(name)
+            self._remove_deleted_timer.start()
+        self._update_cancel_delete_button()
+    
+    def _remove_deleted_instances(self):
+        """把已删除的实例一次从仓库中移除并保存，卡片随仓库的信号从模型中移除"""
+        names, self._deleted_names = self._deleted_names, []
+        if not names:
+            return
+        self.main_window.instances.remove_many(names)
+        self.main_window.auto_save_config()
+    
+    def cancel_pending_deletes(self):
+        """取消尚未执行的删除任务，被取消的实例保持原样"""
+        service = getattr(self.main_window, 'deletion_service', None)
+        if service is None:
+            return
+        log_time("用户取消删除")
+        service.cancel_all()
+        self.main_window.statusBar().showMessage("已取消尚未开始的删除任务", 3000)
+    
+    def _update_cancel_delete_button(self):
+        """有实例等待删除时显示取消按钮"""
+        self.cancel_delete_btn.setVisible(bool(self._pending_deletes))
+    
+    def on_deletion_batch_finished(self, succeeded, failed, bytes_freed):
+        """删除服务完成一批删除后的回调"""
+        # 先移除已删除的实例，再保存
+        self._remove_deleted_timer.stop()
+        self._remove_deleted_instances()
+        if not self._batch_delete_pending:
+            return
+        self._batch_delete_pending = False
+        # 与文件系统同步后保存，失败的实例保留了快捷方式，仍在仓库中
+        QTimer.singleShot(0, self._sync_after_batch_delete)
     
     def _sync_after_batch_delete(self):
         """批量删除完成后同步内存与文件系统，确保数据一致性"""
@@ -567,12 +530,9 @@ class HomePage(QWidget):
             if hasattr(self.main_window, '_sync_shortcuts_with_filesystem'):
                 self.main_window._sync_shortcuts_with_filesystem()
             
-            # 强制保存当前内存中的实例列表到数据库
+            # 强制保存当前内存中的实例列表到数据库，界面已随仓库的信号更新
             self.main_window.auto_save_config()
             
-            # 重新加载并更新UI
-            self.update_browser_grid()
-            
             log_time("批量删除后的数据同步完成")
         except Exception as e:
             log_time(f"批量删除后同步数据时出错: {str(e)}") 
\ No newline at end of file
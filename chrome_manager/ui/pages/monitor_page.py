@@ -0,0 +1,102 @@
+"""
+资源监控页面模块，按实例显示Chrome进程树的资源占用
+"""
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QSortFilterProxyModel
+from PyQt6.QtGui import QFont
+
+from ...constants import FONT_FAMILY
+from ...resource_monitor import InstanceResourceModel, format_bytes
+
+class MonitorPage(QWidget):
+    """资源监控页面类"""
+
+    def __init__(self, parent=None, resource_model=None):
+        """
+        初始化资源监控页面
+
+        Args:
+            parent: 主窗口
+            resource_model: 共享的实例资源模型
+        """
+        super().__init__(parent)
+        self.main_window = parent
+        self.resource_model = resource_model
+        self._init_ui()
+
+        # 实例增删后刷新名称映射（切换到本页时也会刷新）
+        instances = self.main_window.config_manager.instances
+        for signal in (instances.instances_added, instances.instances_removed,
+                       instances.instances_changed, instances.instances_reset):
+            signal.connect(self._on_instances_modified)
+
+    def _init_ui(self):
+        """初始化UI"""
+        monitor_layout = QVBoxLayout(self)
+        monitor_layout.setContentsMargins(32, 24, 32, 24)
+        monitor_layout.setSpacing(16)
+
+        # 顶部标题
+        page_title = QLabel("资源监控")
+        page_title.setFont(QFont(FONT_FAMILY, 24, QFont.Weight.Bold))
+        monitor_layout.addWidget(page_title)
+
+        # 说明文字
+        description = QLabel("查看每个运行中实例（含渲染、GPU等子进程）的内存、CPU和线程占用，点击表头排序")
+        description.setProperty("role", "page-description")
+        description.setWordWrap(True)
+        monitor_layout.addWidget(description)
+
+        # 汇总信息
+        self.summary_label = QLabel("暂无运行中的实例")
+        self.summary_label.setProperty("role", "summary")
+        monitor_layout.addWidget(self.summary_label)
+
+        # 资源表格，使用排序代理按原始数值排序
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.resource_model)
+        self.proxy_model.setSortRole(InstanceResourceModel.SORT_ROLE)
+
+        self.table_view = QTableView()
+        self.table_view.setObjectName("resourceTable")
+        self.table_view.setModel(self.proxy_model)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(2, Qt.SortOrder.DescendingOrder)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        monitor_layout.addWidget(self.table_view)
+
+        self.resource_model.modelReset.connect(self._update_summary)
+        self.resource_model.dataChanged.connect(self._update_summary)
+
+    def update_page(self):
+        """刷新实例名称映射"""
+        names = {record.data_dir_key: record.name for record in self.main_window.instances}
+        self.resource_model.set_instance_names(names)
+        self._update_summary()
+
+    def _on_instances_modified(self, *args):
+        """实例增删时，页面可见则刷新名称映射"""
+        if self.isVisible():
+            self.update_page()
+
+    def _update_summary(self, *args):
+        """更新汇总信息"""
+        count = self.resource_model.rowCount()
+        if not count:
+            self.summary_label.setText("暂无运行中的实例")
+            return
+
+        total_rss = 0
+        total_cpu = 0.0
+        for row in range(count):
+            total_rss += self.resource_model.index(row, 2).data(InstanceResourceModel.SORT_ROLE)
+            total_cpu += self.resource_model.index(row, 4).data(InstanceResourceModel.SORT_ROLE)
+        self.summary_label.setText(
+            f"运行中实例: {count}    总内存: {format_bytes(total_rss)}    总CPU: {total_cpu:.1f}%"
+        )
@@ -5,7 +5,7 @@
 import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QFileDialog, QScrollArea
+    QFileDialog, QScrollArea, QComboBox
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
@@ -14,6 +14,8 @@ from ...constants import (
     TEXT_PRIMARY_COLOR, TEXT_SECONDARY_COLOR, TEXT_HINT_COLOR, FONT_FAMILY
 )
 from ..components import ModernButton, ModernLineEdit
+from ...backup_service import list_snapshots, DEFAULT_KEEP, DEFAULT_INTERVAL
+from ...resource_monitor import format_bytes
 
 class SettingsPage(QWidget):
     """设置页面类"""
@@ -127,6 +129,40 @@ class SettingsPage(QWidget):
         # 添加分隔线
         settings_layout.addWidget(self._create_separator())
         
+        # 数据备份部分
+        backup_section_label = QLabel("数据备份")
+        backup_section_label.setStyleSheet(f"color: {TEXT_PRIMARY_COLOR}; font-size: 16px;")
+        backup_section_label.setFont(QFont(FONT_FAMILY, 12, QFont.Weight.Bold))
+        settings_layout.addWidget(backup_section_label)
+        
+        backup_layout = QHBoxLayout()
+        self.backup_combo = QComboBox()
+        self.backup_combo.setMinimumWidth(260)
+        backup_layout.addWidget(self.backup_combo, 1)
+        
+        self.backup_now_btn = ModernButton("立即备份")
+        self.backup_now_btn.clicked.connect(self.backup_now)
+        backup_layout.addWidget(self.backup_now_btn)
+        
+        self.restore_btn = ModernButton("恢复所选备份")
+        self.restore_btn.clicked.connect(self.restore_backup)
+        backup_layout.addWidget(self.restore_btn)
+        settings_layout.addLayout(backup_layout)
+        
+        backup_desc = QLabel(
+            f"程序每{DEFAULT_INTERVAL // 3600}小时在后台备份一次实例和账号数据，"
+            f"保留最近的{DEFAULT_KEEP}个备份；恢复前会先备份当前数据"
+        )
+        backup_desc.setStyleSheet(f"color: {TEXT_SECONDARY_COLOR}; font-size: 12px;")
+        settings_layout.addWidget(backup_desc)
+        
+        backup_service = self.main_window.config_manager.backup_service
+        backup_service.backup_finished.connect(self._on_backup_finished)
+        self.refresh_backups()
+        
+        # 添加分隔线
+        settings_layout.addWidget(self._create_separator())
+        
         # 添加更新部分标题
         update_section_label = QLabel("软件更新")
         update_section_label.setStyleSheet(f"color: {TEXT_PRIMARY_COLOR}; font-size: 16px;")
@@ -158,6 +194,58 @@ class SettingsPage(QWidget):
         self.chrome_path_edit.setText(self.main_window.chrome_path)
         self.data_root_edit.setText(self.main_window.data_root)
         self.shortcuts_dir_edit.setText(self.main_window.shortcuts_dir)
+        self.refresh_backups()
+    
+    def refresh_backups(self):
+        """刷新备份列表"""
+        self.backup_combo.clear()
+        for snapshot in list_snapshots(self.main_window.config_manager.config_dir):
+            label = f"{snapshot['time']:%Y-%m-%d %H:%M:%S}  ({format_bytes(snapshot['size'])})"
+            self.backup_combo.addItem(label, snapshot["path"])
+        self.restore_btn.setEnabled(self.backup_combo.count() > 0)
+    
+    def backup_now(self):
+        """先保存当前修改，再请求后台立即备份"""
+        self.main_window.auto_save_config()
+        self.backup_now_btn.setEnabled(False)
+        self.main_window.config_manager.backup_service.backup_now()
+        self.main_window.statusBar().showMessage("正在备份...", 3000)
+    
+    def _on_backup_finished(self, result):
+        """备份完成"""
+        self.backup_now_btn.setEnabled(True)
+        self.refresh_backups()
+        self.main_window.statusBar().showMessage(f"数据备份: {result['message']}", 5000)
+    
+    def restore_backup(self):
+        """从所选备份恢复实例和账号数据"""
+        path = self.backup_combo.currentData()
+        if not path:
+            return
+        if not self.main_window.message_dialogs.show_confirm_dialog(
+            f"确定要恢复到 {self.backup_combo.currentText()} 的备份吗？\n当前数据会先备份，之后可以再恢复回来。",
+            "恢复备份"
+        ):
+            return
+        
+        # 恢复完成并重新加载前暂停自动保存，避免内存中的旧数据覆盖恢复的数据
+        self.main_window.auto_save_timer.stop()
+        self.restore_btn.setEnabled(False)
+        self.main_window.config_manager.restore_backup(path, self._on_restore_finished)
+        self.main_window.statusBar().showMessage("正在恢复备份...")
+    
+    def _on_restore_finished(self, result):
+        """恢复完成后重新加载配置"""
+        if result["ok"]:
+            self.main_window.load_config()
+            self.main_window.update_ui()
+        self.main_window.auto_save_timer.start()
+        self.refresh_backups()
+        
+        if result["ok"]:
+            self.main_window.statusBar().showMessage("已从备份恢复", 5000)
+        else:
+            self.main_window.message_dialogs.show_error_message(result["message"], "恢复备份")
     
     def browse_chrome(self):
         """浏览选择Chrome可执行文件"""
@@ -206,7 +294,11 @@ class SettingsPage(QWidget):
             self.main_window.chrome_path = chrome_path
             self.main_window.data_root = data_root
             self.main_window.user_modified_data_root = True
-            
+
+            # 新的数据根目录下可能有未回收完的墓碑
+            if hasattr(self.main_window, 'deletion_service') and os.path.isdir(data_root):
+                self.main_window.deletion_service.scan_trash(data_root)
+
             # 设置快捷方式保存路径
             if shortcuts_dir and os.path.exists(shortcuts_dir):
                 self.main_window.shortcuts_dir = shortcuts_dir
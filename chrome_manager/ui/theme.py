@@ -0,0 +1,359 @@
+"""
+主题模块，由constants中的颜色生成整个应用共用的样式表
+"""
+
+from functools import lru_cache
+
+from ..constants import (
+    PRIMARY_COLOR, DANGER_COLOR, BACKGROUND_COLOR, SURFACE_COLOR, BORDER_COLOR,
+    TEXT_PRIMARY_COLOR, TEXT_SECONDARY_COLOR, TEXT_HINT_COLOR
+)
+
+PRIMARY_HOVER_COLOR = "#1C75E5"
+PRIMARY_PRESSED_COLOR = "#1567D3"
+
+
+def rgba(color, alpha):
+    """
+    把#RRGGBB颜色转换为带透明度的rgba()
+
+    Qt样式表把8位十六进制颜色解释为#AARRGGBB，不能直接在颜色后追加透明度。
+    """
+    red, green, blue = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({red}, {green}, {blue}, {alpha})"
+
+
+# 滚动条样式，被多个滚动视图共用
+_SCROLLBAR = """
+    {view} QScrollBar:vertical {{
+        width: 8px;
+        background: transparent;
+        margin: 0px;
+    }}
+    {view} QScrollBar::handle:vertical {{
+        background: #CCCCCC;
+        border-radius: 4px;
+        min-height: 20px;
+    }}
+    {view} QScrollBar::handle:vertical:hover {{
+        background: #AAAAAA;
+    }}
+    {view} QScrollBar::add-line:vertical, {view} QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    {view} QScrollBar::add-page:vertical, {view} QScrollBar::sub-page:vertical {{
+        background: transparent;
+    }}
+"""
+
+
+@lru_cache(maxsize=1)
+def build_stylesheet():
+    """
+    生成应用样式表
+
+    控件不再各自调用setStyleSheet，而是通过类名、objectName和动态属性匹配规则：
+        ModernButton[accent="true"]      强调按钮
+        ModernButton[danger="true"]      危险操作按钮
+        ModernButton[selected="true"]    处于选中状态的按钮
+        ModernButton[variant="close"]    对话框标题栏的关闭按钮
+        QLabel[role="..."]               对话框和页面中的各类文字
+        QMessageBox[variant="..."]       消息框和删除确认框
+
+    Returns:
+        str: 样式表
+    """
+    return f"""
+    /* 输入框 */
+    ModernLineEdit {{
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 6px;
+        padding: 8px 12px;
+        background-color: {BACKGROUND_COLOR};
+        color: {TEXT_PRIMARY_COLOR};
+        selection-background-color: {rgba(PRIMARY_COLOR, 0.25)};
+    }}
+    ModernLineEdit:focus {{
+        border: 1.5px solid {PRIMARY_COLOR};
+    }}
+    ModernLineEdit:hover:!focus {{
+        border: 1px solid #B0B0B0;
+    }}
+    ModernLineEdit:disabled {{
+        background-color: {SURFACE_COLOR};
+        color: {TEXT_HINT_COLOR};
+    }}
+
+    /* 按钮 */
+    ModernButton {{
+        background-color: {SURFACE_COLOR};
+        color: {TEXT_PRIMARY_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+    }}
+    ModernButton:hover {{
+        background-color: #EAECEF;
+    }}
+    ModernButton:pressed {{
+        background-color: #DEE2E6;
+    }}
+    ModernButton:disabled {{
+        background-color: {SURFACE_COLOR};
+        color: {TEXT_HINT_COLOR};
+    }}
+    ModernButton[selected="true"] {{
+        background-color: {rgba(PRIMARY_COLOR, 0.08)};
+        border: 1px solid {PRIMARY_COLOR};
+        color: {PRIMARY_COLOR};
+    }}
+    ModernButton[accent="true"] {{
+        background-color: {PRIMARY_COLOR};
+        color: white;
+        border: none;
+    }}
+    ModernButton[accent="true"]:hover {{
+        background-color: {PRIMARY_HOVER_COLOR};
+    }}
+    ModernButton[accent="true"]:pressed {{
+        background-color: {PRIMARY_PRESSED_COLOR};
+    }}
+    ModernButton[danger="true"] {{
+        background-color: {DANGER_COLOR};
+        color: white;
+        border: none;
+    }}
+    ModernButton[danger="true"]:hover {{
+        background-color: #E53935;
+    }}
+    ModernButton[danger="true"]:pressed {{
+        background-color: #D32F2F;
+    }}
+    ModernButton[accent="true"]:disabled, ModernButton[danger="true"]:disabled {{
+        background-color: {SURFACE_COLOR};
+        color: {TEXT_HINT_COLOR};
+    }}
+    ModernButton[variant="close"] {{
+        background-color: transparent;
+        border: none;
+        border-radius: 15px;
+        padding: 0px;
+        color: {TEXT_SECONDARY_COLOR};
+        font-size: 16pt;
+        font-weight: bold;
+    }}
+    ModernButton[variant="close"]:hover {{
+        background-color: rgba(0, 0, 0, 0.05);
+        color: {TEXT_PRIMARY_COLOR};
+    }}
+    ModernButton[variant="close"]:pressed {{
+        background-color: rgba(0, 0, 0, 0.1);
+    }}
+
+    /* 对话框 */
+    ModernDialog {{
+        background-color: {BACKGROUND_COLOR};
+        border: 1px solid {BORDER_COLOR};
+    }}
+    QLabel[role="dialog-title"] {{
+        color: {TEXT_PRIMARY_COLOR};
+        font-weight: bold;
+        font-size: 12pt;
+    }}
+    QLabel[role="dialog-title-large"] {{
+        color: {TEXT_PRIMARY_COLOR};
+        font-weight: bold;
+        font-size: 16pt;
+    }}
+    QLabel[role="field-label"] {{
+        color: {TEXT_SECONDARY_COLOR};
+    }}
+    QLabel[role="help"] {{
+        color: {TEXT_SECONDARY_COLOR};
+        font-size: 9pt;
+    }}
+
+    /* 消息框 */
+    QMessageBox[variant="message"] {{
+        background-color: {BACKGROUND_COLOR};
+    }}
+    QMessageBox[variant="message"] QLabel {{
+        color: {TEXT_PRIMARY_COLOR};
+    }}
+    QMessageBox[variant="message"] QPushButton {{
+        background-color: {PRIMARY_COLOR};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        min-width: 80px;
+        min-height: 30px;
+    }}
+    QMessageBox[variant="message"] QPushButton:hover {{
+        background-color: {PRIMARY_HOVER_COLOR};
+    }}
+    QMessageBox[variant="message"] QPushButton:pressed {{
+        background-color: {PRIMARY_PRESSED_COLOR};
+    }}
+
+    /* 删除确认框 */
+    QMessageBox[variant="confirm-delete"] {{
+        background-color: white;
+        border-radius: 8px;
+    }}
+    QMessageBox[variant="confirm-delete"] QLabel {{
+        color: #1F1F1F;
+        font-size: 14px;
+        padding: 10px;
+    }}
+    QMessageBox[variant="confirm-delete"] QLabel#qt_msgbox_label {{
+        font-weight: 500;
+        font-size: 15px;
+        padding-bottom: 0px;
+    }}
+    QMessageBox[variant="confirm-delete"] QLabel#qt_msgbox_informativelabel {{
+        color: {TEXT_SECONDARY_COLOR};
+        font-size: 13px;
+        padding-top: 0px;
+    }}
+    QMessageBox[variant="confirm-delete"] QLabel#qt_msgboxex_icon_label {{
+        padding: 15px;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton {{
+        background-color: #F5F5F5;
+        color: {TEXT_PRIMARY_COLOR};
+        border: none;
+        border-radius: 6px;
+        padding: 8px 24px;
+        min-width: 90px;
+        font-size: 13px;
+        font-weight: 500;
+        margin: 0px 5px;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton:hover {{
+        background-color: #EEEEEE;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton:pressed {{
+        background-color: {BORDER_COLOR};
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton[text="删除"] {{
+        background-color: #FF4D4F;
+        color: white;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton[text="删除"]:hover {{
+        background-color: #FF7875;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton[text="删除"]:pressed {{
+        background-color: #D9363E;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton[text="取消"] {{
+        background-color: white;
+        border: 1px solid #D9D9D9;
+    }}
+    QMessageBox[variant="confirm-delete"] QPushButton[text="取消"]:hover {{
+        background-color: #FAFAFA;
+        border-color: #40A9FF;
+        color: #40A9FF;
+    }}
+
+    /* 页面文字 */
+    QLabel[role="page-description"] {{
+        color: {TEXT_SECONDARY_COLOR};
+        font-size: 14px;
+        margin-bottom: 8px;
+    }}
+    QLabel[role="empty-hint"] {{
+        color: {TEXT_HINT_COLOR};
+    }}
+    QLabel[role="summary"] {{
+        color: {TEXT_SECONDARY_COLOR};
+        font-size: 13px;
+    }}
+
+    /* 主页实例网格 */
+    QListView#instanceGrid {{
+        border: none;
+        background-color: transparent;
+    }}
+    {_SCROLLBAR.format(view="QListView#instanceGrid")}
+
+    /* 账号管理表格 */
+    QLabel#accountPlaceholder {{
+        color: #505050;
+        font-size: 15px;
+        margin: 40px 20px;
+        padding: 20px;
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        border: 1px dashed #cccccc;
+    }}
+    QTableView#accountTable {{
+        background-color: white;
+        alternate-background-color: #f8f9fa;
+        border: none;
+        border-radius: 8px;
+        gridline-color: #eeeeee;
+        color: {TEXT_PRIMARY_COLOR};
+        font-size: 13px;
+        selection-background-color: #E8F0FE;
+        selection-color: #1a73e8;
+    }}
+    QTableView#accountTable::item {{
+        padding: 0 8px;
+    }}
+    QTableView#accountTable QHeaderView::section {{
+        background-color: white;
+        color: #555555;
+        font-weight: 500;
+        font-size: 13px;
+        border: none;
+        border-bottom: 1px solid #dadce0;
+        padding: 8px;
+    }}
+    QTableView#accountTable QLineEdit {{
+        border: none;
+        border-bottom: 2px solid #1a73e8;
+        padding: 0 6px;
+    }}
+    {_SCROLLBAR.format(view="QTableView#accountTable")}
+
+    /* 资源监控表格 */
+    QTableView#resourceTable {{
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 8px;
+        gridline-color: #F0F0F0;
+    }}
+    QTableView#resourceTable QHeaderView::section {{
+        background-color: #F8F9FA;
+        border: none;
+        border-bottom: 1px solid #E0E0E0;
+        padding: 6px;
+        font-weight: 500;
+    }}
+    """
+
+
+def apply_theme(app):
+    """把应用样式表设置到QApplication上，应在创建任何窗口之前调用"""
+    app.setStyleSheet(build_stylesheet())
+
+
+def set_style_property(widget, name, value):
+    """
+    修改控件的样式属性并重新匹配样式规则，用于在运行时切换状态（如选中）
+
+    只重新polish这一个控件，polish会先清除该控件缓存的规则，不需要再unpolish。
+    每次切换都要用整个应用样式表重新匹配规则，耗时与逐控件调用setStyleSheet相当，
+    不适合对大量控件频繁切换；值未改变时直接返回。
+
+    Args:
+        widget: 控件
+        name: 属性名，如"selected"
+        value: 属性值
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().polish(widget)
@@ -12,6 +12,7 @@ from PyQt6.QtCore import Qt
 
 from chrome_manager.main_window import ChromeShortcutManager
 from chrome_manager.utils import apply_font_to_app, check_os_compatibility
+from chrome_manager.ui.theme import apply_theme
 import chrome_manager.constants as constants
 
 def main():
@@ -35,6 +36,9 @@ def main():
         # 应用全局字体
         apply_font_to_app(app)
         
+        # 应用全局样式表，控件通过类名、objectName和动态属性匹配样式
+        apply_theme(app)
+        
         # 添加调试信息
         print(f"Python版本: {sys.version}")
         try: